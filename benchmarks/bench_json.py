@@ -0,0 +1,93 @@
+"""Compares JSON codecs on typical 100-task pages.
+
+Run from the repository root with: python -m benchmarks.bench_json
+"""
+
+import timeit
+
+from clickupython import codec
+
+
+def task(i: int) -> dict:
+    user = {
+        "id": 1000 + i,
+        "username": f"user {i}",
+        "color": "#7b68ee",
+        "email": f"user{i}@example.com",
+        "profilePicture": None,
+        "initials": "U",
+    }
+    return {
+        "id": f"86a{i:05d}",
+        "custom_id": None,
+        "name": f"Task {i}",
+        "text_content": "Lorem ipsum dolor sit amet " * 8,
+        "description": "Lorem ipsum dolor sit amet " * 8,
+        "status": {
+            "id": "p1_abc",
+            "status": "in progress",
+            "color": "#4194f6",
+            "orderindex": 1,
+            "type": "custom",
+        },
+        "orderindex": "1.0000",
+        "date_created": "1700000000000",
+        "date_updated": "1700000500000",
+        "date_closed": None,
+        "creator": user,
+        "assignees": [user, {**user, "id": 2000 + i}],
+        "checklists": [],
+        "tags": [{"name": "backend", "tag_fg": "#fff", "tag_bg": "#000"}],
+        "parent": None,
+        "priority": {"id": "2", "priority": "high", "color": "#ffcc00"},
+        "due_date": "1700100000000",
+        "start_date": None,
+        "time_estimate": None,
+        "time_spent": None,
+        "custom_fields": [
+            {
+                "id": f"cf{n}",
+                "name": f"Field {n}",
+                "type": "drop_down",
+                "type_config": {
+                    "options": [
+                        {"id": f"o{k}", "name": f"Option {k}", "orderindex": k}
+                        for k in range(5)
+                    ]
+                },
+                "value": 2,
+            }
+            for n in range(4)
+        ],
+        "list": {"id": "900100", "name": "Backlog", "access": True},
+        "folder": {"id": "900200", "name": "Engineering", "hidden": False},
+        "space": {"id": "900300"},
+        "url": f"https://app.clickup.com/t/86a{i:05d}",
+    }
+
+
+def main() -> None:
+    page = {"tasks": [task(i) for i in range(100)], "last_page": False}
+    codecs = [codec.JSONCodec()]
+    if codec.orjson is not None:
+        codecs.append(codec.OrjsonCodec())
+
+    body = codec.JSONCodec().dumps(page)
+    print(f"page size: {len(body) / 1024:.0f} KiB, 100 tasks")
+    baseline = {}
+    for candidate in codecs:
+        for operation, run in (
+            ("decode", lambda: candidate.loads(body)),
+            ("encode", lambda: candidate.dumps(page)),
+        ):
+            number = 200
+            seconds = min(timeit.repeat(run, number=number, repeat=5)) / number
+            baseline.setdefault(operation, seconds)
+            print(
+                f"{candidate.name:>7} {operation}: {seconds * 1e3:7.3f} ms/page"
+                f"  ({baseline[operation] / seconds:4.1f}x)"
+            )
+
+
+if __name__ == "__main__":
+    main()
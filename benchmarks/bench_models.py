@@ -0,0 +1,101 @@
+"""Compares validating list responses item by item against one TypeAdapter call, and
+times models.construct and models.validate_or_construct, used by validate=False and
+strict=False.
+
+Run from the repository root with: python -m benchmarks.bench_models
+"""
+
+import timeit
+
+from clickupython import models
+from benchmarks.bench_json import task
+
+
+def valid_task(i: int) -> dict:
+    # TypeConfig and Option declare every key as required
+    type_config = {
+        "default": 0,
+        "placeholder": None,
+        "new_drop_down": True,
+        "options": [
+            {"id": f"o{k}", "name": f"Option {k}", "color": None, "order_index": k}
+            for k in range(5)
+        ],
+        "include_guests": None,
+        "include_team_members": None,
+    }
+    body = task(i)
+    for field in body["custom_fields"]:
+        field["type_config"] = type_config
+    return body
+
+
+def comment(i: int) -> dict:
+    user = {"id": 1000 + i, "username": f"user {i}", "color": "#7b68ee"}
+    return {
+        "id": str(i),
+        "comment": [{"text": "Lorem ipsum dolor sit amet"}],
+        "comment_text": "Lorem ipsum dolor sit amet",
+        "user": {**user, "profilePicture": None},
+        "resolved": False,
+        "reactions": [],
+        "date": "1700000000000",
+    }
+
+
+def main() -> None:
+    for list_model, item_model, key, build in (
+        (models.Tasks, models.Task, "tasks", valid_task),
+        (models.Comments, models.Comment, "comments", comment),
+    ):
+        for size in (100, 10_000):
+            items = [build(i) for i in range(size)]
+            number = max(1, 2000 // size)
+            per_item = (
+                min(
+                    timeit.repeat(
+                        lambda: [item_model(**item) for item in items],
+                        number=number,
+                        repeat=5,
+                    )
+                )
+                / number
+            )
+            batched = (
+                min(
+                    timeit.repeat(
+                        lambda: list_model(**{key: items}), number=number, repeat=5
+                    )
+                )
+                / number
+            )
+            print(
+                f"{list_model.__name__:>8} x {size:>6}: per item {per_item * 1e3:8.2f} ms,"
+                f" TypeAdapter {batched * 1e3:8.2f} ms ({per_item / batched:4.2f}x)"
+            )
+
+
+def trusted() -> None:
+    items = [valid_task(i) for i in range(100)]
+    # A required field is missing, so this task cannot be validated
+    drifted = [*items[:-1], {**items[-1], "folder": {"id": "f"}}]
+    number = 20
+    for label, build in (
+        ("validated", lambda: models.Tasks(tasks=items)),
+        ("construct", lambda: models.construct(models.Tasks, {"tasks": items})),
+        (
+            "validate_or_construct",
+            lambda: models.validate_or_construct(models.Tasks, {"tasks": items}),
+        ),
+        (
+            "  with 1 drifted",
+            lambda: models.validate_or_construct(models.Tasks, {"tasks": drifted}),
+        ),
+    ):
+        elapsed = min(timeit.repeat(build, number=number, repeat=5)) / number
+        print(f"{label:>21} x    100: {elapsed * 1e3:8.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
+    trusted()
@@ -0,0 +1,1492 @@
+import asyncio
+import contextvars
+import itertools
+import ntpath
+import os
+import time
+from datetime import datetime
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Iterable,
+    List,
+    Optional,
+    Sequence,
+    TypeVar,
+    Union,
+)
+
+try:
+    import httpx
+except ImportError:  # pragma: no cover - optional dependency
+    httpx = None  # type: ignore
+
+from clickupython.batch import AsyncBatchExecutor, BatchProgress, BatchResult, Call
+from clickupython.changes import TaskChange, TaskChangeTracker
+from clickupython.client import (
+    API_URL,
+    STREAM_CHUNK_SIZE,
+    list_tasks_query,
+    team_tasks_query,
+)
+from clickupython.codec import JSONCodec, default_codec
+from clickupython.interning import Interner
+from clickupython.helpers.timefuncs import fuzzy_time_to_unix
+from clickupython.helpers import formatting
+from clickupython import models
+from clickupython import exceptions
+from clickupython.pagination import aiter_pages
+from clickupython.ratelimit import RateLimitState, SharedTokenBucket, TokenBucket
+from clickupython.retry import RETRY_STATUSES, RetryPolicy
+from clickupython.streaming import AsyncTaskStream
+from clickupython.uploads import MultipartFile, Progress, upload_calls
+
+M = TypeVar("M")
+
+
+class AsyncClickUpClient:
+    def __init__(
+        self,
+        accesstoken: str,
+        api_url: str = API_URL,
+        default_space: Optional[str] = None,
+        default_list: Optional[str] = None,
+        default_task: Optional[str] = None,
+        retry_rate_limited_requests: bool = False,
+        rate_limit_buffer_wait_time: int = 5,
+        start_rate_limit_remaining: int = 100,
+        start_rate_limit_reset: float = datetime.now().timestamp(),
+        max_concurrency: int = 10,
+        pool_maxsize: int = 10,
+        keep_alive: bool = True,
+        connect_timeout: float = 5.0,
+        read_timeout: float = 30.0,
+        transport: Optional[Any] = None,
+        rate_limit_burst: int = 10,
+        shared_rate_limit: bool = False,
+        rate_limiter: Optional[TokenBucket] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        json_codec: Optional[JSONCodec] = None,
+        lazy_models: bool = False,
+        validate: bool = True,
+        validation_sampling: int = 0,
+        strict: bool = True,
+        interning: Optional[str] = None,
+    ):
+        """Creates a new asyncio client for the ClickUp API.
+
+        Mirrors every public method of ClickUpClient as a coroutine and returns the
+        same models. Requests share one pooled httpx connection pool, and at most
+        max_concurrency of them are in flight at any time. Requires the optional
+        httpx dependency (pip install clickupython[async]).
+
+        Args:
+            :accesstoken (str): The personal or OAuth access token used to authenticate.
+            :max_concurrency (int, optional): Maximum number of requests in flight at once. Defaults to 10.
+            :pool_maxsize (int, optional): Maximum number of pooled connections. Defaults to 10.
+            :keep_alive (bool, optional): Keep connections open between requests. Defaults to True.
+            :connect_timeout (float, optional): Seconds to wait for a connection to be established. Defaults to 5.0.
+            :read_timeout (float, optional): Seconds to wait for the server to send a response. Defaults to 30.0.
+            :transport (httpx.AsyncBaseTransport, optional): Custom httpx transport. Defaults to None.
+            :rate_limit_burst (int, optional): Requests that may be sent back to back before the
+                rate limiter starts spacing them out. Defaults to 10.
+            :shared_rate_limit (bool, optional): Share one rate-limit budget with every other client
+                on this host that uses the same access token, across processes. Defaults to False.
+            :rate_limiter (TokenBucket, optional): A rate limiter to use instead of creating one. Defaults to None.
+            :retry_policy (RetryPolicy, optional): Controls how failed requests are retried. Defaults to
+                the same policy as ClickUpClient.
+            :json_codec (JSONCodec, optional): Decodes responses and encodes request bodies. Defaults to
+                orjson when it is installed and the json module otherwise.
+            :lazy_models (bool, optional): Return LazyTasks and LazyComments from the task and comment
+                getters, which build each model only when it is accessed. Defaults to False.
+            :validate (bool, optional): Validate responses with pydantic. When False, models are built
+                with models.construct, which skips validation for trusted responses. Defaults to True.
+            :validation_sampling (int, optional): With validate=False, still validate one response in
+                every validation_sampling so schema drift is noticed. 0 never validates. Defaults to 0.
+            :strict (bool, optional): Raise when a validated response does not match the models. When
+                False, models are built with models.validate_or_construct, which returns a drifted
+                response as-is instead of raising. Defaults to True.
+            :interning (str, optional): Share one frozen instance of the users, statuses, spaces and
+                folders repeated in a response: "page" within each response, "session" across all
+                of them through client.interner. Defaults to None (no interning).
+        """
+        if httpx is None:
+            raise ImportError(
+                "AsyncClickUpClient requires httpx. Install it with: pip install clickupython[async]"
+            )
+
+        self.api_url = api_url
+        self.accesstoken = accesstoken
+        self.request_count = 0
+        self.default_space = default_space
+        self.default_list = default_list
+        self.default_task = default_task
+        self.rate_limit_remaining = start_rate_limit_remaining
+        self.rate_limit_reset = start_rate_limit_reset
+        self.rate_limit_buffer_wait_time = rate_limit_buffer_wait_time
+        self.retry_rate_limited_requests = retry_rate_limited_requests
+        if rate_limiter is not None:
+            self.rate_limiter = rate_limiter
+        elif shared_rate_limit:
+            self.rate_limiter = SharedTokenBucket(
+                accesstoken, burst=rate_limit_burst, buffer=rate_limit_buffer_wait_time
+            )
+        else:
+            self.rate_limiter = TokenBucket(
+                burst=rate_limit_burst, buffer=rate_limit_buffer_wait_time
+            )
+            self.rate_limiter.update(start_rate_limit_remaining, start_rate_limit_reset)
+        self.retry_policy = retry_policy or RetryPolicy(
+            retry_statuses=(
+                RETRY_STATUSES
+                if retry_rate_limited_requests
+                else RETRY_STATUSES - {429}
+            )
+        )
+        self.retry_count = 0
+        self.json_codec = json_codec or default_codec()
+        self.__tasks_model = models.LazyTasks if lazy_models else models.Tasks
+        self.__comments_model = models.LazyComments if lazy_models else models.Comments
+        self.validate = validate
+        self.validation_sampling = validation_sampling
+        self.strict = strict
+        self.__responses = itertools.count()
+        if interning not in (None, "page", "session"):
+            raise exceptions.ClickupClientError(
+                f"Unknown interning mode {interning!r}, expected 'page' or 'session'.",
+                None,
+            )
+        self.interning = interning
+        self.interner = Interner() if interning == "session" else None
+        self.__attempts: contextvars.ContextVar[int] = contextvars.ContextVar(
+            "attempts", default=0
+        )
+        self.semaphore = asyncio.Semaphore(max_concurrency)
+        self.session = httpx.AsyncClient(
+            limits=httpx.Limits(
+                max_connections=pool_maxsize,
+                max_keepalive_connections=pool_maxsize if keep_alive else 0,
+            ),
+            timeout=httpx.Timeout(read_timeout, connect=connect_timeout),
+            transport=transport,
+        )
+
+    async def __aenter__(self) -> "AsyncClickUpClient":
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.close()
+
+    async def close(self) -> None:
+        """Closes the client's HTTP session and releases all pooled connections."""
+        await self.session.aclose()
+
+    async def batch(
+        self,
+        calls: Iterable[Call],
+        concurrency: int = 8,
+        min_concurrency: int = 1,
+        on_progress: Optional[Callable[[BatchProgress], None]] = None,
+    ) -> list[BatchResult]:
+        """Runs many calls to client coroutines concurrently. See ClickUpClient.batch."""
+        executor = AsyncBatchExecutor(self, concurrency, min_concurrency, on_progress)
+        return await executor.run(calls)
+
+    @property
+    def last_request_attempts(self) -> int:
+        """Number of attempts (1 when no retry was needed) used by the latest request made from the calling task."""
+        return self.__attempts.get()
+
+    @property
+    def rate_limit_state(self) -> RateLimitState:
+        """The current state of the client's rate limiter."""
+        return self.rate_limiter.state()
+
+    def __parse_response_rate_limit_headers(self, response: "httpx.Response") -> None:
+        remaining = response.headers.get("x-ratelimit-remaining")
+        reset = response.headers.get("x-ratelimit-reset")
+        if remaining is None or reset is None:
+            return
+
+        self.rate_limit_remaining = int(remaining)
+        self.rate_limit_reset = float(reset)
+        limit = response.headers.get("x-ratelimit-limit")
+        self.rate_limiter.update(
+            self.rate_limit_remaining,
+            self.rate_limit_reset,
+            int(limit) if limit else None,
+        )
+
+    def _prefetch_budget(self) -> int:
+        """Returns how many requests can be issued before the rate limit is hit, for prefetching and batches."""
+        return self.rate_limit_remaining - 1
+
+    def __validates(self) -> bool:
+        """Returns True if the next response should be validated rather than trusted."""
+        if self.validate:
+            return True
+        return (
+            self.validation_sampling > 0
+            and next(self.__responses) % self.validation_sampling == 0
+        )
+
+    def __model(self, model: type[M], data: dict[str, Any]) -> M:
+        """Builds a model from a response, validating it unless the client trusts responses."""
+        if not self.__validates():
+            built = models.construct(model, data)
+        elif self.strict:
+            built = model(**data)
+        else:
+            built = models.validate_or_construct(model, data)
+        interner = self.__interner()
+        return interner.intern_nested(built) if interner is not None else built
+
+    def __tasks_list(self, fields: Optional[Sequence[str]]) -> type:
+        """Returns the list model of a page of tasks, projected to fields if any are given."""
+        if fields is None:
+            return self.__tasks_model
+        return models.task_summaries(fields)
+
+    def __interner(self) -> Optional[Interner]:
+        """Returns the Interner for the next response, if the client interns models."""
+        if self.interning == "page":
+            return Interner()
+        return self.interner
+
+    def __headers(self, file_upload: bool = False) -> dict[str, str]:
+        """Internal method to generate headers for HTTP requests.
+
+        Returns:
+            :dict: Returns headers for HTTP requests
+        """
+        return (
+            {"Authorization": self.accesstoken}
+            if file_upload
+            else {
+                "Authorization": self.accesstoken,
+                "Content-Type": "application/json",
+            }
+        )
+
+    async def __send(
+        self,
+        method: str,
+        path: str,
+        retry: Optional[bool] = None,
+        body: Optional[MultipartFile] = None,
+        stream: bool = False,
+        **kwargs: Any,
+    ) -> "httpx.Response":
+        """Internal method that paces a request through the rate limiter, sends it through the shared
+        connection pool and retries it according to the retry policy. See ClickUpClient for `retry`
+        and `body`. With stream, the body of the response is left unread for the caller to close.
+        """
+        policy = self.retry_policy
+        retryable = retry is not False and policy.allows(method, bool(retry))
+        attempt = 0
+        while True:
+            attempt += 1
+            self.__attempts.set(attempt)
+            delay = self.rate_limiter.reserve()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            if body is not None:
+                # Each attempt reads the streamed body to the end
+                body.rewind()
+                kwargs["content"] = body.chunks()
+            try:
+                async with self.semaphore:
+                    request = self.session.build_request(method, path, **kwargs)
+                    response = await self.session.send(request, stream=stream)
+            except policy.retry_exceptions as error:
+                if not (retryable and policy.should_retry_exception(attempt, error)):
+                    raise
+                await self.__wait_for_retry(policy.delay(attempt))
+                continue
+
+            self.request_count += 1
+            self.__parse_response_rate_limit_headers(response)
+
+            if retryable and policy.should_retry_status(attempt, response.status_code):
+                # Release the connection of a streamed response before trying again
+                await response.aclose()
+                await self.__wait_for_retry(
+                    policy.delay(attempt, response.status_code, response.headers)
+                )
+                continue
+            return response
+
+    async def __wait_for_retry(self, delay: float) -> None:
+        self.retry_count += 1
+        await asyncio.sleep(delay)
+
+    async def __get_request(self, model: str, *additionalpath: str) -> dict[str, Any]:
+        """Performs a Get request to the ClickUp API"""
+        path = formatting.url_join(self.api_url, model, *additionalpath)
+
+        response = await self.__send("GET", path, headers=self.__headers())
+        response_json: dict[str, Any] = self.json_codec.loads(response.content)
+
+        if response.status_code == 429:
+            raise exceptions.ClickupClientError(
+                "Rate limit exceeded", response.status_code
+            )
+        if response.status_code in [401, 400, 404]:
+            raise exceptions.ClickupClientError(
+                response_json["err"], response.status_code
+            )
+        if response.is_success:
+            return response_json
+
+        raise exceptions.ClickupClientError("Unknown Error", response.status_code)
+
+    async def __stream_tasks(
+        self, model: str, *additionalpath: str, fields: Optional[Sequence[str]] = None
+    ) -> AsyncTaskStream:
+        """Performs a Get request for a page of tasks whose body is parsed as it arrives"""
+        path = formatting.url_join(self.api_url, model, *additionalpath)
+        response = await self.__send("GET", path, headers=self.__headers(), stream=True)
+        if not response.is_success:
+            await response.aread()
+            response_json: dict[str, Any] = self.json_codec.loads(response.content)
+            if response.status_code == 429:
+                raise exceptions.ClickupClientError(
+                    "Rate limit exceeded", response.status_code
+                )
+            if response.status_code in [401, 400, 404]:
+                raise exceptions.ClickupClientError(
+                    response_json["err"], response.status_code
+                )
+            raise exceptions.ClickupClientError("Unknown Error", response.status_code)
+
+        async def chunks() -> AsyncIterator[bytes]:
+            try:
+                async for chunk in response.aiter_bytes(STREAM_CHUNK_SIZE):
+                    yield chunk
+            finally:
+                await response.aclose()
+
+        return AsyncTaskStream(
+            chunks(),
+            trusted=not self.__validates(),
+            strict=self.strict,
+            interner=self.__interner(),
+            model=self.__tasks_list(fields).item_model(),
+        )
+
+    @staticmethod
+    def __stream_prefetch(stream: bool, prefetch: int) -> int:
+        """Internal method checking that streamed pages, which hold their connection open, are fetched one at a time."""
+        if stream and prefetch:
+            raise exceptions.ClickupClientError(
+                "Streamed pages cannot be prefetched.", None
+            )
+        return prefetch
+
+    async def __post_request(
+        self,
+        model: str,
+        data: dict[str, Any],
+        *additionalpath: str,
+        upload_files: Any = None,
+        file_upload: bool = False,
+        retry: Optional[bool] = None,
+    ) -> dict[str, Any]:
+        path = formatting.url_join(self.api_url, model, *additionalpath)
+        if upload_files:
+            response = await self.__send(
+                "POST",
+                path,
+                retry=retry,
+                body=upload_files,
+                headers={
+                    **self.__headers(True),
+                    "Content-Type": upload_files.content_type,
+                    "Content-Length": str(len(upload_files)),
+                },
+            )
+        elif data:
+            response = await self.__send(
+                "POST",
+                path,
+                retry=retry,
+                headers=self.__headers(),
+                content=self.json_codec.dumps(data),
+            )
+        else:
+            response = await self.__send(
+                "POST", path, retry=retry, headers=self.__headers()
+            )
+
+        response_json: dict[str, Any] = self.json_codec.loads(response.content)
+        if response.status_code in [401, 400, 500, 404]:
+            raise exceptions.ClickupClientError(
+                response_json["err"], response.status_code
+            )
+        if response.is_success:
+            return response_json
+
+        raise exceptions.ClickupClientError("Unknown Error", response.status_code)
+
+    async def __put_request(
+        self, model: str, data: dict[str, Any], *additionalpath: str
+    ) -> dict[str, Any]:
+        path = formatting.url_join(self.api_url, model, *additionalpath)
+        response = await self.__send(
+            "PUT", path, headers=self.__headers(), content=self.json_codec.dumps(data)
+        )
+        response_json: dict[str, Any] = self.json_codec.loads(response.content)
+        if response.status_code in [401, 400]:
+            raise exceptions.ClickupClientError(
+                response_json["err"], response.status_code
+            )
+        if response.is_success:
+            return response_json
+
+        raise exceptions.ClickupClientError("Unknown Error", response.status_code)
+
+    async def __delete_request(self, model: str, *additionalpath: str) -> int:
+        path = formatting.url_join(self.api_url, model, *additionalpath)
+        response = await self.__send("DELETE", path, headers=self.__headers())
+        try:
+            response_json: dict[str, Any] = self.json_codec.loads(response.content)
+        except ValueError:
+            raise exceptions.ClickupClientError(
+                "Invalid Json response", response.status_code
+            )
+        if response.is_success:
+            return response.status_code
+        raise exceptions.ClickupClientError(response_json["err"], response.status_code)
+
+    # Lists
+    async def get_list(self, list_id: str) -> dict[str, Any]:
+        """Fetches a single list item from a given list id."""
+        model = "list/"
+        return await self.__get_request(model, list_id)
+
+    async def get_folderless_lists(self, space_id: str) -> dict[str, Any]:
+        """Fetches all folderless lists from a given space id."""
+        model = "space/"
+        return await self.__get_request(model, space_id, "list")
+
+    async def get_lists(self, folder_id: str) -> dict[str, Any]:
+        """Fetches all lists from a given folder id."""
+        model = "folder/"
+        return await self.__get_request(model, folder_id)
+
+    async def create_list(
+        self,
+        folder_id: str,
+        name: str,
+        content: str,
+        due_date: str,
+        priority: int,
+        status: str,
+    ) -> dict[str, Any]:
+        """Creates and returns a List in a folder from a given folder ID."""
+        data = {
+            "name": name,
+            "content": content,
+            "due_date": due_date,
+            "status": status,
+        }
+        model = "folder/"
+        created_list = await self.__post_request(model, data, folder_id, "list")
+        if created_list:
+            return created_list
+
+        raise exceptions.ClickupClientError("Failed to Create List.", None)
+
+    async def create_folderless_list(
+        self,
+        space_id: str,
+        name: str,
+        content: Optional[str] = None,
+        due_date: Optional[str] = None,
+        priority: Optional[int] = None,
+        assignee: Optional[str] = None,
+        status: Optional[str] = None,
+    ) -> dict[str, Any]:
+        """Creates and returns a List directly inside a space."""
+        arguments = {}
+        arguments.update(vars())
+        arguments.pop("self", None)
+        arguments.pop("arguments", None)
+        arguments.pop("space_id", None)
+
+        final_dict = {k: v for k, v in arguments.items() if v is not None}
+
+        model = "space/"
+        created_list = await self.__post_request(model, final_dict, space_id, "list")
+        if created_list:
+            return created_list
+
+        raise exceptions.ClickupClientError("Failed to Create Folderless List.", None)
+
+    async def update_list(
+        self,
+        list_id: str,
+        name: Optional[str] = None,
+        content: Optional[str] = None,
+        due_date: Optional[str] = None,
+        due_date_time: Optional[bool] = None,
+        priority: Optional[int] = None,
+        assignee: Optional[str] = None,
+        unset_status: Optional[bool] = None,
+    ) -> dict[str, Any]:
+        """Updates a list via a given list id."""
+        if priority and priority not in range(1, 4):
+            raise exceptions.ClickupClientError(
+                "Priority must be in range of 0-4.", "Priority out of range"
+            )
+
+        if due_date and not str(due_date).isdigit():
+            due_date = fuzzy_time_to_unix(due_date)
+
+        arguments = {}
+        arguments.update(vars())
+        arguments.pop("self", None)
+        arguments.pop("arguments", None)
+        arguments.pop("list_id", None)
+
+        final_dict = {k: v for k, v in arguments.items() if v is not None}
+        model = "list/"
+        updated_list = await self.__put_request(model, final_dict, list_id)
+        if updated_list:
+            return updated_list
+
+        raise exceptions.ClickupClientError("Failed to Update List.", None)
+
+    async def delete_list(self, list_id: str) -> bool:
+        """Deletes a list via a given list id."""
+        model = "list/"
+        await self.__delete_request(model, list_id)
+        return True
+
+    async def add_task_to_list(self, task_id: str, list_id: str) -> models.Task:
+        """Adds a task to a list via a given task id and list id."""
+        model = "list/"
+        task = await self.__post_request(
+            model, {}, list_id, "task", task_id, retry=True
+        )
+        return self.__model(models.Task, task)
+
+    async def remove_task_from_list(self, task_id: str, list_id: str) -> bool:
+        """Removes a task from a list via a given task id and list id."""
+        model = "list/"
+        await self.__delete_request(model, list_id, "task", task_id)
+        return True
+
+    # Folders
+    async def get_folder(self, folder_id: str) -> models.Folder:
+        """Fetches a single folder item from a given folder id."""
+        model = "folder/"
+        fetched_folder = await self.__get_request(model, folder_id)
+        if fetched_folder:
+            return self.__model(models.Folder, fetched_folder)
+
+        raise exceptions.ClickupClientError("Failed to Get Folder.", None)
+
+    async def get_folders(self, space_id: str) -> models.Folders:
+        """Fetches all folders from a given space ID."""
+        model = "space/"
+        fetched_folders = await self.__get_request(model, space_id, "folder")
+        if fetched_folders:
+            return self.__model(models.Folders, fetched_folders)
+
+        raise exceptions.ClickupClientError("Failed to Get Folders.", None)
+
+    async def create_folder(self, space_id: str, name: str) -> models.Folder:
+        """Creates and returns a Folder object in a space from a given space ID."""
+        data = {
+            "name": name,
+        }
+        model = "space/"
+        created_folder = await self.__post_request(model, data, space_id, "folder")
+        if created_folder:
+            return self.__model(models.Folder, created_folder)
+
+        raise exceptions.ClickupClientError("Failed to Create Folder.", None)
+
+    async def update_folder(self, folder_id: str, name: str) -> models.Folder:
+        """Updates the name of a folder given the folder ID."""
+        data = {
+            "name": name,
+        }
+        model = "folder/"
+        updated_folder = await self.__put_request(model, data, folder_id)
+        if updated_folder:
+            return self.__model(models.Folder, updated_folder)
+
+        raise exceptions.ClickupClientError("Failed to Update Folder.", None)
+
+    async def delete_folder(self, folder_id: str) -> bool:
+        """Deletes a folder from a given folder ID."""
+        model = "folder/"
+        await self.__delete_request(model, folder_id)
+        return True
+
+    # Tasks
+    async def upload_attachment(
+        self, task_id: str, file_path: str, progress: Optional[Progress] = None
+    ) -> models.Attachment:
+        """Uploads an attachment to a ClickUp task. See ClickUpClient.upload_attachment."""
+        if os.path.exists(file_path):
+            data = {"filename": ntpath.basename(file_path)}
+            with MultipartFile(file_path, fields=data, progress=progress) as body:
+                model = "task/" + task_id
+                uploaded_attachment = await self.__post_request(
+                    model, data, "attachment", upload_files=body, file_upload=True
+                )
+
+            if uploaded_attachment:
+                return self.__model(models.Attachment, uploaded_attachment)
+
+        raise exceptions.ClickupClientError("Failed to Upload Attachment.", None)
+
+    async def upload_attachments(
+        self,
+        uploads: Iterable[tuple[str, str]],
+        concurrency: int = 4,
+        progress: Optional[Callable[[str, str, int, int], None]] = None,
+    ) -> list[BatchResult]:
+        """Uploads many files to many tasks concurrently. See ClickUpClient.upload_attachments."""
+        return await self.batch(upload_calls(uploads, progress), concurrency)
+
+    async def get_task(self, task_id: str) -> models.Task:
+        """Fetches a single ClickUp task item and returns a Task object."""
+        model = "task/"
+        fetched_task = await self.__get_request(model, task_id)
+        final_task = self.__model(models.Task, fetched_task)
+        if final_task:
+            return final_task
+
+        raise exceptions.ClickupClientError("Failed to Get Task.", None)
+
+    async def get_team_tasks(
+        self,
+        team_Id: str,
+        page: int = 0,
+        order_by: str = "created",
+        reverse: bool = False,
+        subtasks: bool = False,
+        space_ids: Optional[List[str]] = None,
+        project_ids: Optional[List[str]] = None,
+        list_ids: Optional[List[str]] = None,
+        statuses: Optional[List[str]] = None,
+        include_closed: bool = False,
+        assignees: Optional[List[str]] = None,
+        tags: Optional[List[str]] = None,
+        due_date_gt: Optional[str] = None,
+        due_date_lt: Optional[str] = None,
+        date_created_gt: Optional[str] = None,
+        date_created_lt: Optional[str] = None,
+        date_updated_gt: Optional[str] = None,
+        date_updated_lt: Optional[str] = None,
+        fields: Optional[Sequence[str]] = None,
+    ) -> Union[models.Tasks, models.TaskSummaries]:
+        """Gets filtered tasks for a team. See ClickUpClient.get_team_tasks."""
+        joined_url = team_tasks_query(
+            page,
+            order_by,
+            reverse,
+            include_closed,
+            subtasks=subtasks,
+            statuses=statuses,
+            assignees=assignees,
+            due_date_gt=due_date_gt,
+            due_date_lt=due_date_lt,
+            date_created_gt=date_created_gt,
+            date_created_lt=date_created_lt,
+            date_updated_gt=date_updated_gt,
+            date_updated_lt=date_updated_lt,
+            space_ids=space_ids,
+            project_ids=project_ids,
+            list_ids=list_ids,
+        )
+
+        model = "team/"
+        fetched_tasks = await self.__get_request(model, team_Id, joined_url)
+        if fetched_tasks:
+            return self.__model(self.__tasks_list(fields), fetched_tasks)
+
+        raise exceptions.ClickupClientError("Failed to Get Team Tasks.", None)
+
+    async def get_tasks(
+        self,
+        list_id: str,
+        archived: bool = False,
+        page: int = 0,
+        order_by: str = "created",
+        reverse: bool = False,
+        subtasks: bool = False,
+        statuses: Optional[List[str]] = None,
+        include_closed: bool = False,
+        assignees: Optional[List[str]] = None,
+        due_date_gt: Optional[str] = None,
+        due_date_lt: Optional[str] = None,
+        date_created_gt: Optional[str] = None,
+        date_created_lt: Optional[str] = None,
+        date_updated_gt: Optional[str] = None,
+        date_updated_lt: Optional[str] = None,
+        fields: Optional[Sequence[str]] = None,
+    ) -> Union[models.Tasks, models.TaskSummaries]:
+        """Gets one page of tasks from a list. See ClickUpClient.get_tasks."""
+        joined_url = list_tasks_query(
+            archived,
+            page,
+            order_by,
+            reverse,
+            include_closed,
+            subtasks=subtasks,
+            statuses=statuses,
+            assignees=assignees,
+            due_date_gt=due_date_gt,
+            due_date_lt=due_date_lt,
+            date_created_gt=date_created_gt,
+            date_created_lt=date_created_lt,
+            date_updated_gt=date_updated_gt,
+            date_updated_lt=date_updated_lt,
+        )
+
+        model = "list/"
+        fetched_tasks = await self.__get_request(model, list_id, joined_url)
+        if fetched_tasks:
+            return self.__model(self.__tasks_list(fields), fetched_tasks)
+
+        raise exceptions.ClickupClientError("Failed to Get Tasks.", None)
+
+    async def iter_team_tasks(
+        self,
+        team_Id: str,
+        page: int = 0,
+        order_by: str = "created",
+        reverse: bool = False,
+        subtasks: bool = False,
+        space_ids: Optional[List[str]] = None,
+        project_ids: Optional[List[str]] = None,
+        list_ids: Optional[List[str]] = None,
+        statuses: Optional[List[str]] = None,
+        include_closed: bool = False,
+        assignees: Optional[List[str]] = None,
+        tags: Optional[List[str]] = None,
+        due_date_gt: Optional[str] = None,
+        due_date_lt: Optional[str] = None,
+        date_created_gt: Optional[str] = None,
+        date_created_lt: Optional[str] = None,
+        date_updated_gt: Optional[str] = None,
+        date_updated_lt: Optional[str] = None,
+        prefetch: int = 0,
+        stream: bool = False,
+        fields: Optional[Sequence[str]] = None,
+    ) -> AsyncIterator[Union[models.Task, models.TaskSummary]]:
+        """Lazily yields every task matching the filters for a team. See ClickUpClient.iter_team_tasks.
+
+        With prefetch, up to that many upcoming pages are requested concurrently as
+        asyncio tasks while the current page is consumed, capped by the remaining rate
+        limit. Outstanding requests are cancelled once the last page is seen. With
+        stream, each page is parsed as it downloads, as for ClickUpClient.
+        """
+
+        filters = dict(
+            subtasks=subtasks,
+            space_ids=space_ids,
+            project_ids=project_ids,
+            list_ids=list_ids,
+            statuses=statuses,
+            assignees=assignees,
+            due_date_gt=due_date_gt,
+            due_date_lt=due_date_lt,
+            date_created_gt=date_created_gt,
+            date_created_lt=date_created_lt,
+            date_updated_gt=date_updated_gt,
+            date_updated_lt=date_updated_lt,
+        )
+
+        def fetch_page(page_number: int) -> Awaitable[models.Tasks]:
+            if stream:
+                return self.__stream_tasks(  # type: ignore[return-value]
+                    "team/",
+                    team_Id,
+                    team_tasks_query(
+                        page_number, order_by, reverse, include_closed, **filters
+                    ),
+                    fields=fields,
+                )
+            return self.get_team_tasks(
+                team_Id,
+                page=page_number,
+                order_by=order_by,
+                reverse=reverse,
+                include_closed=include_closed,
+                tags=tags,
+                fields=fields,
+                **filters,
+            )
+
+        prefetch = self.__stream_prefetch(stream, prefetch)
+        async for tasks in aiter_pages(
+            fetch_page, page, prefetch, self._prefetch_budget
+        ):
+            if stream:
+                async for task in tasks:  # type: ignore[attr-defined]
+                    yield task
+            else:
+                for task in tasks:
+                    yield task
+
+    async def iter_tasks(
+        self,
+        list_id: str,
+        archived: bool = False,
+        page: int = 0,
+        order_by: str = "created",
+        reverse: bool = False,
+        subtasks: bool = False,
+        statuses: Optional[List[str]] = None,
+        include_closed: bool = False,
+        assignees: Optional[List[str]] = None,
+        due_date_gt: Optional[str] = None,
+        due_date_lt: Optional[str] = None,
+        date_created_gt: Optional[str] = None,
+        date_created_lt: Optional[str] = None,
+        date_updated_gt: Optional[str] = None,
+        date_updated_lt: Optional[str] = None,
+        prefetch: int = 0,
+        stream: bool = False,
+        fields: Optional[Sequence[str]] = None,
+    ) -> AsyncIterator[Union[models.Task, models.TaskSummary]]:
+        """Lazily yields every task matching the filters in a list. See ClickUpClient.iter_tasks.
+
+        Pages are prefetched or streamed as described in iter_team_tasks.
+        """
+
+        filters = dict(
+            subtasks=subtasks,
+            statuses=statuses,
+            assignees=assignees,
+            due_date_gt=due_date_gt,
+            due_date_lt=due_date_lt,
+            date_created_gt=date_created_gt,
+            date_created_lt=date_created_lt,
+            date_updated_gt=date_updated_gt,
+            date_updated_lt=date_updated_lt,
+        )
+
+        def fetch_page(page_number: int) -> Awaitable[models.Tasks]:
+            if stream:
+                return self.__stream_tasks(  # type: ignore[return-value]
+                    "list/",
+                    list_id,
+                    list_tasks_query(
+                        archived,
+                        page_number,
+                        order_by,
+                        reverse,
+                        include_closed,
+                        **filters,
+                    ),
+                    fields=fields,
+                )
+            return self.get_tasks(
+                list_id,
+                archived=archived,
+                page=page_number,
+                order_by=order_by,
+                reverse=reverse,
+                include_closed=include_closed,
+                fields=fields,
+                **filters,
+            )
+
+        prefetch = self.__stream_prefetch(stream, prefetch)
+        async for tasks in aiter_pages(
+            fetch_page, page, prefetch, self._prefetch_budget
+        ):
+            if stream:
+                async for task in tasks:  # type: ignore[attr-defined]
+                    yield task
+            else:
+                for task in tasks:
+                    yield task
+
+    async def watch_team_tasks(
+        self,
+        team_Id: str,
+        interval: float = 30.0,
+        since: Optional[int] = None,
+        subtasks: bool = False,
+        space_ids: Optional[List[str]] = None,
+        project_ids: Optional[List[str]] = None,
+        list_ids: Optional[List[str]] = None,
+        statuses: Optional[List[str]] = None,
+        assignees: Optional[List[str]] = None,
+        max_polls: Optional[int] = None,
+    ) -> AsyncIterator[TaskChange]:
+        """Polls a team for task changes and yields them. See ClickUpClient.watch_team_tasks."""
+        tracker = TaskChangeTracker(
+            since if since is not None else int(time.time() * 1000)
+        )
+        polls = 0
+        while max_polls is None or polls < max_polls:
+            if polls:
+                await asyncio.sleep(interval)
+            polls += 1
+
+            watermark = tracker.begin()
+            changes = []
+            async for task in self.iter_team_tasks(
+                team_Id,
+                order_by="updated",
+                subtasks=subtasks,
+                space_ids=space_ids,
+                project_ids=project_ids,
+                list_ids=list_ids,
+                statuses=statuses,
+                include_closed=True,
+                assignees=assignees,
+                date_updated_gt=str(watermark - 1),
+            ):
+                if int(task.date_updated or 0) < watermark:
+                    break
+                change = tracker.observe(task)
+                if change is not None:
+                    changes.append(change)
+
+            for change in reversed(changes):
+                yield change
+
+    async def create_task(
+        self,
+        list_id: str,
+        name: str,
+        description: Optional[str] = None,
+        priority: Optional[int] = None,
+        assignees: Optional[list[Any]] = None,
+        tags: Optional[list[Any]] = None,
+        status: Optional[str] = None,
+        due_date: Optional[str] = None,
+        start_date: Optional[str] = None,
+        notify_all: bool = True,
+    ) -> models.Task:
+        """Creates a task in a list. See ClickUpClient.create_task."""
+        if priority and priority not in range(1, 4):
+            raise exceptions.ClickupClientError(
+                "Priority must be in range of 0-4.", "Priority out of range"
+            )
+        if due_date and not str(due_date).isdigit():
+            due_date = fuzzy_time_to_unix(due_date)
+
+        arguments = {}
+        arguments.update(vars())
+        arguments.pop("self", None)
+        arguments.pop("arguments", None)
+        arguments.pop("list_id", None)
+
+        final_dict = {k: v for k, v in arguments.items() if v is not None}
+
+        model = "list/"
+        created_task = await self.__post_request(model, final_dict, list_id, "task")
+        if created_task:
+            return self.__model(models.Task, created_task)
+
+        raise exceptions.ClickupClientError("Failed to Create Task.", None)
+
+    async def update_task(
+        self,
+        task_id: str,
+        name: Optional[str] = None,
+        description: Optional[str] = None,
+        status: Optional[str] = None,
+        priority: Optional[int] = None,
+        time_estimate: Optional[int] = None,
+        archived: Optional[bool] = None,
+        add_assignees: Optional[List[str]] = None,
+        remove_assignees: Optional[List[int]] = None,
+    ) -> models.Task:
+        """Updates a task. See ClickUpClient.update_task."""
+        if priority and priority not in range(1, 4):
+            raise exceptions.ClickupClientError(
+                "Priority must be in range of 0-4.", "Priority out of range"
+            )
+
+        arguments = {}
+        arguments.update(vars())
+        arguments.pop("self", None)
+        arguments.pop("arguments", None)
+        arguments.pop("task_id", None)
+        arguments.pop("add_assignees", None)
+        arguments.pop("remove_assignees", None)
+
+        if add_assignees and remove_assignees:
+            arguments.update(
+                {"assignees": {"add": add_assignees, "rem": remove_assignees}}
+            )
+        elif add_assignees:
+            arguments.update({"assignees": {"add": add_assignees}})
+        elif remove_assignees:
+            arguments.update({"assignees": {"rem": remove_assignees}})
+
+        final_dict = {k: v for k, v in arguments.items() if v is not None}
+
+        model = "task/"
+        updated_task = await self.__put_request(model, final_dict, task_id)
+        if updated_task:
+            return self.__model(models.Task, updated_task)
+
+        raise exceptions.ClickupClientError("Failed to Update List.", None)
+
+    async def delete_task(self, task_id: str) -> bool:
+        """Deletes a task via a given task ID."""
+        model = "task/"
+        await self.__delete_request(model, task_id)
+        return True
+
+    # Comments
+    async def get_task_comments(self, task_id: str) -> models.Comments:
+        """Get all the comments for a task from a given task id."""
+        model = "task/"
+        fetched_comments = await self.__get_request(model, task_id, "comment")
+        return self.__model(self.__comments_model, fetched_comments)
+
+    async def get_list_comments(self, list_id: str) -> models.Comments:
+        """Get all the comments for a list from a given list id."""
+        model = "list/"
+        fetched_comments = await self.__get_request(model, list_id, "comment/")
+        final_comments = self.__model(self.__comments_model, fetched_comments)
+        if final_comments:
+            return final_comments
+
+        raise exceptions.ClickupClientError("Failed to Get List Comments.", None)
+
+    async def get_chat_comments(self, view_id: str) -> models.Comments:
+        """Get all the comments for a chat from a given view id."""
+        model = "view/"
+        fetched_comments = await self.__get_request(model, view_id, "comment/")
+        final_comments = self.__model(self.__comments_model, fetched_comments)
+        if final_comments:
+            return final_comments
+
+        raise exceptions.ClickupClientError("Failed to Get Chat Comments.", None)
+
+    async def update_comment(
+        self,
+        comment_id: str,
+        comment_text: Optional[str] = None,
+        assignee: Optional[str] = None,
+        resolved: Optional[bool] = None,
+    ) -> models.Comment:
+        """Update a ClickUp comment's content, assignee and resolution status."""
+        arguments = {}
+        arguments.update(vars())
+        arguments.pop("self", None)
+        arguments.pop("arguments", None)
+        arguments.pop("comment_id", None)
+
+        model = "comment/"
+
+        final_dict = {k: v for k, v in arguments.items() if v is not None}
+
+        updated_comment = await self.__put_request(model, final_dict, comment_id)
+
+        return self.__model(models.Comment, updated_comment)
+
+    async def delete_comment(self, comment_id: str) -> bool:
+        """Deletes a comment via a given comment id."""
+        model = "comment/"
+        await self.__delete_request(model, comment_id)
+        return True
+
+    async def create_task_comment(
+        self,
+        task_id: str,
+        comment_text: str,
+        assignee: Optional[str] = None,
+        notify_all: bool = True,
+    ) -> models.Comment:
+        """Create a comment on a task via a given task id."""
+        arguments = {}
+        arguments.update(vars())
+        arguments.pop("self", None)
+        arguments.pop("arguments", None)
+        arguments.pop("task_id", None)
+
+        model = "task/"
+
+        final_dict = {k: v for k, v in arguments.items() if v is not None}
+
+        created_comment = await self.__post_request(
+            model, final_dict, task_id, "comment"
+        )
+
+        final_comment = self.__model(models.Comment, created_comment)
+        if final_comment:
+            return final_comment
+
+        raise exceptions.ClickupClientError("Failed to Create Task Comment.", None)
+
+    async def create_chat_comment(
+        self,
+        view_id: str,
+        comment_text: str,
+        notify_all: bool = True,
+    ) -> models.Comment:
+        """Create a comment on a chat via a given chat view id."""
+        arguments = {}
+        arguments.update(vars())
+        arguments.pop("self", None)
+        arguments.pop("arguments", None)
+        arguments.pop("view_id", None)
+
+        model = "view/"
+
+        final_dict = {k: v for k, v in arguments.items() if v is not None}
+
+        created_comment = await self.__post_request(
+            model, final_dict, view_id, "comment"
+        )
+
+        final_comment = self.__model(models.Comment, created_comment)
+        if final_comment:
+            return final_comment
+
+        raise exceptions.ClickupClientError("Failed to Create Chat Comment.", None)
+
+    # Teams
+    async def get_teams(self) -> models.Teams:
+        """Get all teams (workspaces) the token has access to."""
+        model = "team"
+        fetched_teams = await self.__get_request(model)
+        return self.__model(models.Teams, fetched_teams)
+
+    # Checklists
+    async def create_checklist(self, task_id: str, name: str) -> models.Checklist:
+        """Create a checklist in a task via a given task id."""
+        data = {
+            "name": name,
+        }
+
+        model = "task/"
+        created_checklist = await self.__post_request(model, data, task_id, "checklist")
+        return self.__model(models.Checklist, created_checklist)
+
+    async def create_checklist_item(
+        self, checklist_id: str, name: str, assignee: Optional[str] = None
+    ) -> models.Checklist:
+        """Creates an item in a ClickUp checklist via a given checklist id."""
+        data = {"name": name, "assignee": assignee} if assignee else {"name": name}
+        model = "checklist/"
+        created_checklist = await self.__post_request(
+            model, data, checklist_id, "checklist_item"
+        )
+        return self.__model(models.Checklist, created_checklist)
+
+    async def update_checklist(
+        self,
+        checklist_id: str,
+        name: Optional[str] = None,
+        position: Optional[int] = None,
+    ) -> models.Checklist:
+        """Updates a ClickUp checklist."""
+        if not name and not position:
+            raise exceptions.ClickupClientError("Failed to Update Checklist.", None)
+
+        data: dict[str, str | int] = {}
+
+        if name:
+            data.update({"name": name})
+        if position:
+            data.update({"postition": position})
+
+        model = "checklist/"
+        updated_checklist = await self.__put_request(model, data, checklist_id)
+        if updated_checklist:
+            return self.__model(models.Checklist, updated_checklist)
+
+        raise exceptions.ClickupClientError("Failed to Update Checklist.", None)
+
+    async def delete_checklist(self, checklist_id: str) -> bool:
+        """Delete a checklist via a given checklist id."""
+        model = "checklist/"
+        await self.__delete_request(model, checklist_id)
+        return True
+
+    async def delete_checklist_item(
+        self, checklist_id: str, checklist_item_id: str
+    ) -> bool:
+        """Deletes an item from a checklist via a given checklist id and item id."""
+        model = "checklist/"
+        await self.__delete_request(
+            model, checklist_id, "checklist_item", checklist_item_id
+        )
+        return True
+
+    async def update_checklist_item(
+        self,
+        checklist_id: str,
+        checklist_item_id: str,
+        name: Optional[str] = None,
+        resolved: Optional[bool] = None,
+        parent: Optional[str] = None,
+    ) -> models.Checklist:
+        """Updates an item in a checklist via a given checklist id and item id."""
+        arguments = {}
+        arguments.update(vars())
+        arguments.pop("self", None)
+        arguments.pop("arguments", None)
+        arguments.pop("checklist_id", None)
+        arguments.pop("checklist_item_id", None)
+
+        model = "checklist/"
+
+        final_dict = {k: v for k, v in arguments.items() if v is not None}
+
+        item_update = await self.__put_request(
+            model, final_dict, checklist_id, "checklist_item", checklist_item_id
+        )
+
+        final_update = self.__model(models.Checklist, item_update)
+        if final_update:
+            return final_update
+
+        raise exceptions.ClickupClientError("Failed to Update Checklist Item.", None)
+
+    # Members
+    async def get_task_members(self, task_id: str) -> models.Members:
+        """Get all members assigned to a specific task via a task id."""
+        model = "task/"
+        task_members = await self.__get_request(model, task_id, "member")
+        return self.__model(models.Members, task_members)
+
+    async def get_list_members(self, list_id: str) -> models.Members:
+        """Get all members assigned to a specific list via a list id."""
+        model = "list/"
+        task_members = await self.__get_request(model, list_id, "member")
+        return self.__model(models.Members, task_members)
+
+    # Goals
+    async def create_goal(
+        self,
+        team_id: str,
+        name: str,
+        due_date: Optional[str] = None,
+        description: Optional[str] = None,
+        multiple_owners: bool = True,
+        owners: Optional[List[int]] = None,
+        color: Optional[str] = None,
+    ) -> models.Goal:
+        """Create a new goal for a team given a team id."""
+        arguments = {}
+        arguments.update(vars())
+        arguments.pop("self", None)
+        arguments.pop("arguments", None)
+        arguments.pop("team_id", None)
+        arguments.pop("owners", None)
+
+        if multiple_owners and owners:
+            arguments.update({"owners": owners})
+
+        final_dict = {k: v for k, v in arguments.items() if v is not None}
+
+        model = "team/"
+        created_goal = await self.__post_request(model, final_dict, team_id, "goal")
+        return self.__model(models.Goal, created_goal)
+
+    async def update_goal(
+        self,
+        goal_id: str,
+        name: Optional[str] = None,
+        due_date: Optional[str] = None,
+        description: Optional[str] = None,
+        rem_owners: Optional[List[str]] = None,
+        add_owners: Optional[List[str]] = None,
+        color: Optional[str] = None,
+    ) -> models.Goal:
+        """Updates a goal via a given goal id."""
+        arguments = {}
+        arguments.update(vars())
+        arguments.pop("self", None)
+        arguments.pop("arguments", None)
+        arguments.pop("goal_id", None)
+
+        final_dict = {k: v for k, v in arguments.items() if v is not None}
+
+        model = "goal/"
+        updated_goal = await self.__put_request(model, final_dict, goal_id)
+        if updated_goal:
+            return self.__model(models.Goal, updated_goal)
+
+        raise exceptions.ClickupClientError("Failed to Update Goal.", None)
+
+    async def delete_goal(self, goal_id: str) -> bool:
+        """Delete a goal via a given goal id."""
+        model = "goal/"
+        await self.__delete_request(model, goal_id)
+        return True
+
+    async def get_goal(self, goal_id: str) -> models.Goal:
+        """Fetch a goal via a given goal id."""
+        model = "goal/"
+        fetched_goal = await self.__get_request(model, goal_id)
+        final_goal = self.__model(models.Goal, fetched_goal)
+        if final_goal:
+            return final_goal
+
+        raise exceptions.ClickupClientError("Failed to Get Goal.", None)
+
+    async def get_goals(
+        self, team_id: str, include_completed: bool = False
+    ) -> models.Goals:
+        """Returns a list of goals for a team via a given team id."""
+        model = "team/"
+        path = f"goal?include_completed={str(include_completed).lower()}"
+        fetched_goals = await self.__get_request(model, team_id, path)
+        return self.__model(models.Goals, fetched_goals)
+
+    # Tags
+    async def get_space_tags(self, space_id: str) -> models.Tags:
+        """Gets all tags from a ClickUp space given the space id."""
+        model = "space/"
+        fetched_tags = await self.__get_request(model, space_id, "tag")
+        final_tags = self.__model(models.Tags, fetched_tags)
+        if final_tags:
+            return final_tags
+
+        raise exceptions.ClickupClientError("Failed to Get Space Tags.", None)
+
+    async def create_space_tag(self, space_id: str, name: str) -> models.Tag:
+        """Creates a tag to be utilized in a space."""
+        final_dict = {"tag": {"name": name}}
+
+        model = "space/"
+        created_tag = await self.__post_request(model, final_dict, space_id, "tag")
+        return self.__model(models.Tag, created_tag)
+
+    async def tag_task(self, task_id: str, tag_name: str) -> bool:
+        """Adds an existing space tag to a task."""
+        model = "task/"
+        await self.__post_request(model, {}, task_id, "tag", tag_name, retry=True)
+        return True
+
+    async def untag_task(self, task_id: str, tag_name: str) -> bool:
+        """Removes a tag from a task."""
+        model = "task/"
+        await self.__delete_request(model, task_id, "tag", tag_name)
+        return True
+
+    # Spaces
+    async def create_space(
+        self, team_id: str, name: str, features: models.SpaceFeatures
+    ) -> models.Space:
+        """Creates a new ClickUp space."""
+        final_dict = {
+            "name": name,
+            "multiple_assignees": features.multiple_assignees,
+            "features": "",
+        }
+
+        model = "team/"
+        created_space = await self.__post_request(model, final_dict, team_id, "space")
+        if created_space:
+            return self.__model(models.Space, created_space)
+
+        raise exceptions.ClickupClientError("Failed to Create Space.", None)
+
+    async def delete_space(self, space_id: str) -> bool:
+        """Deletes a space via a given space id."""
+        model = "space/"
+        await self.__delete_request(model, space_id)
+        return True
+
+    async def get_space(self, space_id: str) -> models.Space:
+        """Fetches a single space via a given space id."""
+        model = "space/"
+        fetched_space = await self.__get_request(model, space_id)
+        return self.__model(models.Space, fetched_space)
+
+    async def get_spaces(self, team_id: str, archived: bool = False) -> models.Spaces:
+        """Fetches all spaces in a team via a given team id."""
+        path = f"space?archived={str(archived).lower()}"
+        model = "team/"
+        fetched_spaces = await self.__get_request(model, team_id, path)
+        return self.__model(models.Spaces, fetched_spaces)
+
+    # Shared Hierarchy
+    async def get_shared_hierarchy(self, team_id: str) -> models.SharedHierarchy:
+        """Returns all resources you have access to where you don't have access to its parent."""
+        model = "team/"
+        fetched_hierarchy = await self.__get_request(model, team_id, "shared")
+        if fetched_hierarchy:
+            return self.__model(models.SharedHierarchy, fetched_hierarchy)
+
+        raise exceptions.ClickupClientError("Failed to Get Shared Hierarchy.", None)
+
+    # Time Tracking
+    async def get_time_entries_in_range(
+        self,
+        team_id: str,
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None,
+        assignees: Optional[List[str]] = None,
+    ) -> models.TimeTrackingDataList:
+        """Gets a list of time tracking entries for a specific date range."""
+        startdate = "start_date="
+        enddate = "end_date="
+        assignees_temp = "assignee="
+
+        if start_date:
+            startdate = f"start_date={fuzzy_time_to_unix(start_date)}"
+
+        if end_date:
+            enddate = f"end_date={fuzzy_time_to_unix(end_date)}"
+
+        if assignees:
+            assignees_temp = f'assignee={",".join(assignees)}'
+
+        joined_url = f"time_entries?{startdate}&{enddate}&{assignees_temp}"
+        model = "team/"
+        fetched_time_data = await self.__get_request(model, team_id, joined_url)
+
+        if fetched_time_data:
+            return self.__model(models.TimeTrackingDataList, fetched_time_data)
+
+        raise exceptions.ClickupClientError(
+            "Failed to Get Time Entries in Range.", None
+        )
+
+    async def get_single_time_entry(
+        self, team_id: str, timer_id: str
+    ) -> models.TimeTrackingDataSingle:
+        """Gets a single time tracking object."""
+        model = "team/"
+        fetched_time_data = await self.__get_request(
+            model, team_id, "time_entries", timer_id
+        )
+        if fetched_time_data:
+            return self.__model(models.TimeTrackingDataSingle, fetched_time_data)
+
+        raise exceptions.ClickupClientError("Failed to Get Single Time Entry.", None)
+
+    async def start_timer(self, team_id: str, timer_id: str) -> models.TimeTrackingData:
+        """Starts the time tracking timer for a task via a timer id."""
+        model = "team/"
+        fetched_time_data = await self.__post_request(
+            model, {}, team_id, "time_entries/start", timer_id
+        )
+        if fetched_time_data:
+            return self.__model(models.TimeTrackingData, fetched_time_data)
+
+        raise exceptions.ClickupClientError("Failed to Start Timer.", None)
+
+    async def stop_timer(self, team_id: str) -> models.TimeTrackingData:
+        """Stops the time tracking timer for a task via a team id."""
+        model = "team/"
+        fetched_time_data = await self.__post_request(
+            model, {}, team_id, "time_entries/stop"
+        )
+        if fetched_time_data:
+            return self.__model(models.TimeTrackingData, fetched_time_data)
+
+        raise exceptions.ClickupClientError("Failed to Stop Timer.", None)
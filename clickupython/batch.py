@@ -0,0 +1,263 @@
+import asyncio
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from itertools import count
+from typing import Any, Callable, Iterable, Iterator, NamedTuple, Optional, Union
+
+from clickupython import exceptions
+
+
+@dataclass(frozen=True)
+class Call:
+    """A client method call queued in a batch, see call()."""
+
+    method: str
+    args: tuple[Any, ...] = ()
+    kwargs: dict[str, Any] = field(default_factory=dict)
+
+
+def call(method: str, *args: Any, **kwargs: Any) -> Call:
+    """Returns a Call of a client method by name, such as call("tag_task", task_id, "urgent")."""
+    return Call(method, args, kwargs)
+
+
+class BatchResult(NamedTuple):
+    """The return value, or the exception, of one call of a batch."""
+
+    index: int
+    call: Call
+    value: Any
+    error: Optional[BaseException]
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+class BatchProgress:
+    """Live counters of a running batch, safe to read from other threads.
+
+    Args:
+        :concurrency (int): The starting number of calls in flight.
+    """
+
+    def __init__(
+        self, concurrency: int, clock: Callable[[], float] = time.monotonic
+    ) -> None:
+        self.clock = clock
+        self.started = clock()
+        self.finished: Optional[float] = None
+        self.submitted = 0
+        self.completed = 0
+        self.failed = 0
+        self.in_flight = 0
+        # The current concurrency limit, lowered when the rate limit pushes back
+        self.concurrency = concurrency
+        self.lock = threading.Lock()
+
+    @property
+    def elapsed(self) -> float:
+        """Seconds since the batch started, up to when it finished."""
+        end = self.finished if self.finished is not None else self.clock()
+        return end - self.started
+
+    @property
+    def throughput(self) -> float:
+        """Completed calls per second."""
+        elapsed = self.elapsed
+        return self.completed / elapsed if elapsed > 0 else 0.0
+
+
+class _Throttle:
+    """Adapts the number of calls in flight to the rate limit.
+
+    The limit grows by one after every call that went through cleanly, halves when a
+    call was rate limited or had to be retried, and never exceeds the requests the
+    server still allows in the current window, summed over every token of a
+    MultiTokenClickUpClient.
+    """
+
+    def __init__(
+        self, client: Any, progress: BatchProgress, maximum: int, minimum: int
+    ) -> None:
+        self.client = client
+        self.progress = progress
+        self.maximum = max(1, maximum)
+        self.minimum = max(1, min(minimum, self.maximum))
+        self.retries = getattr(client, "retry_count", 0)
+
+    def allowed(self) -> int:
+        budget = self.client._prefetch_budget()
+        return max(self.minimum, min(self.progress.concurrency, budget))
+
+    def record(self, error: Optional[BaseException]) -> None:
+        progress = self.progress
+        with progress.lock:
+            retries = getattr(self.client, "retry_count", 0)
+            limited = retries > self.retries or (
+                isinstance(error, exceptions.ClickupClientError)
+                and error.status_code == 429
+            )
+            self.retries = retries
+            if limited:
+                progress.concurrency = max(self.minimum, progress.concurrency // 2)
+            elif error is None:
+                progress.concurrency = min(self.maximum, progress.concurrency + 1)
+            progress.in_flight -= 1
+            progress.completed += 1
+            if error is not None:
+                progress.failed += 1
+
+    def start(self) -> None:
+        with self.progress.lock:
+            self.progress.submitted += 1
+            self.progress.in_flight += 1
+
+
+def _resolve(client: Any, method: Union[str, Call]) -> Callable[..., Any]:
+    name = method.method if isinstance(method, Call) else method
+    if name.startswith("_") or not callable(getattr(client, name, None)):
+        raise exceptions.ClickupClientError(f"Unknown client method {name!r}.", None)
+    return getattr(client, name)  # type: ignore[no-any-return]
+
+
+class BatchExecutor:
+    """Runs many client calls concurrently, adapting the concurrency to the rate limit.
+
+    Calls are taken from the queue as slots free up, so a generator of thousands of
+    calls is never held in memory. Every call gets a BatchResult with its return
+    value or the exception it raised; a failing call does not stop the others.
+    `progress` holds live counters, including the current concurrency.
+
+    Args:
+        :client (ClickUpClient): The client whose methods are called.
+        :concurrency (int, optional): Maximum number of calls in flight. Defaults to 8.
+        :min_concurrency (int, optional): The concurrency is never lowered below this. Defaults to 1.
+        :on_progress (Callable[[BatchProgress], None], optional): Called after every finished call. Defaults to None.
+    """
+
+    def __init__(
+        self,
+        client: Any,
+        concurrency: int = 8,
+        min_concurrency: int = 1,
+        on_progress: Optional[Callable[[BatchProgress], None]] = None,
+    ) -> None:
+        self.client = client
+        self.on_progress = on_progress
+        self.progress = BatchProgress(max(1, concurrency))
+        self.throttle = _Throttle(client, self.progress, concurrency, min_concurrency)
+
+    def run(self, calls: Iterable[Call]) -> list[BatchResult]:
+        """Runs every call and returns the results in queue order.
+
+        Args:
+            :calls (Iterable[Call]): The calls to make, built with call().
+
+        Returns:
+            :list[BatchResult]: One result per call.
+        """
+        return sorted(self.iter_results(calls), key=lambda result: result.index)
+
+    def iter_results(self, calls: Iterable[Call]) -> Iterator[BatchResult]:
+        """Runs every call and yields each result as soon as it finishes."""
+        queue = zip(count(), calls)
+        pending: set[Future[BatchResult]] = set()
+        executor = ThreadPoolExecutor(
+            max_workers=self.throttle.maximum, thread_name_prefix="clickupython-batch"
+        )
+        try:
+            exhausted = False
+            while pending or not exhausted:
+                while not exhausted and len(pending) < self.throttle.allowed():
+                    queued = next(queue, None)
+                    if queued is None:
+                        exhausted = True
+                        break
+                    self.throttle.start()
+                    pending.add(executor.submit(self.__call, *queued))
+                if not pending:
+                    break
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    result = future.result()
+                    if self.on_progress is not None:
+                        self.on_progress(self.progress)
+                    yield result
+        finally:
+            for future in pending:
+                future.cancel()
+            executor.shutdown(wait=True, cancel_futures=True)
+            self.progress.finished = self.progress.clock()
+
+    def __call(self, index: int, queued: Call) -> BatchResult:
+        try:
+            value = _resolve(self.client, queued)(*queued.args, **queued.kwargs)
+        except Exception as error:
+            self.throttle.record(error)
+            return BatchResult(index, queued, None, error)
+        self.throttle.record(None)
+        return BatchResult(index, queued, value, None)
+
+
+class AsyncBatchExecutor:
+    """The asyncio counterpart of BatchExecutor, for AsyncClickUpClient.
+
+    Args:
+        :client (AsyncClickUpClient): The client whose coroutine methods are called.
+
+        The remaining arguments are the same as for BatchExecutor.
+    """
+
+    def __init__(
+        self,
+        client: Any,
+        concurrency: int = 8,
+        min_concurrency: int = 1,
+        on_progress: Optional[Callable[[BatchProgress], None]] = None,
+    ) -> None:
+        self.client = client
+        self.on_progress = on_progress
+        self.progress = BatchProgress(max(1, concurrency))
+        self.throttle = _Throttle(client, self.progress, concurrency, min_concurrency)
+
+    async def run(self, calls: Iterable[Call]) -> list[BatchResult]:
+        """Runs every call and returns the results in queue order. See BatchExecutor.run."""
+        results: list[BatchResult] = []
+        queue = zip(count(), calls)
+        pending: set[asyncio.Task[BatchResult]] = set()
+        try:
+            exhausted = False
+            while pending or not exhausted:
+                while not exhausted and len(pending) < self.throttle.allowed():
+                    queued = next(queue, None)
+                    if queued is None:
+                        exhausted = True
+                        break
+                    self.throttle.start()
+                    pending.add(asyncio.ensure_future(self.__call(*queued)))
+                if not pending:
+                    break
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    results.append(task.result())
+                    if self.on_progress is not None:
+                        self.on_progress(self.progress)
+        finally:
+            for task in pending:
+                task.cancel()
+            self.progress.finished = self.progress.clock()
+        return sorted(results, key=lambda result: result.index)
+
+    async def __call(self, index: int, queued: Call) -> BatchResult:
+        try:
+            value = await _resolve(self.client, queued)(*queued.args, **queued.kwargs)
+        except Exception as error:
+            self.throttle.record(error)
+            return BatchResult(index, queued, None, error)
+        self.throttle.record(None)
+        return BatchResult(index, queued, value, None)
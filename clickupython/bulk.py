@@ -0,0 +1,273 @@
+import csv
+import inspect
+import json
+import os
+import tempfile
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from itertools import count
+from typing import IO, Any, Iterable, Iterator, NamedTuple, Optional, Union
+
+import requests
+
+from clickupython import exceptions
+from clickupython import models
+from clickupython.helpers.timefuncs import fuzzy_time_to_unix
+
+# Task spec columns holding several values, separated by LIST_SEPARATOR in CSV files
+LIST_COLUMNS = ("assignees", "tags")
+LIST_SEPARATOR = ";"
+
+
+class ImportResult(NamedTuple):
+    """The outcome of one row of a TaskImporter run."""
+
+    row: int
+    spec: dict[str, Any]
+    task: Optional[models.Task]
+    error: Optional[Exception]
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+def read_task_specs(
+    source: Union[str, IO[str]], format: Optional[str] = None
+) -> Iterator[dict[str, Any]]:
+    """Lazily reads task specs, the keyword arguments of create_task, from a CSV or JSON Lines file.
+
+    CSV columns are create_task arguments. Empty cells are left out, numeric
+    priorities are read as ints, and assignees and tags are split on ";" with numeric
+    assignees read as user ids. Each JSON Lines row is one JSON object and is used as
+    is. Values are not validated here: a bad cell fails its own row when imported.
+
+    Args:
+        :source (str | file): A path, or an open text file.
+        :format (str, optional): "csv" or "jsonl". Defaults to None (from the file extension).
+
+    Yields:
+        :dict: One task spec per row.
+    """
+    if format is None:
+        name = source if isinstance(source, str) else getattr(source, "name", "")
+        format = "csv" if str(name).lower().endswith(".csv") else "jsonl"
+    if format not in ("csv", "jsonl"):
+        raise exceptions.ClickupClientError(
+            f"Unknown task spec format {format!r}, expected 'csv' or 'jsonl'.", None
+        )
+
+    if isinstance(source, str):
+        with open(source, newline="", encoding="utf-8") as file:
+            yield from _read_specs(file, format)
+    else:
+        yield from _read_specs(source, format)
+
+
+def _read_specs(file: IO[str], format: str) -> Iterator[dict[str, Any]]:
+    if format == "jsonl":
+        for line in file:
+            if line.strip():
+                yield json.loads(line)
+        return
+    for row in csv.DictReader(file):
+        yield {
+            column: _csv_value(column, value)
+            for column, value in row.items()
+            if column and value not in (None, "")
+        }
+
+
+def _csv_value(column: str, value: str) -> Any:
+    if column in LIST_COLUMNS:
+        values = [item.strip() for item in value.split(LIST_SEPARATOR)]
+        return [
+            int(item) if column == "assignees" and item.isdigit() else item
+            for item in values
+            if item
+        ]
+    if column == "priority" and value.strip().isdigit():
+        return int(value)
+    if column == "notify_all":
+        return value.strip().lower() in ("1", "true", "yes")
+    return value
+
+
+class TaskImporter:
+    """Creates tasks in bulk from an iterable of task specs.
+
+    Rows are created by up to `concurrency` threads at a time, each request still
+    waiting for the client's rate limiter, so an import runs as fast as the rate
+    limit allows rather than one round trip at a time. Results are yielded in input
+    order, and a row that fails is reported with its error, usually a
+    ClickupClientError, without stopping the rest.
+
+    With a checkpoint file, every finished row is recorded as it completes and a
+    later run over the same input skips the rows already created and retries the
+    rows that failed, so an interrupted import can be resumed without creating tasks
+    twice.
+
+    Fuzzy due dates such as "next friday" are converted once per distinct value per
+    run instead of once per row.
+
+    Args:
+        :client (ClickUpClient): The client used to create tasks.
+        :concurrency (int, optional): Maximum number of rows in flight. Defaults to 8.
+        :checkpoint (str, optional): Path of the checkpoint file. Defaults to None.
+    """
+
+    def __init__(
+        self, client: Any, concurrency: int = 8, checkpoint: Optional[str] = None
+    ) -> None:
+        self.client = client
+        self.concurrency = max(1, concurrency)
+        self.checkpoint = checkpoint
+
+        self.created = 0
+        self.failed = 0
+        self.skipped = 0
+
+        self.__lock = threading.Lock()
+        self.__arguments = set(inspect.signature(client.create_task).parameters)
+        self.__dates: dict[str, str] = {}
+        # Rows before this one are all finished; finished rows past it are in __done
+        self.__next_row = 0
+        self.__done: set[int] = set()
+        # Finished rows that failed, retried by the next run
+        self.__failed: set[int] = set()
+
+    def run(
+        self, specs: Iterable[dict[str, Any]], list_id: Optional[str] = None
+    ) -> Iterator[ImportResult]:
+        """Creates a task for every spec and yields the results in input order.
+
+        Specs are consumed lazily, so a large file read with read_task_specs is never
+        held in memory. Rows created in an earlier run with the same checkpoint are
+        skipped and not yielded again; rows that failed are retried.
+
+        Args:
+            :specs (Iterable[dict]): create_task keyword arguments, one dict per task.
+            :list_id (str, optional): The list for specs without a list_id. Defaults to None.
+
+        Yields:
+            :ImportResult: The created task, or the error, of each row.
+        """
+        self.__load_checkpoint()
+        rows = (
+            (row, spec)
+            for row, spec in zip(count(), specs)
+            if row in self.__failed
+            or (row >= self.__next_row and row not in self.__done)
+        )
+        # Insertion ordered, so the first entry is always the next row to yield
+        in_flight: dict[int, Future[ImportResult]] = {}
+        executor = ThreadPoolExecutor(
+            max_workers=self.concurrency, thread_name_prefix="clickupython-import"
+        )
+        try:
+            for row, spec in rows:
+                in_flight[row] = executor.submit(self.__create, row, spec, list_id)
+                if len(in_flight) >= self.concurrency:
+                    yield in_flight.pop(next(iter(in_flight))).result()
+            while in_flight:
+                yield in_flight.pop(next(iter(in_flight))).result()
+        finally:
+            # Rows not yet started are not recorded, so resuming picks them up
+            for future in in_flight.values():
+                future.cancel()
+            executor.shutdown(wait=True, cancel_futures=True)
+
+    def __create(
+        self, row: int, spec: dict[str, Any], list_id: Optional[str]
+    ) -> ImportResult:
+        try:
+            task = self.client.create_task(**self.__arguments_of(spec, list_id))
+        except exceptions.ClickupClientError as error:
+            result = ImportResult(row, spec, None, error)
+        except requests.RequestException as error:
+            result = ImportResult(
+                row, spec, None, exceptions.ClickupClientError(str(error), None)
+            )
+        except Exception as error:
+            # Such as a spec value the models reject; only this row fails
+            result = ImportResult(row, spec, None, error)
+        else:
+            result = ImportResult(row, spec, task, None)
+        self.__finish(result)
+        return result
+
+    def __arguments_of(
+        self, spec: dict[str, Any], list_id: Optional[str]
+    ) -> dict[str, Any]:
+        arguments = {"list_id": list_id, **spec}
+        unknown = sorted(set(arguments) - self.__arguments)
+        if unknown:
+            raise exceptions.ClickupClientError(
+                f"Unknown task spec fields: {unknown}", None
+            )
+        if not arguments.get("list_id") or not arguments.get("name"):
+            raise exceptions.ClickupClientError(
+                "A task spec needs a list_id and a name.", None
+            )
+        priority = arguments.get("priority")
+        if priority is not None and (
+            isinstance(priority, bool) or not isinstance(priority, int)
+        ):
+            raise exceptions.ClickupClientError(
+                f"A task priority must be an integer, not {priority!r}.", None
+            )
+        due_date = arguments.get("due_date")
+        if isinstance(due_date, str) and due_date and not due_date.isdigit():
+            arguments["due_date"] = self.__unix_date(due_date)
+        return arguments
+
+    def __unix_date(self, text: str) -> str:
+        converted = self.__dates.get(text)
+        if converted is None:
+            converted = self.__dates[text] = fuzzy_time_to_unix(text)
+        return converted
+
+    def __finish(self, result: ImportResult) -> None:
+        with self.__lock:
+            if result.ok:
+                self.created += 1
+                self.__failed.discard(result.row)
+            else:
+                self.failed += 1
+                self.__failed.add(result.row)
+            # A retried row may already be behind __next_row
+            if result.row >= self.__next_row:
+                self.__done.add(result.row)
+            while self.__next_row in self.__done:
+                self.__done.remove(self.__next_row)
+                self.__next_row += 1
+            self.__save_checkpoint()
+
+    def __load_checkpoint(self) -> None:
+        with self.__lock:
+            self.__next_row = 0
+            self.__done = set()
+            self.__failed = set()
+            if self.checkpoint is None or not os.path.exists(self.checkpoint):
+                return
+            with open(self.checkpoint, encoding="utf-8") as file:
+                state = json.load(file)
+            self.__next_row = state["next_row"]
+            self.__done = set(state["done"])
+            self.__failed = set(state.get("failed", ()))
+            self.skipped = self.__next_row + len(self.__done) - len(self.__failed)
+
+    def __save_checkpoint(self) -> None:
+        if self.checkpoint is None:
+            return
+        state = {
+            "next_row": self.__next_row,
+            "done": sorted(self.__done),
+            "failed": sorted(self.__failed),
+        }
+        # Written to a temporary file and renamed, so a crash never leaves half a checkpoint
+        directory = os.path.dirname(os.path.abspath(self.checkpoint))
+        fd, path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+        with os.fdopen(fd, "w", encoding="utf-8") as file:
+            json.dump(state, file)
+        os.replace(path, self.checkpoint)
@@ -0,0 +1,417 @@
+import hashlib
+import os
+import posixpath
+import sqlite3
+import threading
+import time
+import zlib
+from abc import abstractmethod
+from collections import OrderedDict
+from typing import Callable, Mapping, NamedTuple, Optional
+
+# Seconds to keep responses per endpoint. Endpoints are the resource names of a path
+# without its ids, so "space/123/tag" is "space/tag". Endpoints not listed use the
+# cache's default_ttl, which is 0 (not cached) unless changed.
+DEFAULT_TTLS: Mapping[str, float] = {
+    "task": 30,
+    "task/comment": 30,
+    "team": 600,
+    "team/space": 300,
+    "space": 300,
+    "space/tag": 300,
+    "space/folder": 300,
+    "space/list": 300,
+    "folder": 300,
+    "list": 300,
+    "list/field": 300,
+}
+
+# Resources whose bodies embed another resource, so writes to the embedded one
+# also make them stale: folders embed their lists and tasks their checklists.
+EMBEDDED_IN: Mapping[str, tuple[str, ...]] = {
+    "list": ("folder",),
+    "checklist": ("task",),
+}
+
+
+class CacheStats(NamedTuple):
+    """Counters reported by a response cache."""
+
+    hits: int
+    misses: int
+    evictions: int
+    invalidations: int
+    size: int
+    bytes: int = 0
+
+
+def cache_key(model: str, *additionalpath: str, scope: Optional[str] = None) -> str:
+    """Returns the path of a request relative to the API URL, used as its cache key.
+
+    A scope, such as token_scope() of the request's access token, is appended after a
+    "#" so that clients sharing a cache never read each other's responses. Writes
+    still invalidate the path under every scope.
+    """
+    suffix = "/".join([x for x in additionalpath if x is not None])
+    path = posixpath.join(model, suffix).strip("/")
+    return f"{path}#{scope}" if scope else path
+
+
+def token_scope(*accesstokens: str) -> str:
+    """Returns the cache key scope of the responses readable with these access tokens."""
+    digest = hashlib.sha256("\n".join(sorted(accesstokens)).encode("utf-8"))
+    return digest.hexdigest()[:16]
+
+
+def endpoint(key: str) -> str:
+    """Returns the endpoint of a cache key: its resource names without ids or query."""
+    segments = _path(key).split("?", 1)[0].strip("/").split("/")
+    return "/".join(segments[::2])
+
+
+def is_affected(key: str, write_path: str) -> bool:
+    """Returns True if a cached response may be stale after a write to write_path.
+
+    A write makes stale every cached response under each resource named in its path
+    ("task/abc/tag/x" affects everything under "task/abc", "list/1/task/abc" both
+    "list/1" and "task/abc"), every listing of the resource types in its path (such
+    as "list/1/task" or "team/1/task" for task writes), and every resource that
+    embeds one of those types.
+    """
+    key = _path(key)
+    write_segments = write_path.split("?", 1)[0].strip("/").split("/")
+    for index in range(0, len(write_segments) - 1, 2):
+        resource = "/".join(write_segments[index : index + 2])
+        if key == resource or key.startswith((resource + "/", resource + "?")):
+            return True
+
+    written_types = write_segments[::2]
+    key_types = endpoint(key).split("/")
+    if len(key_types) > 1 and key_types[-1] in written_types:
+        return True
+    return any(
+        key_types[-1] in EMBEDDED_IN.get(resource_type, ())
+        for resource_type in written_types
+    )
+
+
+def _path(key: str) -> str:
+    """Returns a cache key without its scope."""
+    return key.split("#", 1)[0]
+
+
+class BaseCache:
+    """Common behaviour of the GET response caches: per-endpoint TTLs and counters.
+
+    Subclasses store raw response bodies by cache key and implement get, set,
+    invalidate and clear. Any subclass can be passed as the cache of a ClickUpClient.
+
+    Args:
+        :ttls (Mapping[str, float], optional): Seconds to keep responses per endpoint. Defaults to DEFAULT_TTLS.
+        :default_ttl (float, optional): Seconds to keep responses of endpoints not in ttls. Defaults to 0.
+    """
+
+    def __init__(
+        self,
+        ttls: Mapping[str, float] = DEFAULT_TTLS,
+        default_ttl: float = 0.0,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self.ttls = dict(ttls)
+        self.default_ttl = default_ttl
+        self.clock = clock
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+        self.lock = threading.Lock()
+
+    @property
+    def stats(self) -> CacheStats:
+        return CacheStats(
+            self.hits,
+            self.misses,
+            self.evictions,
+            self.invalidations,
+            self._size(),
+        )
+
+    def ttl_for(self, key: str) -> float:
+        """Returns how many seconds a response for this key is kept."""
+        return self.ttls.get(endpoint(key), self.default_ttl)
+
+    @abstractmethod
+    def get(self, key: str) -> Optional[bytes]:
+        """Returns the cached body for a key, or None if it is missing or expired."""
+
+    @abstractmethod
+    def set(self, key: str, body: bytes) -> None:
+        """Stores a response body, unless its endpoint is not cached."""
+
+    @abstractmethod
+    def invalidate(self, write_path: str) -> int:
+        """Drops every entry that may be stale after a write and returns how many were dropped."""
+
+    @abstractmethod
+    def clear(self) -> None: ...
+
+    @abstractmethod
+    def _size(self) -> int: ...
+
+    def _count(self, hit: bool) -> None:
+        with self.lock:
+            if hit:
+                self.hits += 1
+            else:
+                self.misses += 1
+
+
+class ResponseCache(BaseCache):
+    """An in-memory LRU cache of GET response bodies for ClickUpClient.
+
+    Responses are kept for the TTL of their endpoint and the least recently used ones
+    are evicted once maxsize entries are stored. The client invalidates affected
+    entries after every POST, PUT and DELETE it sends, so cached reads do not outlive
+    the client's own writes. Changes made by other clients are picked up when the
+    TTL expires.
+
+    Args:
+        :maxsize (int, optional): Maximum number of responses kept. Defaults to 1024.
+        :ttls (Mapping[str, float], optional): Seconds to keep responses per endpoint. Defaults to DEFAULT_TTLS.
+        :default_ttl (float, optional): Seconds to keep responses of endpoints not in ttls. Defaults to 0.
+    """
+
+    def __init__(
+        self,
+        maxsize: int = 1024,
+        ttls: Mapping[str, float] = DEFAULT_TTLS,
+        default_ttl: float = 0.0,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        super().__init__(ttls, default_ttl, clock)
+        self.maxsize = maxsize
+        self.entries: OrderedDict[str, tuple[float, bytes]] = OrderedDict()
+
+    def get(self, key: str) -> Optional[bytes]:
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is None or entry[0] <= self.clock():
+                if entry is not None:
+                    del self.entries[key]
+                self.misses += 1
+                return None
+            self.entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+    def set(self, key: str, body: bytes) -> None:
+        ttl = self.ttl_for(key)
+        if ttl <= 0 or self.maxsize <= 0:
+            return
+        with self.lock:
+            self.entries[key] = (self.clock() + ttl, body)
+            self.entries.move_to_end(key)
+            while len(self.entries) > self.maxsize:
+                self.entries.popitem(last=False)
+                self.evictions += 1
+
+    def invalidate(self, write_path: str) -> int:
+        with self.lock:
+            stale = [key for key in self.entries if is_affected(key, write_path)]
+            for key in stale:
+                del self.entries[key]
+            self.invalidations += len(stale)
+            return len(stale)
+
+    def clear(self) -> None:
+        with self.lock:
+            self.entries.clear()
+
+    def _size(self) -> int:
+        return len(self.entries)
+
+
+class DiskCache(BaseCache):
+    """A persistent cache of GET response bodies in a SQLite file on local disk.
+
+    Short-lived processes can share the file and start warm: a restarted job serves
+    teams, spaces, folders, lists and custom field definitions from disk until their
+    TTL expires. Bodies are stored zlib compressed with their fetch time and TTL. The
+    database runs in WAL mode, so several processes can read while one writes. Once
+    the stored bodies exceed max_bytes, expired entries and then those closest to
+    expiry are evicted.
+
+    Args:
+        :path (str, optional): The SQLite file. Defaults to ~/.cache/clickupython/responses.sqlite3.
+        :max_bytes (int, optional): Upper bound for the compressed bodies stored. Defaults to 64 MiB.
+        :ttls (Mapping[str, float], optional): Seconds to keep responses per endpoint. Defaults to DEFAULT_TTLS.
+        :default_ttl (float, optional): Seconds to keep responses of endpoints not in ttls. Defaults to 0.
+        :compression_level (int, optional): zlib level used for stored bodies. Defaults to 6.
+    """
+
+    def __init__(
+        self,
+        path: Optional[str] = None,
+        max_bytes: int = 64 * 1024 * 1024,
+        ttls: Mapping[str, float] = DEFAULT_TTLS,
+        default_ttl: float = 0.0,
+        compression_level: int = 6,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        super().__init__(ttls, default_ttl, clock)
+        self.path = path or os.path.join(
+            os.path.expanduser("~"), ".cache", "clickupython", "responses.sqlite3"
+        )
+        self.max_bytes = max_bytes
+        self.compression_level = compression_level
+        self.__local = threading.local()
+
+        directory = os.path.dirname(os.path.abspath(self.path))
+        os.makedirs(directory, mode=0o700, exist_ok=True)
+        with self.__connection() as connection:
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS responses ("
+                "key TEXT PRIMARY KEY, body BLOB NOT NULL, fetched REAL NOT NULL, "
+                "ttl REAL NOT NULL, size INTEGER NOT NULL)"
+            )
+
+    def get(self, key: str) -> Optional[bytes]:
+        row = (
+            self.__connection()
+            .execute("SELECT body, fetched, ttl FROM responses WHERE key = ?", (key,))
+            .fetchone()
+        )
+        if row is None or row[1] + row[2] <= self.clock():
+            self._count(hit=False)
+            return None
+        self._count(hit=True)
+        return zlib.decompress(row[0])
+
+    def set(self, key: str, body: bytes) -> None:
+        ttl = self.ttl_for(key)
+        if ttl <= 0:
+            return
+        compressed = zlib.compress(body, self.compression_level)
+        if len(compressed) > self.max_bytes:
+            return
+        with self.__connection() as connection:
+            connection.execute(
+                "INSERT OR REPLACE INTO responses (key, body, fetched, ttl, size) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (key, compressed, self.clock(), ttl, len(compressed)),
+            )
+            self.__evict(connection)
+
+    def invalidate(self, write_path: str) -> int:
+        with self.__connection() as connection:
+            dropped = connection.execute(
+                "DELETE FROM responses WHERE is_affected(key, ?)", (write_path,)
+            ).rowcount
+        with self.lock:
+            self.invalidations += dropped
+        return dropped
+
+    def clear(self) -> None:
+        with self.__connection() as connection:
+            connection.execute("DELETE FROM responses")
+
+    def close(self) -> None:
+        """Closes the calling thread's connection to the database."""
+        connection = getattr(self.__local, "connection", None)
+        if connection is not None:
+            connection.close()
+            self.__local.connection = None
+
+    @property
+    def stats(self) -> CacheStats:
+        count, total = (
+            self.__connection()
+            .execute("SELECT COUNT(*), COALESCE(SUM(size), 0) FROM responses")
+            .fetchone()
+        )
+        return CacheStats(
+            self.hits, self.misses, self.evictions, self.invalidations, count, total
+        )
+
+    def _size(self) -> int:
+        return self.stats.size
+
+    def __connection(self) -> sqlite3.Connection:
+        """Internal method returning the calling thread's connection, opening it on first use."""
+        connection = getattr(self.__local, "connection", None)
+        if connection is None:
+            # Wait on writers from other processes instead of failing with "database is locked"
+            connection = sqlite3.connect(self.path, timeout=30)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            connection.create_function(
+                "is_affected", 2, is_affected, deterministic=True
+            )
+            self.__local.connection = connection
+        return connection
+
+    def __evict(self, connection: sqlite3.Connection) -> None:
+        (total,) = connection.execute(
+            "SELECT COALESCE(SUM(size), 0) FROM responses"
+        ).fetchone()
+        excess = total - self.max_bytes
+        if excess <= 0:
+            return
+
+        stale = []
+        for key, size in connection.execute(
+            "SELECT key, size FROM responses ORDER BY fetched + ttl"
+        ):
+            stale.append((key,))
+            excess -= size
+            if excess <= 0:
+                break
+        connection.executemany("DELETE FROM responses WHERE key = ?", stale)
+        with self.lock:
+            self.evictions += len(stale)
+
+
+class TieredCache(BaseCache):
+    """Checks a fast cache before a slower, larger one, such as a ResponseCache in
+    front of a DiskCache. Hits in a later tier are copied into the earlier ones, and
+    writes and invalidations go to every tier.
+
+    Args:
+        :tiers (BaseCache): The caches to use, fastest first.
+    """
+
+    def __init__(self, *tiers: BaseCache) -> None:
+        super().__init__()
+        self.tiers = tiers
+
+    def ttl_for(self, key: str) -> float:
+        return max(tier.ttl_for(key) for tier in self.tiers)
+
+    def get(self, key: str) -> Optional[bytes]:
+        for index, tier in enumerate(self.tiers):
+            body = tier.get(key)
+            if body is not None:
+                for faster in self.tiers[:index]:
+                    faster.set(key, body)
+                self._count(hit=True)
+                return body
+        self._count(hit=False)
+        return None
+
+    def set(self, key: str, body: bytes) -> None:
+        for tier in self.tiers:
+            tier.set(key, body)
+
+    def invalidate(self, write_path: str) -> int:
+        dropped = sum(tier.invalidate(write_path) for tier in self.tiers)
+        with self.lock:
+            self.invalidations += dropped
+        return dropped
+
+    def clear(self) -> None:
+        for tier in self.tiers:
+            tier.clear()
+
+    def _size(self) -> int:
+        return sum(tier.stats.size for tier in self.tiers)
@@ -0,0 +1,86 @@
+from collections import OrderedDict
+from typing import NamedTuple, Optional
+
+from clickupython import models
+
+CREATED = "created"
+UPDATED = "updated"
+CLOSED = "closed"
+
+
+class TaskChange(NamedTuple):
+    """A change to a task seen by watch_team_tasks.
+
+    kind is "created", "updated" or "closed". changed_fields lists the task fields
+    that differ from the last version seen; it is None when no earlier version was
+    seen, such as for tasks changed before the watch started.
+    """
+
+    kind: str
+    task: models.Task
+    changed_fields: Optional[list[str]]
+    previous: Optional[models.Task]
+
+
+def is_closed(task: models.Task) -> bool:
+    return bool(task.date_closed) or (
+        task.status is not None and task.status.type == "closed"
+    )
+
+
+class TaskChangeTracker:
+    """Turns polled tasks into TaskChange events and keeps the date_updated watermark.
+
+    The last seen version of up to max_snapshots tasks is kept to report which
+    fields changed and to skip tasks that were already reported.
+
+    Args:
+        :watermark (int): date_updated (in ms) before which changes are not reported.
+        :max_snapshots (int, optional): Number of task versions kept. Defaults to 10000.
+    """
+
+    def __init__(self, watermark: int, max_snapshots: int = 10000) -> None:
+        self.watermark = watermark
+        self.since = watermark
+        self.max_snapshots = max_snapshots
+        self.snapshots: OrderedDict[str, models.Task] = OrderedDict()
+
+    def begin(self) -> int:
+        """Starts a poll and returns the date_updated watermark it should request tasks after."""
+        self.since = self.watermark
+        return self.since
+
+    def observe(self, task: models.Task) -> Optional[TaskChange]:
+        """Records a polled task and returns its change, or None if it was already seen."""
+        date_updated = int(task.date_updated or 0)
+        previous = self.snapshots.get(task.id)  # type: ignore[arg-type]
+        if previous is not None and previous.date_updated == task.date_updated:
+            return None
+        if previous is None and date_updated < self.since:
+            return None
+
+        self.snapshots[task.id] = task  # type: ignore[index]
+        self.snapshots.move_to_end(task.id)  # type: ignore[arg-type]
+        while len(self.snapshots) > self.max_snapshots:
+            self.snapshots.popitem(last=False)
+        self.watermark = max(self.watermark, date_updated)
+
+        changed_fields = None
+        if previous is not None:
+            before = previous.model_dump()
+            after = task.model_dump()
+            changed_fields = [
+                field
+                for field in after
+                if field != "date_updated" and after[field] != before.get(field)
+            ]
+
+        if is_closed(task) and (previous is None or not is_closed(previous)):
+            if (
+                previous is not None
+                or int(task.date_closed or date_updated) >= self.since
+            ):
+                return TaskChange(CLOSED, task, changed_fields, previous)
+        if previous is None and int(task.date_created or 0) >= self.since:
+            return TaskChange(CREATED, task, None, None)
+        return TaskChange(UPDATED, task, changed_fields, previous)
@@ -1,21 +1,163 @@
 import requests
+from requests.adapters import HTTPAdapter
 import urllib
 import urllib.parse
 import os
 import json
+import itertools
 import ntpath
-from typing import Any, List, Optional
-from time import sleep
+import threading
+import time
+from typing import (
+    Any,
+    Callable,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    TypeVar,
+    Union,
+)
 from datetime import datetime
 
 from clickupython.helpers.timefuncs import fuzzy_time_to_unix
 from clickupython.helpers import formatting
 from clickupython import models
 from clickupython import exceptions
+from clickupython.batch import BatchExecutor, BatchProgress, BatchResult, Call
+from clickupython.cache import BaseCache, cache_key, token_scope
+from clickupython.changes import TaskChange, TaskChangeTracker
+from clickupython.codec import JSONCodec, default_codec
+from clickupython.interning import Interner
+from clickupython.pagination import iter_pages
+from clickupython.streaming import TaskStream
+from clickupython.uploads import MultipartFile, Progress, upload_calls
+from clickupython.ratelimit import RateLimitState, SharedTokenBucket, TokenBucket
+from clickupython.retry import RETRY_STATUSES, RetryPolicy
 
 
 API_URL = "https://api.clickup.com/api/v2/"
 
+# Bytes read from the socket at a time when streaming task pages
+STREAM_CHUNK_SIZE = 64 * 1024
+
+M = TypeVar("M")
+
+
+def task_query(
+    supplied_values: List[str],
+    order_by: str = "created",
+    subtasks: bool = False,
+    statuses: Optional[List[str]] = None,
+    assignees: Optional[List[str]] = None,
+    due_date_gt: Optional[str] = None,
+    due_date_lt: Optional[str] = None,
+    date_created_gt: Optional[str] = None,
+    date_created_lt: Optional[str] = None,
+    date_updated_gt: Optional[str] = None,
+    date_updated_lt: Optional[str] = None,
+    space_ids: Optional[List[str]] = None,
+    project_ids: Optional[List[str]] = None,
+    list_ids: Optional[List[str]] = None,
+) -> str:
+    """Builds the "task?..." path used by the list and team task endpoints.
+
+    Args:
+        :supplied_values (List[str]): Endpoint specific query values that lead the query string.
+
+    Raises:
+        :exceptions.ClickupClientError: Invalid order_by value
+
+    Returns:
+        :str: The task path including its query string.
+    """
+    if order_by not in ["id", "created", "updated", "due_date"]:
+        raise exceptions.ClickupClientError(
+            "Options are: id, created, updated, due_date", "Invalid order_by value"
+        )
+
+    supplied_values = list(supplied_values)
+
+    if statuses:
+        supplied_values.append(
+            f"{urllib.parse.quote_plus('statuses[]')}={','.join(statuses)}"
+        )
+    if assignees:
+        supplied_values.append(
+            f"{urllib.parse.quote_plus('assignees[]')}={','.join(assignees)}"
+        )
+    if due_date_gt:
+        supplied_values.append(f"due_date_gt={fuzzy_time_to_unix(due_date_gt)}")
+    if due_date_lt:
+        supplied_values.append(f"due_date_lt={fuzzy_time_to_unix(due_date_lt)}")
+    if space_ids:
+        supplied_values.append(
+            f"{urllib.parse.quote_plus('space_ids[]')}={','.join(space_ids)}"
+        )
+    if project_ids:
+        supplied_values.append(
+            f"{urllib.parse.quote_plus('project_ids[]')}={','.join(project_ids)}"
+        )
+    if list_ids:
+        supplied_values.append(
+            f"{urllib.parse.quote_plus('list_ids[]')}={','.join(list_ids)}"
+        )
+    if date_created_gt:
+        supplied_values.append(f"date_created_gt={date_created_gt}")
+    if date_created_lt:
+        supplied_values.append(f"date_created_lt={date_created_lt}")
+    if date_updated_gt:
+        supplied_values.append(f"date_updated_gt={date_updated_gt}")
+    if date_updated_lt:
+        supplied_values.append(f"date_updated_lt={date_updated_lt}")
+    if subtasks:
+        supplied_values.append(f"subtasks=true")
+
+    return f"task?{'&'.join(supplied_values)}"
+
+
+def list_tasks_query(
+    archived: bool,
+    page: int,
+    order_by: str,
+    reverse: bool,
+    include_closed: bool,
+    **filters: Any,
+) -> str:
+    """Builds the task path of the list tasks endpoint. filters are passed to task_query."""
+    return task_query(
+        [
+            f"archived={str(archived).lower()}",
+            f"page={page}",
+            f"order_by={order_by}",
+            f"reverse={str(reverse).lower()}",
+            f"include_closed={str(include_closed).lower()}",
+        ],
+        order_by=order_by,
+        **filters,
+    )
+
+
+def team_tasks_query(
+    page: int,
+    order_by: str,
+    reverse: bool,
+    include_closed: bool,
+    **filters: Any,
+) -> str:
+    """Builds the task path of the team tasks endpoint. filters are passed to task_query."""
+    return task_query(
+        [
+            f"page={page}",
+            f"order_by={order_by}",
+            f"reverse={str(reverse).lower()}",
+            f"include_closed={str(include_closed).lower()}",
+        ],
+        order_by=order_by,
+        **filters,
+    )
+
 
 class ClickUpClient:
     def __init__(
@@ -29,7 +171,65 @@ class ClickUpClient:
         rate_limit_buffer_wait_time: int = 5,
         start_rate_limit_remaining: int = 100,
         start_rate_limit_reset: float = datetime.now().timestamp(),
+        pool_connections: int = 10,
+        pool_maxsize: int = 10,
+        pool_block: bool = False,
+        keep_alive: bool = True,
+        connect_timeout: float = 5.0,
+        read_timeout: float = 30.0,
+        rate_limit_burst: int = 10,
+        shared_rate_limit: bool = False,
+        rate_limiter: Optional[TokenBucket] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        cache: Optional[BaseCache] = None,
+        json_codec: Optional[JSONCodec] = None,
+        lazy_models: bool = False,
+        validate: bool = True,
+        validation_sampling: int = 0,
+        strict: bool = True,
+        interning: Optional[str] = None,
     ):
+        """Creates a new client for the ClickUp API.
+
+        All requests made by the client share a pooled, keep-alive HTTP session, so
+        repeated calls reuse open connections instead of paying a new TCP and TLS
+        handshake each time. Call close() (or use the client as a context manager)
+        to release the pooled connections.
+
+        Args:
+            :accesstoken (str): The personal or OAuth access token used to authenticate.
+            :pool_connections (int, optional): Number of per-host connection pools to cache. Defaults to 10.
+            :pool_maxsize (int, optional): Maximum number of connections kept open per host. Defaults to 10.
+            :pool_block (bool, optional): Block instead of opening extra connections once a host has pool_maxsize connections in use. Defaults to False.
+            :keep_alive (bool, optional): Keep connections open between requests. Defaults to True.
+            :connect_timeout (float, optional): Seconds to wait for a connection to be established. Defaults to 5.0.
+            :read_timeout (float, optional): Seconds to wait for the server to send a response. Defaults to 30.0.
+            :rate_limit_burst (int, optional): Requests that may be sent back to back before the
+                rate limiter starts spacing them out. Defaults to 10.
+            :shared_rate_limit (bool, optional): Share one rate-limit budget with every other client
+                on this host that uses the same access token, across processes. Defaults to False.
+            :rate_limiter (TokenBucket, optional): A rate limiter to use instead of creating one. Defaults to None.
+            :retry_policy (RetryPolicy, optional): Controls how failed requests are retried. Defaults to
+                three attempts with jittered exponential backoff for connection errors and 5xx responses,
+                plus 429 responses when retry_rate_limited_requests is True.
+            :cache (BaseCache, optional): Cache for GET responses, such as a ResponseCache or DiskCache.
+                Entries are kept per access token, and those affected by the client's own writes are
+                invalidated automatically, even when the write fails. Defaults to None (no caching).
+            :json_codec (JSONCodec, optional): Decodes responses and encodes request bodies. Defaults to
+                orjson when it is installed and the json module otherwise.
+            :lazy_models (bool, optional): Return LazyTasks and LazyComments from the task and comment
+                getters, which build each model only when it is accessed. Defaults to False.
+            :validate (bool, optional): Validate responses with pydantic. When False, models are built
+                with models.construct, which skips validation for trusted responses. Defaults to True.
+            :validation_sampling (int, optional): With validate=False, still validate one response in
+                every validation_sampling so schema drift is noticed. 0 never validates. Defaults to 0.
+            :strict (bool, optional): Raise when a validated response does not match the models. When
+                False, models are built with models.validate_or_construct, which returns a drifted
+                response as-is instead of raising. Defaults to True.
+            :interning (str, optional): Share one frozen instance of the users, statuses, spaces and
+                folders repeated in a response: "page" within each response, "session" across all
+                of them through client.interner. Defaults to None (no interning).
+        """
         self.api_url = api_url
         self.accesstoken = accesstoken
         self.request_count = 0
@@ -40,23 +240,178 @@ class ClickUpClient:
         self.rate_limit_reset = start_rate_limit_reset
         self.rate_limit_buffer_wait_time = rate_limit_buffer_wait_time
         self.retry_rate_limited_requests = retry_rate_limited_requests
-
-    def __parse_response_rate_limit_headers(self, response: requests.Response) -> None:
-        self.rate_limit_remaining = int(
-            response.headers.get("x-ratelimit-remaining") or "0"
+        self.rate_limit_burst = rate_limit_burst
+        self.shared_rate_limit = shared_rate_limit
+        self.rate_limiter = rate_limiter or self._create_rate_limiter(accesstoken)
+        self.retry_policy = retry_policy or RetryPolicy(
+            retry_statuses=(
+                RETRY_STATUSES
+                if retry_rate_limited_requests
+                else RETRY_STATUSES - {429}
+            )
         )
-        self.rate_limit_reset = float(
-            response.headers.get("x-ratelimit-reset") or "0.0"
+        self.retry_count = 0
+        self.cache = cache
+        self.json_codec = json_codec or default_codec()
+        self.__tasks_model = models.LazyTasks if lazy_models else models.Tasks
+        self.__comments_model = models.LazyComments if lazy_models else models.Comments
+        self.validate = validate
+        self.validation_sampling = validation_sampling
+        self.strict = strict
+        self.__responses = itertools.count()
+        if interning not in (None, "page", "session"):
+            raise exceptions.ClickupClientError(
+                f"Unknown interning mode {interning!r}, expected 'page' or 'session'.",
+                None,
+            )
+        self.interning = interning
+        self.interner = Interner() if interning == "session" else None
+        self.timeout = (connect_timeout, read_timeout)
+        self.__lock = threading.Lock()
+        self.__local = threading.local()
+        self.session = self.__create_session(
+            pool_connections, pool_maxsize, pool_block, keep_alive
         )
 
-    def __check_rate_limit(self) -> None:
-        if self.rate_limit_remaining <= 1:
-            resume_time = datetime.fromtimestamp(
-                self.rate_limit_reset + self.rate_limit_buffer_wait_time
+    def __enter__(self) -> "ClickUpClient":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Closes the client's HTTP session and releases all pooled connections."""
+        self.session.close()
+
+    def batch(
+        self,
+        calls: Iterable[Call],
+        concurrency: int = 8,
+        min_concurrency: int = 1,
+        on_progress: Optional[Callable[[BatchProgress], None]] = None,
+    ) -> list[BatchResult]:
+        """Runs many calls to client methods concurrently, such as update_task or tag_task over thousands of ids.
+
+        Calls are taken from `calls` as slots free up. The number in flight starts at
+        concurrency, halves whenever a call is rate limited or retried, and grows back
+        one at a time, never exceeding what the rate limit has left. A call that
+        raises does not stop the others. Use batch.BatchExecutor directly to read
+        its progress counters from another thread.
+
+        Args:
+            :calls (Iterable[batch.Call]): The calls to make, built with batch.call("method", *args, **kwargs).
+            :concurrency (int, optional): Maximum number of calls in flight. Defaults to 8.
+            :min_concurrency (int, optional): The concurrency is never lowered below this. Defaults to 1.
+            :on_progress (Callable[[BatchProgress], None], optional): Called with the
+                completed, failed and throughput counters after every call. Defaults to None.
+
+        Returns:
+            :list[batch.BatchResult]: The return value or exception of each call, in queue order.
+        """
+        return BatchExecutor(self, concurrency, min_concurrency, on_progress).run(calls)
+
+    @staticmethod
+    def __create_session(
+        pool_connections: int, pool_maxsize: int, pool_block: bool, keep_alive: bool
+    ) -> requests.Session:
+        """Internal method to build the pooled HTTP session shared by every request."""
+        session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            pool_block=pool_block,
+        )
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        if not keep_alive:
+            session.headers["Connection"] = "close"
+        return session
+
+    @property
+    def last_request_attempts(self) -> int:
+        """Number of attempts (1 when no retry was needed) used by the latest request made from the calling thread."""
+        return getattr(self.__local, "attempts", 0)
+
+    @property
+    def rate_limit_state(self) -> RateLimitState:
+        """The current state of the client's rate limiter."""
+        return self.rate_limiter.state()
+
+    def _create_rate_limiter(self, accesstoken: str) -> TokenBucket:
+        """Creates the rate limiter that paces requests made with an access token."""
+        if self.shared_rate_limit:
+            return SharedTokenBucket(
+                accesstoken,
+                burst=self.rate_limit_burst,
+                buffer=self.rate_limit_buffer_wait_time,
             )
-            seconds = (resume_time - datetime.now()).total_seconds()
-            print(f"Waiting for rate limit to reset for {seconds} seconds.")
-            sleep(seconds)
+
+        rate_limiter = TokenBucket(
+            burst=self.rate_limit_burst, buffer=self.rate_limit_buffer_wait_time
+        )
+        rate_limiter.update(self.rate_limit_remaining, self.rate_limit_reset)
+        return rate_limiter
+
+    def _select_token(self) -> tuple[str, TokenBucket]:
+        """Returns the access token, and its rate limiter, to send the next request with."""
+        return self.accesstoken, self.rate_limiter
+
+    def _cache_scope(self) -> str:
+        """Returns the scope of cache keys, so clients with other tokens sharing a cache never read these responses."""
+        return token_scope(self.accesstoken)
+
+    def _prefetch_budget(self) -> int:
+        """Returns how many requests can be issued before the rate limit is hit, for prefetching and batches."""
+        return self.rate_limit_remaining - 1
+
+    def __parse_response_rate_limit_headers(
+        self, response: requests.Response, rate_limiter: TokenBucket
+    ) -> None:
+        remaining = response.headers.get("x-ratelimit-remaining")
+        reset = response.headers.get("x-ratelimit-reset")
+        if remaining is None or reset is None:
+            return
+
+        self.rate_limit_remaining = int(remaining)
+        self.rate_limit_reset = float(reset)
+        limit = response.headers.get("x-ratelimit-limit")
+        rate_limiter.update(
+            self.rate_limit_remaining,
+            self.rate_limit_reset,
+            int(limit) if limit else None,
+        )
+
+    def __validates(self) -> bool:
+        """Returns True if the next response should be validated rather than trusted."""
+        if self.validate:
+            return True
+        return (
+            self.validation_sampling > 0
+            and next(self.__responses) % self.validation_sampling == 0
+        )
+
+    def __model(self, model: type[M], data: dict[str, Any]) -> M:
+        """Builds a model from a response, validating it unless the client trusts responses."""
+        if not self.__validates():
+            built = models.construct(model, data)
+        elif self.strict:
+            built = model(**data)
+        else:
+            built = models.validate_or_construct(model, data)
+        interner = self.__interner()
+        return interner.intern_nested(built) if interner is not None else built
+
+    def __tasks_list(self, fields: Optional[Sequence[str]]) -> type:
+        """Returns the list model of a page of tasks, projected to fields if any are given."""
+        if fields is None:
+            return self.__tasks_model
+        return models.task_summaries(fields)
+
+    def __interner(self) -> Optional[Interner]:
+        """Returns the Interner for the next response, if the client interns models."""
+        if self.interning == "page":
+            return Interner()
+        return self.interner
 
     # Generates headers for use in GET, POST, DELETE, PUT requests
 
@@ -76,21 +431,87 @@ class ClickUpClient:
             }
         )
 
+    @staticmethod
+    def __stream_prefetch(stream: bool, prefetch: int) -> int:
+        """Internal method checking that streamed pages, which hold their connection open, are fetched one at a time."""
+        if stream and prefetch:
+            raise exceptions.ClickupClientError(
+                "Streamed pages cannot be prefetched.", None
+            )
+        return prefetch
+
+    def __send(
+        self,
+        method: str,
+        path: str,
+        retry: Optional[bool] = None,
+        body: Optional[MultipartFile] = None,
+        **kwargs: Any,
+    ) -> requests.Response:
+        """Internal method that paces a request through the rate limiter, sends it through the pooled
+        session and retries it according to the retry policy.
+
+        Args:
+            :retry (bool, optional): True marks a non-idempotent request as safe to repeat, False
+                disables retries. Defaults to None, which retries idempotent methods only.
+            :body (MultipartFile, optional): A streamed body, rewound before every attempt. Defaults to None.
+        """
+        policy = self.retry_policy
+        retryable = retry is not False and policy.allows(method, bool(retry))
+        request_headers = kwargs.pop("headers", {})
+        attempt = 0
+        while True:
+            attempt += 1
+            self.__local.attempts = attempt
+            token, rate_limiter = self._select_token()
+            rate_limiter.acquire()
+            headers = {**request_headers, "Authorization": token}
+            if body is not None:
+                # Each attempt reads the streamed body to the end
+                body.rewind()
+                kwargs["data"] = body
+            try:
+                response = self.session.request(
+                    method, path, headers=headers, timeout=self.timeout, **kwargs
+                )
+            except policy.retry_exceptions as error:
+                if not (retryable and policy.should_retry_exception(attempt, error)):
+                    raise
+                self.__wait_for_retry(policy.delay(attempt))
+                continue
+
+            with self.__lock:
+                self.request_count += 1
+            self.__parse_response_rate_limit_headers(response, rate_limiter)
+
+            if retryable and policy.should_retry_status(attempt, response.status_code):
+                # Release the connection of a streamed response before trying again
+                response.close()
+                self.__wait_for_retry(
+                    policy.delay(attempt, response.status_code, response.headers)
+                )
+                continue
+            return response
+
+    def __wait_for_retry(self, delay: float) -> None:
+        with self.__lock:
+            self.retry_count += 1
+        self.retry_policy.sleep(delay)
+
     def __get_request(self, model: str, *additionalpath: str) -> dict[str, Any]:
         """Performs a Get request to the ClickUp API"""
-        path = formatting.url_join(API_URL, model, *additionalpath)
+        key = cache_key(model, *additionalpath, scope=self._cache_scope())
+        if self.cache is not None:
+            cached = self.cache.get(key)
+            if cached is not None:
+                return self.json_codec.loads(cached)
 
-        self.__check_rate_limit()
-
-        response = requests.get(path, headers=self.__headers())
-        self.request_count += 1
-        response_json: dict[str, Any] = response.json()
+        path = formatting.url_join(API_URL, model, *additionalpath)
 
-        self.__parse_response_rate_limit_headers(response)
+        response = self.__send("GET", path, headers=self.__headers())
+        response_json: dict[str, Any] = self.json_codec.loads(response.content)
 
         if response.status_code == 429:
-            if self.retry_rate_limited_requests:
-                return self.__get_request(model, *additionalpath)
             raise exceptions.ClickupClientError(
                 "Rate limit exceeded", response.status_code
             )
@@ -99,10 +520,47 @@ class ClickUpClient:
                 response_json["err"], response.status_code
             )
         if response.ok:
+            if self.cache is not None:
+                self.cache.set(key, response.content)
             return response_json
 
         raise exceptions.ClickupClientError("Unknown Error", response.status_code)
 
+    def __stream_tasks(
+        self, model: str, *additionalpath: str, fields: Optional[Sequence[str]] = None
+    ) -> TaskStream:
+        """Performs a Get request for a page of tasks whose body is parsed as it arrives"""
+        path = formatting.url_join(API_URL, model, *additionalpath)
+        response = self.__send("GET", path, headers=self.__headers(), stream=True)
+        if not response.ok:
+            response_json: dict[str, Any] = self.json_codec.loads(response.content)
+            if response.status_code == 429:
+                raise exceptions.ClickupClientError(
+                    "Rate limit exceeded", response.status_code
+                )
+            if response.status_code in [401, 400, 404]:
+                raise exceptions.ClickupClientError(
+                    response_json["err"], response.status_code
+                )
+            raise exceptions.ClickupClientError("Unknown Error", response.status_code)
+
+        def chunks() -> Iterator[bytes]:
+            with response:
+                yield from response.iter_content(STREAM_CHUNK_SIZE)
+
+        return TaskStream(
+            chunks(),
+            trusted=not self.__validates(),
+            strict=self.strict,
+            interner=self.__interner(),
+            model=self.__tasks_list(fields).item_model(),
+        )
+
+    def __invalidate_cache(self, model: str, *additionalpath: str) -> None:
+        """Drops cached responses made stale by a write, whether or not the write succeeded."""
+        if self.cache is not None:
+            self.cache.invalidate(cache_key(model, *additionalpath))
+
     # Performs a Post request to the ClickUp API
     def __post_request(
         self,
@@ -111,20 +569,34 @@ class ClickUpClient:
         *additionalpath: str,
         upload_files: Any = None,
         file_upload: bool = False,
+        retry: Optional[bool] = None,
     ) -> dict[str, Any]:
 
         path = formatting.url_join(API_URL, model, *additionalpath)
         if data:
-            if upload_files:
-                response = requests.post(
-                    path, headers=self.__headers(True), data=data, files=upload_files
-                )
-                self.request_count += 1
-            else:
-                response = requests.post(path, headers=self.__headers(), data=data)
-
-                self.request_count += 1
-            response_json: dict[str, Any] = response.json()
+            try:
+                if upload_files:
+                    response = self.__send(
+                        "POST",
+                        path,
+                        retry=retry,
+                        body=upload_files,
+                        headers={
+                            **self.__headers(True),
+                            "Content-Type": upload_files.content_type,
+                        },
+                    )
+                else:
+                    response = self.__send(
+                        "POST",
+                        path,
+                        retry=retry,
+                        headers=self.__headers(),
+                        data=self.json_codec.dumps(data),
+                    )
+            finally:
+                self.__invalidate_cache(model, *additionalpath)
+            response_json: dict[str, Any] = self.json_codec.loads(response.content)
 
             if response.status_code in [401, 400, 500, 404]:
                 raise exceptions.ClickupClientError(
@@ -133,8 +605,13 @@ class ClickUpClient:
             if response.ok:
                 return response_json
         else:
-            response = requests.post(path, headers=self.__headers())
-            response_json = response.json()
+            try:
+                response = self.__send(
+                    "POST", path, retry=retry, headers=self.__headers()
+                )
+            finally:
+                self.__invalidate_cache(model, *additionalpath)
+            response_json = self.json_codec.loads(response.content)
             if response.status_code in [401, 400, 500, 404]:
                 raise exceptions.ClickupClientError(
                     response_json["err"], response.status_code
@@ -149,9 +626,13 @@ class ClickUpClient:
         self, model: str, data: dict[str, Any], *additionalpath: str
     ) -> dict[str, Any]:
         path = formatting.url_join(API_URL, model, *additionalpath)
-        response = requests.put(path, headers=self.__headers(), data=data)
-        self.request_count += 1
-        response_json: dict[str, Any] = response.json()
+        try:
+            response = self.__send(
+                "PUT", path, headers=self.__headers(), data=self.json_codec.dumps(data)
+            )
+        finally:
+            self.__invalidate_cache(model, *additionalpath)
+        response_json: dict[str, Any] = self.json_codec.loads(response.content)
         if response.status_code in [401, 400]:
             raise exceptions.ClickupClientError(
                 response_json["err"], response.status_code
@@ -164,10 +645,12 @@ class ClickUpClient:
     # Performs a Delete request to the ClickUp API
     def __delete_request(self, model: str, *additionalpath: str) -> int:
         path = formatting.url_join(API_URL, model, *additionalpath)
-        response = requests.delete(path, headers=self.__headers())
-        self.request_count += 1
         try:
-            response_json: dict[str, Any] = response.json()
+            response = self.__send("DELETE", path, headers=self.__headers())
+        finally:
+            self.__invalidate_cache(model, *additionalpath)
+        try:
+            response_json: dict[str, Any] = self.json_codec.loads(response.content)
         except:
             raise exceptions.ClickupClientError(
                 "Invalid Json response", response.status_code
@@ -303,7 +786,7 @@ class ClickUpClient:
                 "Priority must be in range of 0-4.", "Priority out of range"
             )
 
-        if due_date:
+        if due_date and not str(due_date).isdigit():
             due_date = fuzzy_time_to_unix(due_date)
 
         arguments = {}
@@ -346,10 +829,17 @@ class ClickUpClient:
         """
         model = "list/"
         task = self.__post_request(
-            model, {}, list_id, "task", task_id, upload_files=None, file_upload=False
+            model,
+            {},
+            list_id,
+            "task",
+            task_id,
+            upload_files=None,
+            file_upload=False,
+            retry=True,
         )
 
-        return models.Task(**task)
+        return self.__model(models.Task, task)
 
     def remove_task_from_list(
         self,
@@ -383,7 +873,7 @@ class ClickUpClient:
         model = "folder/"
         fetched_folder = self.__get_request(model, folder_id)
         if fetched_folder:
-            return models.Folder(**fetched_folder)
+            return self.__model(models.Folder, fetched_folder)
 
         raise exceptions.ClickupClientError("Failed to Get Folder.", None)
 
@@ -399,7 +889,7 @@ class ClickUpClient:
         model = "space/"
         fetched_folders = self.__get_request(model, space_id, "folder")
         if fetched_folders:
-            return models.Folders(**fetched_folders)
+            return self.__model(models.Folders, fetched_folders)
 
         raise exceptions.ClickupClientError("Failed to Get Folders.", None)
 
@@ -421,7 +911,7 @@ class ClickUpClient:
             model, data, space_id, "folder", upload_files=None, file_upload=False
         )
         if created_folder:
-            return models.Folder(**created_folder)
+            return self.__model(models.Folder, created_folder)
 
         raise exceptions.ClickupClientError("Failed to Create Folder.", None)
 
@@ -441,7 +931,7 @@ class ClickUpClient:
         model = "folder/"
         updated_folder = self.__put_request(model, data, folder_id)
         if updated_folder:
-            return models.Folder(**updated_folder)
+            return self.__model(models.Folder, updated_folder)
 
         raise exceptions.ClickupClientError("Failed to Update Folder.", None)
 
@@ -456,33 +946,58 @@ class ClickUpClient:
         return True
 
     # Tasks
-    def upload_attachment(self, task_id: str, file_path: str) -> models.Attachment:
+    def upload_attachment(
+        self, task_id: str, file_path: str, progress: Optional[Progress] = None
+    ) -> models.Attachment:
         """Uploads an attachment to a ClickUp task.
 
+        The file is streamed from disk while the request is sent, so memory use does not
+        grow with its size. See uploads.MultipartFile.
+
         Args:
             :task_id (str): The ID of the task to upload to.
             :file_path (str): The filepath of the file to upload.
+            :progress (Callable[[int, int], None], optional): Called with the bytes sent so far and the file size. Defaults to None.
 
         Returns:
             :Attachment: Returns an attachment object.
         """
 
         if os.path.exists(file_path):
-
-            with open(file_path, "rb") as f:
-                files = [("attachment", (f.name, open(file_path, "rb")))]
-                data = {"filename": ntpath.basename(f.name)}
+            data = {"filename": ntpath.basename(file_path)}
+            with MultipartFile(file_path, fields=data, progress=progress) as body:
                 model = "task/" + task_id
                 uploaded_attachment = self.__post_request(
-                    model, data, "attachment", upload_files=files, file_upload=True
+                    model, data, "attachment", upload_files=body, file_upload=True
                 )
 
-                if uploaded_attachment:
-                    final_attachment = models.Attachment(**uploaded_attachment)
-                return final_attachment
+            if uploaded_attachment:
+                return self.__model(models.Attachment, uploaded_attachment)
 
         raise exceptions.ClickupClientError("Failed to Upload Attachment.", None)
 
+    def upload_attachments(
+        self,
+        uploads: Iterable[tuple[str, str]],
+        concurrency: int = 4,
+        progress: Optional[Callable[[str, str, int, int], None]] = None,
+    ) -> list[BatchResult]:
+        """Uploads many files to many tasks concurrently, within the rate limit.
+
+        Runs upload_attachment through batch(), so the number of uploads in flight
+        adapts to the rate limit and a failed upload does not stop the others.
+
+        Args:
+            :uploads (Iterable[tuple[str, str]]): (task_id, file_path) pairs.
+            :concurrency (int, optional): Maximum number of uploads in flight. Defaults to 4.
+            :progress (Callable[[str, str, int, int], None], optional): Called with the task id,
+                the file path, the bytes sent so far and the file size as each file is sent. Defaults to None.
+
+        Returns:
+            :list[batch.BatchResult]: The Attachment, or the exception, of each upload, in order.
+        """
+        return self.batch(upload_calls(uploads, progress), concurrency)
+
     # // TODO Add "Include subtasks option"
     def get_task(self, task_id: str) -> models.Task:
         """Fetches a single ClickUp task item and returns a Task object.
@@ -495,7 +1010,7 @@ class ClickUpClient:
         """
         model = "task/"
         fetched_task = self.__get_request(model, task_id)
-        final_task = models.Task(**fetched_task)
+        final_task = self.__model(models.Task, fetched_task)
         if final_task:
             return final_task
 
@@ -521,7 +1036,8 @@ class ClickUpClient:
         date_created_lt: Optional[str] = None,
         date_updated_gt: Optional[str] = None,
         date_updated_lt: Optional[str] = None,
-    ) -> models.Tasks:
+        fields: Optional[Sequence[str]] = None,
+    ) -> Union[models.Tasks, models.TaskSummaries]:
         """Gets filtered tasks for a team.
 
         Args:
@@ -543,6 +1059,7 @@ class ClickUpClient:
             :date_created_lt (str, optional): [description]. Defaults to None.
             :date_updated_gt (str, optional): [description]. Defaults to None.
             :date_updated_lt (str, optional): [description]. Defaults to None.
+            :fields (Sequence[str], optional): Only parse these Task fields, returning TaskSummaries. See get_tasks. Defaults to None.
 
         Raises:
             exceptions.ClickupClientError: [description]
@@ -550,58 +1067,29 @@ class ClickUpClient:
         Returns:
             models.Tasks: [description]
         """
-        if order_by not in ["id", "created", "updated", "due_date"]:
-            raise exceptions.ClickupClientError(
-                "Options are: id, created, updated, due_date", "Invalid order_by value"
-            )
-
-        supplied_values = [
-            f"page={page}",
-            f"order_by={order_by}",
-            f"reverse={str(reverse).lower()}",
-        ]
-
-        if statuses:
-            supplied_values.append(
-                f"{urllib.parse.quote_plus('statuses[]')}={','.join(statuses)}"
-            )
-        if assignees:
-            supplied_values.append(
-                f"{urllib.parse.quote_plus('assignees[]')}={','.join(assignees)}"
-            )
-        if due_date_gt:
-            supplied_values.append(f"due_date_gt={fuzzy_time_to_unix(due_date_gt)}")
-        if due_date_lt:
-            supplied_values.append(f"due_date_lt={fuzzy_time_to_unix(due_date_lt)}")
-        if space_ids:
-            supplied_values.append(
-                f"{urllib.parse.quote_plus('space_ids[]')}={','.join(space_ids)}"
-            )
-        if project_ids:
-            supplied_values.append(
-                f"{urllib.parse.quote_plus('project_ids[]')}={','.join(project_ids)}"
-            )
-        if list_ids:
-            supplied_values.append(
-                f"{urllib.parse.quote_plus('list_ids[]')}={','.join(list_ids)}"
-            )
-        if date_created_gt:
-            supplied_values.append(f"date_created_gt={date_created_gt}")
-        if date_created_lt:
-            supplied_values.append(f"date_created_lt={date_created_lt}")
-        if date_updated_gt:
-            supplied_values.append(f"date_updated_gt={date_updated_gt}")
-        if date_updated_lt:
-            supplied_values.append(f"date_updated_lt={date_updated_lt}")
-        if subtasks:
-            supplied_values.append(f"subtasks=true")
-
-        joined_url = f"task?{'&'.join(supplied_values)}"
+        joined_url = team_tasks_query(
+            page,
+            order_by,
+            reverse,
+            include_closed,
+            subtasks=subtasks,
+            statuses=statuses,
+            assignees=assignees,
+            due_date_gt=due_date_gt,
+            due_date_lt=due_date_lt,
+            date_created_gt=date_created_gt,
+            date_created_lt=date_created_lt,
+            date_updated_gt=date_updated_gt,
+            date_updated_lt=date_updated_lt,
+            space_ids=space_ids,
+            project_ids=project_ids,
+            list_ids=list_ids,
+        )
 
         model = "team/"
         fetched_tasks = self.__get_request(model, team_Id, joined_url)
         if fetched_tasks:
-            return models.Tasks(**fetched_tasks)
+            return self.__model(self.__tasks_list(fields), fetched_tasks)
 
         raise exceptions.ClickupClientError("Failed to Get Team Tasks.", None)
 
@@ -622,9 +1110,10 @@ class ClickUpClient:
         date_created_lt: Optional[str] = None,
         date_updated_gt: Optional[str] = None,
         date_updated_lt: Optional[str] = None,
-    ) -> models.Tasks:
-        """The maximum number of tasks returned in this response is 100. When you are paging this request, you should check list limit
-        against the length of each response to determine if you are on the last page.
+        fields: Optional[Sequence[str]] = None,
+    ) -> Union[models.Tasks, models.TaskSummaries]:
+        """The maximum number of tasks returned in this response is 100. The returned Tasks carry the server's last_page
+        flag; use iter_tasks to page through every task without managing pages by hand.
 
         Args:
             :list_id (str):
@@ -655,60 +1144,276 @@ class ClickUpClient:
             :date_updated_gt (str, optional):
                 Retrieve tasks where the last update date is greater than the supplied date. Defaults to None.
             :date_updated_lt (str, optional): Retrieve tasks where the last update date is greater than the supplied date. Defaults to None.
+            :fields (Sequence[str], optional):
+                Only parse these Task fields, such as models.SUMMARY_FIELDS, and return
+                models.TaskSummaries. The other fields are dropped without building their
+                models. Defaults to None (full Tasks).
 
         Raises:
-            :exceptions.ClickupClientError: Invalid order_by value
+            :exceptions.ClickupClientError: Invalid order_by value, or an unknown field
 
         Returns:
             :models.Tasks: Returns a list of item Task.
         """
 
-        if order_by not in ["id", "created", "updated", "due_date"]:
-            raise exceptions.ClickupClientError(
-                "Options are: id, created, updated, due_date", "Invalid order_by value"
-            )
-
-        supplied_values = [
-            f"archived={str(archived).lower()}",
-            f"page={page}",
-            f"order_by={order_by}",
-            f"reverse={str(reverse).lower()}",
-            f"include_closed={str(include_closed).lower()}",
-        ]
-
-        if statuses:
-            supplied_values.append(
-                f"{urllib.parse.quote_plus('statuses[]')}={','.join(statuses)}"
-            )
-        if assignees:
-            supplied_values.append(
-                f"{urllib.parse.quote_plus('assignees[]')}={','.join(assignees)}"
-            )
-        if due_date_gt:
-            supplied_values.append(f"due_date_gt={fuzzy_time_to_unix(due_date_gt)}")
-        if due_date_lt:
-            supplied_values.append(f"due_date_lt={fuzzy_time_to_unix(due_date_lt)}")
-        if date_created_gt:
-            supplied_values.append(f"date_created_gt={date_created_gt}")
-        if date_created_lt:
-            supplied_values.append(f"date_created_lt={date_created_lt}")
-        if date_updated_gt:
-            supplied_values.append(f"date_updated_gt={date_updated_gt}")
-        if date_updated_lt:
-            supplied_values.append(f"date_updated_lt={date_updated_lt}")
-        if subtasks:
-            supplied_values.append(f"subtasks=true")
-
-        joined_url = f"task?{'&'.join(supplied_values)}"
+        joined_url = list_tasks_query(
+            archived,
+            page,
+            order_by,
+            reverse,
+            include_closed,
+            subtasks=subtasks,
+            statuses=statuses,
+            assignees=assignees,
+            due_date_gt=due_date_gt,
+            due_date_lt=due_date_lt,
+            date_created_gt=date_created_gt,
+            date_created_lt=date_created_lt,
+            date_updated_gt=date_updated_gt,
+            date_updated_lt=date_updated_lt,
+        )
 
         model = "list/"
         fetched_tasks = self.__get_request(model, list_id, joined_url)
 
         if fetched_tasks:
-            return models.Tasks(**fetched_tasks)
+            return self.__model(self.__tasks_list(fields), fetched_tasks)
 
         raise exceptions.ClickupClientError("Failed to Get Tasks.", None)
 
+    def iter_team_tasks(
+        self,
+        team_Id: str,
+        page: int = 0,
+        order_by: str = "created",
+        reverse: bool = False,
+        subtasks: bool = False,
+        space_ids: Optional[List[str]] = None,
+        project_ids: Optional[List[str]] = None,
+        list_ids: Optional[List[str]] = None,
+        statuses: Optional[List[str]] = None,
+        include_closed: bool = False,
+        assignees: Optional[List[str]] = None,
+        tags: Optional[List[str]] = None,
+        due_date_gt: Optional[str] = None,
+        due_date_lt: Optional[str] = None,
+        date_created_gt: Optional[str] = None,
+        date_created_lt: Optional[str] = None,
+        date_updated_gt: Optional[str] = None,
+        date_updated_lt: Optional[str] = None,
+        prefetch: int = 0,
+        stream: bool = False,
+        fields: Optional[Sequence[str]] = None,
+    ) -> Iterator[Union[models.Task, models.TaskSummary]]:
+        """Lazily yields every task matching the filters for a team, fetching one page at a time.
+
+        Pages are requested only as the caller consumes them, and iteration stops on the
+        server's last page signal without requesting an extra empty page.
+
+        Args:
+            :team_Id (str): The id of the team to get tasks for.
+            :page (int, optional): The page to start from. Defaults to 0.
+            :prefetch (int, optional): Number of upcoming pages to fetch concurrently while the
+                current page is consumed, capped by the remaining rate limit. Outstanding
+                fetches are cancelled once the last page is seen. Defaults to 0 (serial).
+            :stream (bool, optional): Parse each page while it downloads and yield tasks as soon
+                as they are complete, keeping memory bounded by a single task instead of a
+                page. Responses are not cached and prefetch must be 0. Defaults to False.
+            :fields (Sequence[str], optional): Only parse these Task fields and yield
+                TaskSummary items instead. See get_tasks. Defaults to None.
+
+            The remaining arguments are the filters accepted by get_team_tasks.
+
+        Yields:
+            :models.Task: Each matching task, in server order.
+        """
+
+        filters = dict(
+            subtasks=subtasks,
+            space_ids=space_ids,
+            project_ids=project_ids,
+            list_ids=list_ids,
+            statuses=statuses,
+            assignees=assignees,
+            due_date_gt=due_date_gt,
+            due_date_lt=due_date_lt,
+            date_created_gt=date_created_gt,
+            date_created_lt=date_created_lt,
+            date_updated_gt=date_updated_gt,
+            date_updated_lt=date_updated_lt,
+        )
+
+        def fetch_page(page_number: int) -> models.Tasks:
+            if stream:
+                return self.__stream_tasks(  # type: ignore[return-value]
+                    "team/",
+                    team_Id,
+                    team_tasks_query(
+                        page_number, order_by, reverse, include_closed, **filters
+                    ),
+                    fields=fields,
+                )
+            return self.get_team_tasks(
+                team_Id,
+                page=page_number,
+                order_by=order_by,
+                reverse=reverse,
+                include_closed=include_closed,
+                tags=tags,
+                fields=fields,
+                **filters,
+            )
+
+        prefetch = self.__stream_prefetch(stream, prefetch)
+        for tasks in iter_pages(fetch_page, page, prefetch, self._prefetch_budget):
+            yield from tasks
+
+    def iter_tasks(
+        self,
+        list_id: str,
+        archived: bool = False,
+        page: int = 0,
+        order_by: str = "created",
+        reverse: bool = False,
+        subtasks: bool = False,
+        statuses: Optional[List[str]] = None,
+        include_closed: bool = False,
+        assignees: Optional[List[str]] = None,
+        due_date_gt: Optional[str] = None,
+        due_date_lt: Optional[str] = None,
+        date_created_gt: Optional[str] = None,
+        date_created_lt: Optional[str] = None,
+        date_updated_gt: Optional[str] = None,
+        date_updated_lt: Optional[str] = None,
+        prefetch: int = 0,
+        stream: bool = False,
+        fields: Optional[Sequence[str]] = None,
+    ) -> Iterator[Union[models.Task, models.TaskSummary]]:
+        """Lazily yields every task matching the filters in a list, fetching one page at a time.
+
+        Pages are requested only as the caller consumes them, and iteration stops on the
+        server's last page signal without requesting an extra empty page.
+
+        Args:
+            :list_id (str): The ID of the list to retrieve tasks from.
+            :page (int, optional): The page to start from. Defaults to 0.
+            :prefetch (int, optional): Number of upcoming pages to fetch concurrently while the
+                current page is consumed, capped by the remaining rate limit. Outstanding
+                fetches are cancelled once the last page is seen. Defaults to 0 (serial).
+            :stream (bool, optional): Parse each page while it downloads. See iter_team_tasks. Defaults to False.
+            :fields (Sequence[str], optional): Only parse these Task fields. See get_tasks. Defaults to None.
+
+            The remaining arguments are the filters accepted by get_tasks.
+
+        Yields:
+            :models.Task: Each matching task, in server order.
+        """
+
+        filters = dict(
+            subtasks=subtasks,
+            statuses=statuses,
+            assignees=assignees,
+            due_date_gt=due_date_gt,
+            due_date_lt=due_date_lt,
+            date_created_gt=date_created_gt,
+            date_created_lt=date_created_lt,
+            date_updated_gt=date_updated_gt,
+            date_updated_lt=date_updated_lt,
+        )
+
+        def fetch_page(page_number: int) -> models.Tasks:
+            if stream:
+                return self.__stream_tasks(  # type: ignore[return-value]
+                    "list/",
+                    list_id,
+                    list_tasks_query(
+                        archived,
+                        page_number,
+                        order_by,
+                        reverse,
+                        include_closed,
+                        **filters,
+                    ),
+                    fields=fields,
+                )
+            return self.get_tasks(
+                list_id,
+                archived=archived,
+                page=page_number,
+                order_by=order_by,
+                reverse=reverse,
+                include_closed=include_closed,
+                fields=fields,
+                **filters,
+            )
+
+        prefetch = self.__stream_prefetch(stream, prefetch)
+        for tasks in iter_pages(fetch_page, page, prefetch, self._prefetch_budget):
+            yield from tasks
+
+    def watch_team_tasks(
+        self,
+        team_Id: str,
+        interval: float = 30.0,
+        since: Optional[int] = None,
+        subtasks: bool = False,
+        space_ids: Optional[List[str]] = None,
+        project_ids: Optional[List[str]] = None,
+        list_ids: Optional[List[str]] = None,
+        statuses: Optional[List[str]] = None,
+        assignees: Optional[List[str]] = None,
+        max_polls: Optional[int] = None,
+    ) -> Iterator[TaskChange]:
+        """Polls a team for task changes and yields them as they are found.
+
+        Every poll asks for tasks ordered by last update with date_updated past a moving
+        watermark, and stops paging as soon as it reaches tasks older than the watermark,
+        so a poll with no changes costs a single request.
+
+        Args:
+            :team_Id (str): The id of the team to watch.
+            :interval (float, optional): Seconds to wait between polls. Defaults to 30.
+            :since (int, optional): Unix time in ms to report changes after. Defaults to now.
+            :max_polls (int, optional): Stop after this many polls. Defaults to None (poll forever).
+
+            The remaining arguments are the filters accepted by get_team_tasks.
+
+        Yields:
+            :TaskChange: A "created", "updated" or "closed" event for each changed task.
+        """
+        tracker = TaskChangeTracker(
+            since if since is not None else int(time.time() * 1000)
+        )
+        polls = 0
+        while max_polls is None or polls < max_polls:
+            if polls:
+                time.sleep(interval)
+            polls += 1
+
+            watermark = tracker.begin()
+            changes = []
+            for task in self.iter_team_tasks(
+                team_Id,
+                order_by="updated",
+                subtasks=subtasks,
+                space_ids=space_ids,
+                project_ids=project_ids,
+                list_ids=list_ids,
+                statuses=statuses,
+                include_closed=True,
+                assignees=assignees,
+                # Exclusive filter; re-read the watermark's millisecond so ties are not lost
+                date_updated_gt=str(watermark - 1),
+            ):
+                if int(task.date_updated or 0) < watermark:
+                    break
+                change = tracker.observe(task)
+                if change is not None:
+                    changes.append(change)
+
+            # Newest first from the server; report in the order the changes happened
+            yield from reversed(changes)
+
     def create_task(
         self,
         list_id: str,
@@ -732,7 +1437,7 @@ class ClickUpClient:
             :assignees ([type], optional): [description]. Defaults to None.
             :tags ([type], optional): [description]. Defaults to None.
             :status (str, optional): [description]. Defaults to None.
-            :due_date (str, optional): [description]. Defaults to None.
+            :due_date (str, optional): A fuzzy date such as "next friday", or Unix time in ms. Defaults to None.
             :start_date (str, optional): [description]. Defaults to None.
             :notify_all (bool, optional): [description]. Defaults to True.
 
@@ -746,7 +1451,7 @@ class ClickUpClient:
             raise exceptions.ClickupClientError(
                 "Priority must be in range of 0-4.", "Priority out of range"
             )
-        if due_date:
+        if due_date and not str(due_date).isdigit():
             due_date = fuzzy_time_to_unix(due_date)
 
         arguments = {}
@@ -763,7 +1468,7 @@ class ClickUpClient:
         )
 
         if created_task:
-            return models.Task(**created_task)
+            return self.__model(models.Task, created_task)
 
         raise exceptions.ClickupClientError("Failed to Create Task.", None)
 
@@ -825,7 +1530,7 @@ class ClickUpClient:
         model = "task/"
         updated_task = self.__put_request(model, final_dict, task_id)
         if updated_task:
-            return models.Task(**updated_task)
+            return self.__model(models.Task, updated_task)
 
         raise exceptions.ClickupClientError("Failed to Update List.", None)
 
@@ -851,7 +1556,7 @@ class ClickUpClient:
         """
         model = "task/"
         fetched_comments = self.__get_request(model, task_id, "comment")
-        return models.Comments(**fetched_comments)
+        return self.__model(self.__comments_model, fetched_comments)
 
     def get_list_comments(self, list_id: str) -> models.Comments:
         """Get all the comments for a list from a given list id.
@@ -864,7 +1569,7 @@ class ClickUpClient:
         """
         model = "list/"
         fetched_comments = self.__get_request(model, list_id, "comment/")
-        final_comments = models.Comments(**fetched_comments)
+        final_comments = self.__model(self.__comments_model, fetched_comments)
         if final_comments:
             return final_comments
 
@@ -881,7 +1586,7 @@ class ClickUpClient:
         """
         model = "view/"
         fetched_comments = self.__get_request(model, view_id, "comment/")
-        final_comments = models.Comments(**fetched_comments)
+        final_comments = self.__model(self.__comments_model, fetched_comments)
         if final_comments:
             return final_comments
 
@@ -917,7 +1622,7 @@ class ClickUpClient:
 
         updated_comment = self.__put_request(model, final_dict, comment_id)
 
-        return models.Comment(**updated_comment)
+        return self.__model(models.Comment, updated_comment)
 
     def delete_comment(self, comment_id: str) -> bool:
         """Deletes a comment via a given comment id.
@@ -964,7 +1669,7 @@ class ClickUpClient:
             model, final_dict, task_id, "comment", upload_files=None, file_upload=False
         )
 
-        final_comment = models.Comment(**created_comment)
+        final_comment = self.__model(models.Comment, created_comment)
         if final_comment:
             return final_comment
 
@@ -1000,7 +1705,7 @@ class ClickUpClient:
             model, final_dict, view_id, "comment", upload_files=None, file_upload=False
         )
 
-        final_comment = models.Comment(**created_comment)
+        final_comment = self.__model(models.Comment, created_comment)
         if final_comment:
             return final_comment
 
@@ -1016,7 +1721,7 @@ class ClickUpClient:
         """
         model = "team"
         fetched_teams = self.__get_request(model)
-        return models.Teams(**fetched_teams)
+        return self.__model(models.Teams, fetched_teams)
 
     # Checklists
     def create_checklist(self, task_id: str, name: str) -> models.Checklist:
@@ -1037,7 +1742,7 @@ class ClickUpClient:
         created_checklist = self.__post_request(
             model, data, task_id, "checklist", upload_files=None, file_upload=False
         )
-        return models.Checklist(**created_checklist)
+        return self.__model(models.Checklist, created_checklist)
 
     def create_checklist_item(
         self, checklist_id: str, name: str, assignee: Optional[str] = None
@@ -1064,7 +1769,7 @@ class ClickUpClient:
             upload_files=None,
             file_upload=False,
         )
-        return models.Checklist(**created_checklist)
+        return self.__model(models.Checklist, created_checklist)
 
     def update_checklist(
         self,
@@ -1095,7 +1800,7 @@ class ClickUpClient:
         model = "checklist/"
         updated_checklist = self.__put_request(model, data, checklist_id)
         if updated_checklist:
-            return models.Checklist(**updated_checklist)
+            return self.__model(models.Checklist, updated_checklist)
 
         raise exceptions.ClickupClientError("Failed to Update Checklist.", None)
 
@@ -1158,7 +1863,7 @@ class ClickUpClient:
             model, final_dict, checklist_id, "checklist_item", checklist_item_id
         )
 
-        final_update = models.Checklist(**item_update)
+        final_update = self.__model(models.Checklist, item_update)
         if final_update:
             return final_update
 
@@ -1179,7 +1884,7 @@ class ClickUpClient:
         model = "task/"
 
         task_members = self.__get_request(model, task_id, "member")
-        return models.Members(**task_members)
+        return self.__model(models.Members, task_members)
 
     def get_list_members(self, list_id: str) -> models.Members:
         """Get all members assigned to a specific list via a list id.
@@ -1193,7 +1898,7 @@ class ClickUpClient:
         model = "list/"
 
         task_members = self.__get_request(model, list_id, "member")
-        return models.Members(**task_members)
+        return self.__model(models.Members, task_members)
 
     # Goals
 
@@ -1237,7 +1942,7 @@ class ClickUpClient:
         created_goal = self.__post_request(
             model, final_dict, team_id, "goal", upload_files=None, file_upload=False
         )
-        return models.Goal(**created_goal)
+        return self.__model(models.Goal, created_goal)
 
     def update_goal(
         self,
@@ -1274,7 +1979,7 @@ class ClickUpClient:
         model = "goal/"
         updated_goal = self.__put_request(model, final_dict, goal_id)
         if updated_goal:
-            return models.Goal(**updated_goal)
+            return self.__model(models.Goal, updated_goal)
 
         raise exceptions.ClickupClientError("Failed to Update Goal.", None)
 
@@ -1300,7 +2005,7 @@ class ClickUpClient:
         """
         model = "goal/"
         fetched_goal = self.__get_request(model, goal_id)
-        final_goal = models.Goal(**fetched_goal)
+        final_goal = self.__model(models.Goal, fetched_goal)
         if final_goal:
             return final_goal
 
@@ -1326,7 +2031,7 @@ class ClickUpClient:
                 model, team_id, "goal?include_completed=false"
             )
 
-        return models.Goals(**fetched_goals)
+        return self.__model(models.Goals, fetched_goals)
 
     # Tags
 
@@ -1343,7 +2048,7 @@ class ClickUpClient:
 
         fetched_tags = self.__get_request(model, space_id, "tag")
 
-        final_tags = models.Tags(**fetched_tags)
+        final_tags = self.__model(models.Tags, fetched_tags)
 
         if final_tags:
             return final_tags
@@ -1377,7 +2082,7 @@ class ClickUpClient:
             model, final_dict, space_id, "tag", upload_files=None, file_upload=False
         )
 
-        return models.Tag(**created_tag)
+        return self.__model(models.Tag, created_tag)
 
     # // TODO #34 Finalize update_tag function. API endpoint doesn't seem to do anything?
 
@@ -1404,7 +2109,14 @@ class ClickUpClient:
 
         model = "task/"
         self.__post_request(
-            model, {}, task_id, "tag", tag_name, upload_files=None, file_upload=False
+            model,
+            {},
+            task_id,
+            "tag",
+            tag_name,
+            upload_files=None,
+            file_upload=False,
+            retry=True,
         )
 
         return True
@@ -1444,7 +2156,7 @@ class ClickUpClient:
             model, final_dict, team_id, "space", upload_files=None, file_upload=False
         )
         if created_space:
-            return models.Space(**created_space)
+            return self.__model(models.Space, created_space)
 
         raise exceptions.ClickupClientError("Failed to Create Space.", None)
 
@@ -1460,7 +2172,7 @@ class ClickUpClient:
 
         fetched_space = self.__get_request(model, space_id)
 
-        return models.Space(**fetched_space)
+        return self.__model(models.Space, fetched_space)
 
     def get_spaces(self, team_id: str, archived: bool = False) -> models.Spaces:
 
@@ -1473,7 +2185,7 @@ class ClickUpClient:
 
         fetched_spaces = self.__get_request(model, team_id, path)
 
-        return models.Spaces(**fetched_spaces)
+        return self.__model(models.Spaces, fetched_spaces)
 
     # Shared Hierarchy
     # Returns all resources you have access to where you don't have access to its parent.
@@ -1493,7 +2205,7 @@ class ClickUpClient:
         model = "team/"
         fetched_hierarchy = self.__get_request(model, team_id, "shared")
         if fetched_hierarchy:
-            return models.SharedHierarchy(**fetched_hierarchy)
+            return self.__model(models.SharedHierarchy, fetched_hierarchy)
 
         raise exceptions.ClickupClientError("Failed to Get Shared Hierarchy.", None)
 
@@ -1538,7 +2250,7 @@ class ClickUpClient:
         fetched_time_data = self.__get_request(model, team_id, joined_url)
 
         if fetched_time_data:
-            return models.TimeTrackingDataList(**fetched_time_data)
+            return self.__model(models.TimeTrackingDataList, fetched_time_data)
 
         raise exceptions.ClickupClientError(
             "Failed to Get Time Entries in Range.", None
@@ -1560,7 +2272,7 @@ class ClickUpClient:
         model = "team/"
         fetched_time_data = self.__get_request(model, team_id, "time_entries", timer_id)
         if fetched_time_data:
-            return models.TimeTrackingDataSingle(**fetched_time_data)
+            return self.__model(models.TimeTrackingDataSingle, fetched_time_data)
 
         raise exceptions.ClickupClientError("Failed to Get Single Time Entry.", None)
 
@@ -1586,7 +2298,7 @@ class ClickUpClient:
         )
 
         if fetched_time_data:
-            return models.TimeTrackingData(**fetched_time_data)
+            return self.__model(models.TimeTrackingData, fetched_time_data)
 
         raise exceptions.ClickupClientError("Failed to Start Timer.", None)
 
@@ -1610,6 +2322,6 @@ class ClickUpClient:
         )
 
         if fetched_time_data:
-            return models.TimeTrackingData(**fetched_time_data)
+            return self.__model(models.TimeTrackingData, fetched_time_data)
 
         raise exceptions.ClickupClientError("Failed to Stop Timer.", None)
@@ -0,0 +1,46 @@
+import json
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None  # type: ignore
+
+
+class JSONCodec:
+    """Decodes response bodies and encodes request bodies. The stdlib json module is used by default."""
+
+    name = "json"
+
+    def loads(self, data: bytes) -> Any:
+        return json.loads(data)
+
+    def dumps(self, obj: Any) -> bytes:
+        return json.dumps(obj).encode()
+
+
+class OrjsonCodec(JSONCodec):
+    """A JSONCodec backed by orjson, which parses straight from bytes several times faster than json."""
+
+    name = "orjson"
+
+    def __init__(self) -> None:
+        if orjson is None:
+            raise ImportError(
+                "OrjsonCodec requires orjson: pip install clickupython[fast]"
+            )
+
+    def loads(self, data: bytes) -> Any:
+        return orjson.loads(data)
+
+    def dumps(self, obj: Any) -> bytes:
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+        except TypeError:
+            # Values orjson refuses, such as integers above 64 bits
+            return super().dumps(obj)
+
+
+def default_codec() -> JSONCodec:
+    """Returns an OrjsonCodec when orjson is installed and a JSONCodec otherwise."""
+    return OrjsonCodec() if orjson is not None else JSONCodec()
@@ -0,0 +1,290 @@
+from array import array
+from typing import Any, Iterable, Optional, Union
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - optional dependency
+    np = None  # type: ignore
+
+from clickupython import exceptions
+from clickupython import models
+
+# Columns holding one label per task, stored as integer codes into a vocabulary
+CATEGORICAL = ("status", "priority")
+# Columns holding any number of labels per task, stored as (row, code) pairs
+MULTI_VALUED = ("assignee", "tag")
+# Millisecond columns, stored as float64 with NaN where the task has no value
+TIMESTAMPS = ("date_created", "date_updated", "due_date", "time_estimate")
+
+AGGREGATES = ("count", "sum", "mean", "min", "max")
+
+
+def _require_numpy() -> None:
+    if np is None:
+        raise ImportError("TaskFrame requires numpy: pip install clickupython[frame]")
+
+
+def _priority_label(priority: Any) -> Optional[str]:
+    if isinstance(priority, dict):
+        return priority.get("priority")
+    return None if priority is None else str(priority)
+
+
+def _milliseconds(value: Any) -> float:
+    return float(value) if value not in (None, "") else float("nan")
+
+
+class TaskFrame:
+    """A columnar, NumPy-backed table of tasks for counting and aggregating large task sets.
+
+    Each task takes a few dozen bytes instead of a tree of pydantic objects. Status and
+    priority are dictionary-encoded into int32 codes, assignees and tags are stored as
+    (row, code) pairs, and the timestamps are float64 milliseconds with NaN for missing
+    values. Filters are boolean masks, so NumPy expressions over `timestamps` work too:
+
+        overdue = frame.filter(frame.timestamps["due_date"] < now_ms)
+        overdue.count_by("assignee")
+
+    Requires the optional numpy dependency (pip install clickupython[frame]).
+
+    Args:
+        :ids (numpy.ndarray): The task ids.
+        :codes (dict[str, numpy.ndarray]): Label codes of the categorical and multi-valued columns.
+        :rows (dict[str, numpy.ndarray]): Task row of each code of the multi-valued columns.
+        :categories (dict[str, list]): Labels of each categorical and multi-valued column, by code.
+        :timestamps (dict[str, numpy.ndarray]): The timestamp columns.
+    """
+
+    def __init__(
+        self,
+        ids: Any,
+        codes: dict[str, Any],
+        rows: dict[str, Any],
+        categories: dict[str, list[Any]],
+        timestamps: dict[str, Any],
+    ) -> None:
+        _require_numpy()
+        self.ids = ids
+        self.codes = codes
+        self.rows = rows
+        self.categories = categories
+        self.timestamps = timestamps
+
+    @classmethod
+    def from_tasks(
+        cls, tasks: Iterable[Union[models.Task, models.BaseModelList[models.Task]]]
+    ) -> "TaskFrame":
+        """Builds a frame from tasks or pages of tasks, such as the output of iter_tasks or get_tasks.
+
+        Tasks are consumed one at a time and not kept, so a frame can be built from a
+        paginator without holding every Task in memory.
+
+        Args:
+            :tasks (Iterable[models.Task | models.Tasks]): Tasks, pages of tasks, or a mix.
+
+        Returns:
+            :TaskFrame: The tasks as columns.
+        """
+        _require_numpy()
+        ids: list[str] = []
+        vocabularies: dict[str, dict[Any, int]] = {
+            column: {} for column in CATEGORICAL + MULTI_VALUED
+        }
+        codes = {column: array("i") for column in CATEGORICAL + MULTI_VALUED}
+        rows = {column: array("i") for column in MULTI_VALUED}
+        timestamps = {column: array("d") for column in TIMESTAMPS}
+
+        def encode(column: str, label: Any) -> int:
+            if label is None:
+                return -1
+            vocabulary = vocabularies[column]
+            return vocabulary.setdefault(label, len(vocabulary))
+
+        def add(task: models.Task) -> None:
+            row = len(ids)
+            ids.append(task.id or "")
+            status = task.status.status if task.status is not None else None
+            codes["status"].append(encode("status", status))
+            codes["priority"].append(encode("priority", _priority_label(task.priority)))
+            # Multi-valued columns have no missing-value group, so None labels are skipped
+            for user in task.assignees or []:
+                if user.id is not None:
+                    codes["assignee"].append(encode("assignee", user.id))
+                    rows["assignee"].append(row)
+            for tag in task.task_tags or []:
+                name = tag.get("name") if isinstance(tag, dict) else tag
+                if name is not None:
+                    codes["tag"].append(encode("tag", name))
+                    rows["tag"].append(row)
+            for column in TIMESTAMPS:
+                timestamps[column].append(_milliseconds(getattr(task, column)))
+
+        for item in tasks:
+            if isinstance(item, models.BaseModelList):
+                for task in item:
+                    add(task)
+            else:
+                add(item)
+
+        return cls(
+            ids=np.array(ids, dtype=str),
+            codes={
+                column: np.frombuffer(values, dtype=np.int32)
+                for column, values in codes.items()
+            },
+            rows={
+                column: np.frombuffer(values, dtype=np.int32)
+                for column, values in rows.items()
+            },
+            categories={
+                column: list(vocabulary) for column, vocabulary in vocabularies.items()
+            },
+            timestamps={
+                column: np.frombuffer(values, dtype=np.float64)
+                for column, values in timestamps.items()
+            },
+        )
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    @property
+    def nbytes(self) -> int:
+        """Bytes held by the column arrays."""
+        arrays = [self.ids, *self.codes.values(), *self.rows.values()]
+        return sum(column.nbytes for column in arrays + list(self.timestamps.values()))
+
+    def isin(self, column: str, labels: Iterable[Any]) -> Any:
+        """Returns a mask of the tasks with any of the labels in a categorical or multi-valued column.
+
+        Args:
+            :column (str): "status", "priority", "assignee" or "tag".
+            :labels (Iterable): Labels such as status names, or user ids for "assignee".
+
+        Returns:
+            :numpy.ndarray: A boolean mask with one entry per task.
+        """
+        self.__check_column(column, CATEGORICAL + MULTI_VALUED)
+        vocabulary = self.categories[column]
+        wanted = [vocabulary.index(label) for label in labels if label in vocabulary]
+        matches = np.isin(self.codes[column], wanted)
+        if column in CATEGORICAL:
+            return matches
+        mask = np.zeros(len(self), dtype=bool)
+        mask[self.rows[column][matches]] = True
+        return mask
+
+    def filter(self, mask: Any) -> "TaskFrame":
+        """Returns a new frame with the tasks where mask is True.
+
+        Args:
+            :mask (numpy.ndarray): A boolean mask with one entry per task.
+
+        Returns:
+            :TaskFrame: The selected tasks, sharing the label vocabularies of this frame.
+        """
+        mask = np.asarray(mask, dtype=bool)
+        if mask.shape != (len(self),):
+            raise exceptions.ClickupClientError(
+                f"Expected a mask of {len(self)} values, got shape {mask.shape}.", None
+            )
+        # New row number of every kept row
+        renumbered = np.cumsum(mask, dtype=np.int32) - 1
+        codes = {column: self.codes[column][mask] for column in CATEGORICAL}
+        rows = {}
+        for column in MULTI_VALUED:
+            kept = mask[self.rows[column]]
+            codes[column] = self.codes[column][kept]
+            rows[column] = renumbered[self.rows[column][kept]]
+        return TaskFrame(
+            ids=self.ids[mask],
+            codes=codes,
+            rows=rows,
+            categories=self.categories,
+            timestamps={
+                column: values[mask] for column, values in self.timestamps.items()
+            },
+        )
+
+    def count_by(self, column: str) -> dict[Any, int]:
+        """Counts tasks per label of a categorical or multi-valued column.
+
+        A task with several assignees or tags counts once for each. Tasks without
+        a status or priority are counted under None.
+
+        Args:
+            :column (str): "status", "priority", "assignee" or "tag".
+
+        Returns:
+            :dict: The number of tasks per label, leaving out labels with none.
+        """
+        return {
+            label: int(count)
+            for label, count in self.aggregate(column, "count").items()
+            if count
+        }
+
+    def aggregate(
+        self, by: str, agg: str = "count", column: Optional[str] = None
+    ) -> dict[Any, float]:
+        """Groups tasks by a categorical or multi-valued column and aggregates a timestamp column.
+
+        Args:
+            :by (str): "status", "priority", "assignee" or "tag".
+            :agg (str, optional): "count", "sum", "mean", "min" or "max". Defaults to "count".
+            :column (str, optional): The timestamp column to aggregate, such as "time_estimate".
+                Required unless agg is "count". NaN values are ignored. Defaults to None.
+
+        Returns:
+            :dict: The aggregate per label, with None for tasks without a label. Groups
+                with no values get 0 for count and sum and NaN otherwise.
+        """
+        self.__check_column(by, CATEGORICAL + MULTI_VALUED)
+        if agg not in AGGREGATES:
+            raise exceptions.ClickupClientError(
+                f"Unknown aggregate {agg!r}, expected one of {AGGREGATES}.", None
+            )
+        if agg != "count" or column is not None:
+            self.__check_column(column, TIMESTAMPS)
+
+        codes = self.codes[by]
+        rows = self.rows[by] if by in MULTI_VALUED else None
+        labels = list(self.categories[by])
+        if by in CATEGORICAL:
+            # Tasks without a label get the code after the last label
+            codes = np.where(codes < 0, len(labels), codes)
+            labels.append(None)
+        groups = len(labels)
+
+        if column is None:
+            values = np.ones(len(codes))
+        else:
+            values = self.timestamps[column]
+            values = values[rows] if rows is not None else values
+        present = ~np.isnan(values)
+        codes, values = codes[present], values[present]
+
+        counts = np.bincount(codes, minlength=groups)
+        if agg == "count":
+            result = counts.astype(float)
+        elif agg == "sum":
+            result = np.bincount(codes, weights=values, minlength=groups)
+        elif agg == "mean":
+            sums = np.bincount(codes, weights=values, minlength=groups)
+            with np.errstate(invalid="ignore", divide="ignore"):
+                result = sums / counts
+        else:
+            fill, reduce = (
+                (np.inf, np.minimum) if agg == "min" else (-np.inf, np.maximum)
+            )
+            result = np.full(groups, fill)
+            reduce.at(result, codes, values)
+            result[counts == 0] = np.nan
+        return {label: float(value) for label, value in zip(labels, result)}
+
+    @staticmethod
+    def __check_column(column: Optional[str], allowed: tuple[str, ...]) -> None:
+        if column not in allowed:
+            raise exceptions.ClickupClientError(
+                f"Unknown column {column!r}, expected one of {allowed}.", None
+            )
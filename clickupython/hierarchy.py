@@ -0,0 +1,257 @@
+import threading
+import time
+from typing import Any, Callable, Iterator, NamedTuple, Optional
+
+# Node kinds, from the top of a workspace down
+TEAM = "team"
+SPACE = "space"
+FOLDER = "folder"
+LIST = "list"
+
+_ROOT = ("root", "")
+
+
+class HierarchyNode(NamedTuple):
+    """A team, space, folder or list known to a HierarchyIndex."""
+
+    kind: str
+    id: str
+    name: Optional[str]
+    parent: Optional[tuple[str, str]]
+    item: Any
+
+    @property
+    def key(self) -> tuple[str, str]:
+        return (self.kind, self.id)
+
+
+class HierarchyIndex:
+    """A cached index of the team -> space -> folder -> list hierarchy.
+
+    Branches are loaded lazily the first time they are looked at and reused until
+    they are older than the TTL, so jobs that only need one space do not pay for the
+    whole workspace and repeated lookups cost no requests. A space is loaded with one
+    get_folders call (which already embeds each folder's lists) and one
+    get_folderless_lists call, instead of a get_lists call per folder.
+
+    Args:
+        :client (ClickUpClient): The client used to load the hierarchy.
+        :ttl (float, optional): Seconds a loaded branch stays fresh. Defaults to 300.
+    """
+
+    def __init__(
+        self,
+        client: Any,
+        ttl: float = 300.0,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self.client = client
+        self.ttl = ttl
+        self.clock = clock
+
+        self.nodes: dict[tuple[str, str], HierarchyNode] = {}
+        # Parent key -> (time loaded, child keys)
+        self.branches: dict[tuple[str, str], tuple[float, list[tuple[str, str]]]] = {}
+        self.lock = threading.RLock()
+
+    def teams(self) -> list[HierarchyNode]:
+        """Returns every team (workspace) the token can access."""
+        return self.__children(_ROOT)
+
+    def spaces(self, team_id: str) -> list[HierarchyNode]:
+        """Returns the spaces of a team."""
+        return self.__children((TEAM, team_id))
+
+    def folders(self, space_id: str) -> list[HierarchyNode]:
+        """Returns the folders of a space."""
+        return [
+            node for node in self.__children((SPACE, space_id)) if node.kind == FOLDER
+        ]
+
+    def lists(self, space_id: str) -> list[HierarchyNode]:
+        """Returns every list in a space, in folders or not."""
+        found = []
+        for node in self.__children((SPACE, space_id)):
+            if node.kind == FOLDER:
+                found.extend(self.__children(node.key))
+            else:
+                found.append(node)
+        return found
+
+    def folder_lists(self, folder_id: str) -> list[HierarchyNode]:
+        """Returns the lists of a folder."""
+        return self.__children((FOLDER, folder_id))
+
+    def folderless_lists(self, space_id: str) -> list[HierarchyNode]:
+        """Returns the lists of a space that are not in a folder."""
+        return [
+            node for node in self.__children((SPACE, space_id)) if node.kind == LIST
+        ]
+
+    def children(self, kind: str, id: str) -> list[HierarchyNode]:
+        """Returns the direct children of any node: the spaces of a team, the folders
+        and folderless lists of a space or the lists of a folder."""
+        return self.__children((kind, id))
+
+    def get(self, kind: str, id: str) -> Optional[HierarchyNode]:
+        """Looks up a node by kind and id.
+
+        Loads only the branches needed to find it, and refreshes the branch holding it
+        if that branch has expired.
+
+        Args:
+            :kind (str): One of "team", "space", "folder" or "list".
+            :id (str): The ClickUp id of the node.
+
+        Returns:
+            :HierarchyNode: The node, or None if it does not exist.
+        """
+        key = (kind, str(id))
+        with self.lock:
+            node = self.nodes.get(key)
+            if node is not None and node.parent is not None:
+                self.__children(node.parent)
+                node = self.nodes.get(key)
+            if node is not None:
+                return node
+
+        for node in self.__walk(kind):
+            if node.key == key:
+                return node
+        return None
+
+    def find(
+        self, kind: str, name: str, parent: Optional[tuple[str, str]] = None
+    ) -> Optional[HierarchyNode]:
+        """Looks up the first node of a kind with the given name.
+
+        Args:
+            :kind (str): One of "team", "space", "folder" or "list".
+            :name (str): The name to look for.
+            :parent (tuple[str, str], optional): (kind, id) of a node to search under instead of the whole workspace. Defaults to None.
+
+        Returns:
+            :HierarchyNode: The first match, or None if there is none.
+        """
+        if parent is not None:
+            nodes: Iterator[HierarchyNode] = self.__walk(
+                kind, (parent[0], str(parent[1]))
+            )
+        else:
+            nodes = self.__walk(kind)
+        for node in nodes:
+            if node.kind == kind and node.name == name:
+                return node
+        return None
+
+    def parent(self, kind: str, id: str) -> Optional[HierarchyNode]:
+        """Returns the parent of a node: the team of a space, the space of a folder or
+        folderless list, or the folder of a list. None for teams and unknown nodes."""
+        node = self.get(kind, id)
+        if node is None or node.parent is None or node.parent == _ROOT:
+            return None
+        return self.nodes.get(node.parent)
+
+    def ancestors(self, kind: str, id: str) -> list[HierarchyNode]:
+        """Returns the chain of parents of a node, nearest first, ending with its team."""
+        chain = []
+        node = self.parent(kind, id)
+        while node is not None:
+            chain.append(node)
+            node = self.parent(node.kind, node.id)
+        return chain
+
+    def refresh(self, kind: Optional[str] = None, id: Optional[str] = None) -> None:
+        """Drops cached branches so they are loaded again on next use.
+
+        Args:
+            :kind (str, optional): Kind of the node whose subtree is dropped. Defaults to None.
+            :id (str, optional): Id of the node whose subtree is dropped. With no node
+                given, the whole index is dropped. Defaults to None.
+        """
+        with self.lock:
+            if kind is None or id is None:
+                self.nodes.clear()
+                self.branches.clear()
+            else:
+                self.__drop_branch((kind, str(id)))
+
+    def __walk(
+        self, kind: str, start: tuple[str, str] = _ROOT
+    ) -> Iterator[HierarchyNode]:
+        # Depth first, stopping at the requested kind so deeper branches stay unloaded
+        depth = (TEAM, SPACE, FOLDER, LIST)
+        target = depth.index(kind)
+        for node in self.__children(start):
+            yield node
+            if depth.index(node.kind) < target:
+                yield from self.__walk(kind, node.key)
+
+    def __children(self, key: tuple[str, str]) -> list[HierarchyNode]:
+        with self.lock:
+            branch = self.branches.get(key)
+            if branch is None or self.clock() - branch[0] >= self.ttl:
+                self.__load(key)
+                branch = self.branches[key]
+            return [self.nodes[child] for child in branch[1] if child in self.nodes]
+
+    def __load(self, key: tuple[str, str]) -> None:
+        kind, id = key
+        self.__drop_branch(key)
+        now = self.clock()
+
+        if key == _ROOT:
+            children = [
+                self.__add(TEAM, team.id, team.name, key, team)
+                for team in self.client.get_teams()
+            ]
+        elif kind == TEAM:
+            children = [
+                self.__add(SPACE, space.id, space.name, key, space)
+                for space in self.client.get_spaces(id)
+            ]
+        elif kind == SPACE:
+            children = []
+            for folder in self.client.get_folders(id):
+                # Folders come with their lists, so their branches are loaded too
+                folder_key = self.__add(FOLDER, folder.id, folder.name, key, folder)
+                children.append(folder_key)
+                self.branches[folder_key] = (
+                    now,
+                    self.__add_lists(folder.lists, folder_key),
+                )
+            fetched_lists = self.client.get_folderless_lists(id)
+            children.extend(self.__add_lists(fetched_lists.get("lists"), key))
+        elif kind == FOLDER:
+            folder = self.client.get_folder(id)
+            children = self.__add_lists(folder.lists, key)
+        else:
+            children = []
+
+        self.branches[key] = (now, children)
+
+    def __add_lists(
+        self, fetched_lists: Optional[list[dict[str, Any]]], parent: tuple[str, str]
+    ) -> list[tuple[str, str]]:
+        return [
+            self.__add(LIST, item["id"], item.get("name"), parent, item)
+            for item in fetched_lists or []
+        ]
+
+    def __add(
+        self,
+        kind: str,
+        id: Any,
+        name: Optional[str],
+        parent: tuple[str, str],
+        item: Any,
+    ) -> tuple[str, str]:
+        node = HierarchyNode(kind, str(id), name, parent, item)
+        self.nodes[node.key] = node
+        return node.key
+
+    def __drop_branch(self, key: tuple[str, str]) -> None:
+        _, children = self.branches.pop(key, (0.0, []))
+        for child in children:
+            self.__drop_branch(child)
+            self.nodes.pop(child, None)
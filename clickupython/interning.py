@@ -0,0 +1,183 @@
+import threading
+from typing import Any, Iterable, TypeVar, get_args
+
+from pydantic import BaseModel
+
+from clickupython import models
+
+M = TypeVar("M")
+
+# Nested models repeated across the tasks of a response
+INTERNED_TYPES = (models.User, models.Status, models.Space, models.Folder)
+
+
+# The frozen subclasses that interned instances belong to, see _frozen_class()
+_FROZEN_CLASSES: set[type] = set()
+
+
+def _origin(model: BaseModel) -> type:
+    return getattr(type(model), "__interned_base__", type(model))
+
+
+def _interned_eq(self: BaseModel, other: Any) -> bool:
+    # Equal to the regular model with the same content, in both directions
+    if isinstance(other, BaseModel):
+        return _origin(self) is _origin(other) and self.__dict__ == other.__dict__
+    return NotImplemented
+
+
+def _interned_hash(self: BaseModel) -> int:
+    return hash((_origin(self), self.__dict__.get("id")))
+
+
+def _frozen_class(model: type) -> type:
+    """Returns the frozen subclass of a model used for interned instances, creating it on first use."""
+    name = f"Interned{model.__name__}"
+    frozen = globals().get(name)
+    if frozen is None:
+        frozen = type(
+            name,
+            (model,),
+            {
+                "__module__": __name__,
+                "__interned_base__": model,
+                "model_config": {**model.model_config, "frozen": True},
+                "__eq__": _interned_eq,
+                "__hash__": _interned_hash,
+            },
+        )
+        # Module-level so interned instances can be pickled
+        globals()[name] = frozen
+        _FROZEN_CLASSES.add(frozen)
+    return frozen
+
+
+class Interner:
+    """Replaces repeated nested models with one shared, frozen instance.
+
+    Within a page of tasks the same users, statuses, spaces and folders appear in
+    every task. intern_nested() walks a parsed response and swaps each of them for
+    the instance already seen with the same id and the same content, so a snapshot
+    holds one copy of each. Shared instances are frozen subclasses of the original
+    models: isinstance checks and comparisons with regular models still work, and
+    assigning to their fields raises instead of changing every task at once.
+
+    One Interner can be kept for a whole session, or a new one used per page.
+
+    Args:
+        :types (Iterable[type], optional): The models to intern. Defaults to User, Status, Space and Folder.
+    """
+
+    def __init__(self, types: Iterable[type] = INTERNED_TYPES) -> None:
+        self.types = tuple(types)
+        self.hits = 0
+        self.misses = 0
+
+        self.__lock = threading.Lock()
+        self.__instances: dict[tuple[type, Any], list[BaseModel]] = {}
+        self.__walked: dict[type, tuple[str, ...]] = {}
+
+    def __len__(self) -> int:
+        return sum(len(bucket) for bucket in self.__instances.values())
+
+    def clear(self) -> None:
+        with self.__lock:
+            self.__instances.clear()
+
+    def intern(self, model: M) -> M:
+        """Returns the shared instance equal to a model, adding a frozen copy of it if there is none.
+
+        Args:
+            :model (BaseModel): An instance of one of the interned types.
+
+        Returns:
+            :BaseModel: A frozen instance equal to model.
+        """
+        origin = _origin(model)  # type: ignore[arg-type]
+        key = (origin, model.__dict__.get("id"))
+        with self.__lock:
+            bucket = self.__instances.setdefault(key, [])
+            for shared in bucket:
+                if shared.__dict__ == model.__dict__:
+                    self.hits += 1
+                    return shared  # type: ignore[return-value]
+            frozen = _frozen_class(origin)
+            shared = frozen.__new__(frozen)
+            object.__setattr__(shared, "__dict__", dict(model.__dict__))
+            fields_set = set(model.model_fields_set)  # type: ignore[attr-defined]
+            object.__setattr__(shared, "__pydantic_fields_set__", fields_set)
+            object.__setattr__(shared, "__pydantic_extra__", None)
+            object.__setattr__(shared, "__pydantic_private__", None)
+            bucket.append(shared)
+            self.misses += 1
+            return shared  # type: ignore[no-any-return]
+
+    def intern_nested(self, value: M) -> M:
+        """Interns the nested models of a parsed response in place and returns it.
+
+        Args:
+            :value (BaseModel | BaseModelList | list): A model, a list model such as
+                Tasks, or a list of models.
+
+        Returns:
+            :The same value, now referring to shared instances.
+        """
+        if isinstance(value, models.LazyBaseModelList):
+            # Intern each item as it is built rather than building them all now
+            create_item = value.create_item
+
+            def create_interned_item(json_obj: dict[str, Any]) -> Any:
+                return self.intern_nested(create_item(json_obj))
+
+            value.create_item = create_interned_item  # type: ignore[method-assign]
+            return value
+        if isinstance(value, models.BaseModelList):
+            value.items = self.__intern_list(value.items)
+            return value
+        if isinstance(value, list):
+            return self.__intern_list(value)  # type: ignore[return-value]
+        if isinstance(value, BaseModel):
+            return self.__intern_value(value)  # type: ignore[no-any-return]
+        return value
+
+    def __intern_list(self, values: list[Any]) -> list[Any]:
+        return [self.__intern_value(item) for item in values]
+
+    def __intern_value(self, value: Any) -> Any:
+        if isinstance(value, list):
+            return self.__intern_list(value)
+        if not isinstance(value, BaseModel) or type(value) in _FROZEN_CLASSES:
+            return value
+        fields = value.__dict__
+        for name in self.__walked_fields(type(value)):
+            field_value = fields.get(name)
+            if field_value is not None:
+                fields[name] = self.__intern_value(field_value)
+        if isinstance(value, self.types):
+            return self.intern(value)
+        return value
+
+    def __walked_fields(self, model: type) -> tuple[str, ...]:
+        """Returns the fields of a model that can hold an interned type, skipping the rest."""
+        fields = self.__walked.get(model)
+        if fields is None:
+            model_fields: dict[str, Any] = getattr(model, "model_fields")
+            fields = self.__walked[model] = tuple(
+                name
+                for name, field in model_fields.items()
+                if self.__may_hold(field.annotation, set())
+            )
+        return fields
+
+    def __may_hold(self, annotation: Any, seen: set[type]) -> bool:
+        if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+            if issubclass(annotation, self.types):
+                return True
+            if annotation in seen:
+                return False
+            seen.add(annotation)
+            return any(
+                self.__may_hold(field.annotation, seen)
+                for field in annotation.model_fields.values()
+            )
+        return any(self.__may_hold(arg, seen) for arg in get_args(annotation))
@@ -1,17 +1,25 @@
+import copy
+import types
 from abc import abstractmethod
 from typing import (
     Optional,
     List,
     Any,
+    Callable,
     Generator,
     Iterator,
     Sequence,
     TypeVar,
     Generic,
     Type,
+    Union,
+    get_args,
+    get_origin,
 )
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, TypeAdapter, ValidationError, create_model
+
+from clickupython import exceptions
 
 
 # Single entry dict that appears a lot
@@ -21,18 +29,86 @@ class EnabledBool(BaseModel):
 
 # Class to hold a list of BaseModels
 T = TypeVar("T")  # Define type variable T
+M = TypeVar("M")
+L = TypeVar("L", bound="BaseModelList[Any]")
+
+# TypeAdapter(list[item model]) of each BaseModelList subclass, see items_adapter()
+_ITEMS_ADAPTERS: dict[type, TypeAdapter[list[Any]]] = {}
 
 
 class BaseModelList(Generic[T]):
     def __init__(self, **kwargs: dict[str, dict[str, Any]]) -> None:
-        self.items: list[T] = []
-
-        for json_item in kwargs[next(iter(kwargs))]:
-            self.items.append(self.create_item(json_item))
+        self.items: list[T] = self.create_items(kwargs[next(iter(kwargs))])
 
     @abstractmethod
     def create_item(self, json_obj: dict[str, Any]) -> T: ...
 
+    def create_items(self, json_items: Sequence[dict[str, Any]]) -> list[T]:
+        """Validates the whole array in one pydantic-core call, rather than per item."""
+        items: list[T] = self.items_adapter().validate_python(json_items)
+        return items
+
+    @classmethod
+    def items_adapter(cls) -> TypeAdapter[list[Any]]:
+        """Returns the cached TypeAdapter(list[item model]) of the class."""
+        adapter = _ITEMS_ADAPTERS.get(cls)
+        if adapter is None:
+            item_model: Any = cls.item_model()
+            adapter = _ITEMS_ADAPTERS[cls] = TypeAdapter(list[item_model])
+        return adapter
+
+    @classmethod
+    def item_model(cls) -> type:
+        """Returns the model class of the items, read from the BaseModelList[...] base."""
+        for klass in cls.__mro__:
+            for base in getattr(klass, "__orig_bases__", ()):
+                for arg in get_args(base):
+                    if isinstance(arg, type) and issubclass(arg, BaseModel):
+                        return arg
+        raise TypeError(f"{cls.__name__} does not declare its item model")
+
+    @classmethod
+    def construct(cls: Type[L], **kwargs: Any) -> L:
+        """Builds the list from trusted data without validating it, see models.construct()."""
+        create_item = _constructor(cls.item_model())
+
+        def create_items(json_items: Sequence[dict[str, Any]]) -> list[Any]:
+            return [create_item(json_item) for json_item in json_items]
+
+        return cls.__with_builders(create_item, create_items, kwargs)
+
+    @classmethod
+    def validate_or_construct(cls: Type[L], **kwargs: Any) -> L:
+        """Builds the list validating it, constructing the items that fail, see models.validate_or_construct()."""
+        item_model = cls.item_model()
+
+        def create_item(json_obj: dict[str, Any]) -> Any:
+            return validate_or_construct(item_model, json_obj)
+
+        def create_items(json_items: Sequence[dict[str, Any]]) -> list[Any]:
+            try:
+                items: list[Any] = cls.items_adapter().validate_python(json_items)
+            except ValidationError:
+                # Only the items that fail validation are constructed
+                return [create_item(json_item) for json_item in json_items]
+            return items
+
+        return cls.__with_builders(create_item, create_items, kwargs)
+
+    @classmethod
+    def __with_builders(
+        cls: Type[L],
+        create_item: Callable[[dict[str, Any]], Any],
+        create_items: Callable[[Sequence[dict[str, Any]]], list[Any]],
+        kwargs: dict[str, Any],
+    ) -> L:
+        model_list = cls.__new__(cls)
+        # Shadow the builders so __init__, and lazy access later, use them
+        model_list.create_item = create_item  # type: ignore[method-assign]
+        model_list.create_items = create_items  # type: ignore[method-assign]
+        model_list.__init__(**kwargs)  # type: ignore[misc]
+        return model_list
+
     def __iter__(self) -> Iterator[T]:
         return iter(self.items)
 
@@ -40,6 +116,48 @@ class BaseModelList(Generic[T]):
         return self.items[index]
 
 
+class LazyBaseModelList(BaseModelList[T]):
+    """A BaseModelList that keeps the raw JSON items and only builds (and validates) each
+    model the first time it is indexed or iterated to.
+
+    len() and values() read the raw items, so counting a page or collecting its IDs
+    builds no models at all. Reading `items` builds every model.
+    """
+
+    def __init__(self, **kwargs: Any) -> None:
+        self.raw_items: list[dict[str, Any]] = list(kwargs[next(iter(kwargs))])
+        self.__built: list[Optional[T]] = [None] * len(self.raw_items)
+
+    @property
+    def items(self) -> list[T]:  # type: ignore[override]
+        return [self[index] for index in range(len(self.raw_items))]
+
+    def values(self, field: str) -> list[Any]:
+        """Returns one raw field of every item, such as values("id"), without building models."""
+        return [json_item.get(field) for json_item in self.raw_items]
+
+    def __len__(self) -> int:
+        return len(self.raw_items)
+
+    def __bool__(self) -> bool:
+        # Truthy even when empty, like BaseModelList, which defines no __len__
+        return True
+
+    def __iter__(self) -> Iterator[T]:
+        for index in range(len(self.raw_items)):
+            yield self[index]
+
+    def __getitem__(self, index: int) -> T:
+        if isinstance(index, slice):
+            # A list, like slicing BaseModelList, building only the items in the slice
+            return [self[i] for i in range(*index.indices(len(self)))]  # type: ignore[return-value]
+        item = self.__built[index]
+        if item is None:
+            item = self.create_item(self.raw_items[index])
+            self.__built[index] = item
+        return item
+
+
 class Status(BaseModel):
     id: Optional[str] = None
     status: Optional[str] = None
@@ -248,6 +366,10 @@ class Comments(BaseModelList[Comment]):
         return Comment(**json_obj)
 
 
+class LazyComments(LazyBaseModelList[Comment], Comments):
+    pass
+
+
 class Option(BaseModel):
     id: Optional[str]
 
@@ -391,10 +513,102 @@ class Task(BaseModel):
 
 
 class Tasks(BaseModelList[Task]):
+    def __init__(self, **kwargs: Any) -> None:
+        super().__init__(**kwargs)
+        # Set by the task endpoints on the final page of a query
+        self.last_page: Optional[bool] = kwargs.get("last_page")
+
     def create_item(self, json_obj: dict[str, Any]) -> Task:
         return Task(**json_obj)
 
 
+class LazyTasks(LazyBaseModelList[Task], Tasks):
+    def __init__(self, **kwargs: Any) -> None:
+        LazyBaseModelList.__init__(self, **kwargs)
+        self.last_page = kwargs.get("last_page")
+
+
+# The Task fields of a TaskSummary, and the default of fields= on the task getters
+SUMMARY_FIELDS = ("id", "name", "status", "assignees", "date_updated")
+
+
+class TaskSummary(BaseModel):
+    """A slim Task for listings, holding only the SUMMARY_FIELDS."""
+
+    id: Optional[str] = None
+    name: Optional[str] = None
+    status: Optional[Status] = None
+    assignees: Optional[list[User]] = None
+    date_updated: Optional[str] = None
+
+
+class TaskSummaries(BaseModelList[TaskSummary]):
+    # Set on the classes made by task_summaries() for other projections
+    summary_model: Type[BaseModel] = TaskSummary
+
+    def __init__(self, **kwargs: Any) -> None:
+        super().__init__(**kwargs)
+        self.last_page: Optional[bool] = kwargs.get("last_page")
+
+    def create_item(self, json_obj: dict[str, Any]) -> Any:
+        return self.summary_model(**json_obj)
+
+    @classmethod
+    def item_model(cls) -> type:
+        return cls.summary_model
+
+
+# Projected TaskSummaries classes by field names, see task_summaries()
+_SUMMARIES: dict[frozenset[str], Type[TaskSummaries]] = {}
+
+
+def task_summaries(fields: Sequence[str] = SUMMARY_FIELDS) -> Type[TaskSummaries]:
+    """Returns the TaskSummaries class whose items hold only the given Task fields.
+
+    The JSON of every other field is dropped without being parsed into models, so a
+    projection leaving out custom_fields, space and folder skips most of the work of
+    building a Task. The id is always kept. The default fields give TaskSummary
+    items; any other projection gets its own model, also named TaskSummary, with the
+    same annotations and defaults as Task.
+
+    Args:
+        :fields (Sequence[str], optional): Task field names, or their JSON keys such as "tags". Defaults to SUMMARY_FIELDS.
+
+    Returns:
+        :type: A TaskSummaries subclass, the same one for the same set of fields.
+    """
+    aliases = {field.alias or name: name for name, field in Task.model_fields.items()}
+    unknown = [
+        field
+        for field in fields
+        if field not in Task.model_fields and field not in aliases
+    ]
+    if unknown:
+        raise exceptions.ClickupClientError(f"Unknown Task fields: {unknown}", None)
+
+    names = frozenset(aliases.get(field, field) for field in fields) | {"id"}
+    summaries = _SUMMARIES.get(names)
+    if summaries is None:
+        if names == frozenset(SUMMARY_FIELDS):
+            summaries = TaskSummaries
+        else:
+            # Declaration order of Task, so serialization matches it
+            summary_model = create_model(  # type: ignore[call-overload]
+                "TaskSummary",
+                __module__=__name__,
+                **{
+                    name: (field.annotation, copy.copy(field))
+                    for name, field in Task.model_fields.items()
+                    if name in names
+                },
+            )
+            summaries = type(
+                "TaskSummaries", (TaskSummaries,), {"summary_model": summary_model}
+            )
+        _SUMMARIES[names] = summaries
+    return summaries
+
+
 class Member(BaseModel):
     user: User
     invited_by: Optional[User] = None
@@ -502,3 +716,128 @@ class TimeTrackingDataList(BaseModel):
 
 class TimeTrackingDataSingle(BaseModel):
     data: Optional[TimeTrackingData] = None
+
+
+# Builds each model class from trusted data, by (model, fallback), see construct()
+_CONSTRUCTORS: dict[tuple[type, bool], Callable[[dict[str, Any]], Any]] = {}
+
+
+def construct(model: Type[M], data: dict[str, Any]) -> M:
+    """Builds a model, or a BaseModelList, from trusted API data without validating it.
+
+    Each model is created with pydantic's model_construct, and nested models are built
+    the same way, so the status, assignees and custom fields of a Task are still
+    Status, User and CustomField objects. As with validation, undeclared keys are
+    dropped and missing fields get their defaults, but values are neither checked
+    nor coerced. A missing required field is set to None rather than left unset.
+
+    Args:
+        :model (type): A BaseModel or BaseModelList subclass.
+        :data (dict[str, Any]): The decoded JSON of the response.
+
+    Returns:
+        :model: An instance of model.
+    """
+    if issubclass(model, BaseModelList):
+        return model.construct(**data)  # type: ignore[return-value]
+    return _constructor(model)(data)  # type: ignore[no-any-return]
+
+
+def validate_or_construct(model: Type[M], data: dict[str, Any]) -> M:
+    """Validates a model, or a BaseModelList, building what fails with model_construct instead of raising.
+
+    Data that validates is returned exactly as model(**data) would return it. A model
+    that fails is constructed as in construct(), except that each nested model is
+    again validated first, so only the parts that drifted are left unchecked.
+
+    Args:
+        :model (type): A BaseModel or BaseModelList subclass.
+        :data (dict[str, Any]): The decoded JSON of the response.
+
+    Returns:
+        :model: An instance of model.
+    """
+    if issubclass(model, BaseModelList):
+        return model.validate_or_construct(**data)  # type: ignore[return-value]
+    try:
+        return model.model_validate(data)  # type: ignore[attr-defined, no-any-return]
+    except ValidationError:
+        return _constructor(model, fallback=True)(data)  # type: ignore[no-any-return]
+
+
+def _constructor(
+    model: Type[BaseModel], fallback: bool = False
+) -> Callable[[dict[str, Any]], Any]:
+    constructor = _CONSTRUCTORS.get((model, fallback))
+    if constructor is None:
+        constructor = _CONSTRUCTORS[(model, fallback)] = _model_constructor(
+            model, fallback
+        )
+    return constructor
+
+
+def _model_constructor(
+    model: Type[BaseModel], fallback: bool
+) -> Callable[[dict[str, Any]], Any]:
+    # Keys are the names the fields have in the JSON, their alias if they have one
+    required = {}
+    nested = []
+    for name, field in model.model_fields.items():
+        key = field.alias or name
+        if field.is_required():
+            required[key] = name
+        build = _value_builder(field.annotation, fallback)
+        if build is not None:
+            nested.append((key, build))
+
+    def constructor(data: dict[str, Any]) -> BaseModel:
+        values = dict(data)
+        for key, build in nested:
+            value = values.get(key)
+            if value is not None:
+                values[key] = build(value)
+        missing = [name for key, name in required.items() if key not in values]
+        for name in missing:
+            values[name] = None
+        instance = model.model_construct(**values)
+        # Filled in so reading them gives None, but they were not set by the response
+        instance.model_fields_set.difference_update(missing)
+        return instance
+
+    return constructor
+
+
+def _value_builder(annotation: Any, fallback: bool) -> Optional[Callable[[Any], Any]]:
+    """Returns a function building the nested models of a field, or None if it holds none.
+
+    With fallback, each nested model is validated first, see validate_or_construct().
+    """
+    origin = get_origin(annotation)
+    if origin is Union or origin is types.UnionType:
+        builders = [
+            _value_builder(arg, fallback)
+            for arg in get_args(annotation)
+            if arg is not type(None)
+        ]
+        # Only Optional[...] of a single type is unambiguous
+        return builders[0] if len(builders) == 1 else None
+    if origin is list:
+        args = get_args(annotation)
+        build_item = _value_builder(args[0], fallback) if args else None
+        if build_item is None:
+            return None
+        return lambda value: (
+            [build_item(item) for item in value] if isinstance(value, list) else value
+        )
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        if fallback:
+            return lambda value: (
+                validate_or_construct(annotation, value)
+                if isinstance(value, dict)
+                else value
+            )
+        # Looked up on use, since a model may nest itself
+        return lambda value: (
+            _constructor(annotation)(value) if isinstance(value, dict) else value
+        )
+    return None
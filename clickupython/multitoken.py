@@ -0,0 +1,70 @@
+from typing import Any, List
+
+from clickupython import exceptions
+from clickupython.cache import token_scope
+from clickupython.client import ClickUpClient
+from clickupython.ratelimit import RateLimitState, TokenBucket
+
+
+class MultiTokenClickUpClient(ClickUpClient):
+    """A ClickUpClient that spreads its requests over several access tokens.
+
+    Every token gets its own rate limiter, corrected from the rate-limit headers of
+    the responses to requests sent with it. Each request (and each retry) is routed
+    to the token with the most budget left, so bulk reads get close to N times the
+    throughput of a single token. All ClickUpClient methods work unchanged.
+    rate_limit_remaining is the budget of the token used last; page prefetching and
+    batches are bounded by the budget of all the tokens together.
+
+    The tokens should belong to users with access to the same workspaces, since any
+    request may be sent with any of them.
+
+    Args:
+        :accesstokens (List[str]): The access tokens to spread requests over.
+
+        The remaining keyword arguments are the same as for ClickUpClient, except
+        rate_limiter, which is created per token.
+    """
+
+    def __init__(self, accesstokens: List[str], **kwargs: Any) -> None:
+        if not accesstokens:
+            raise exceptions.ClickupClientError(
+                "At least one access token is required.", None
+            )
+        if "rate_limiter" in kwargs:
+            raise exceptions.ClickupClientError(
+                "Rate limiters are created per token and cannot be passed in.", None
+            )
+
+        super().__init__(accesstokens[0], **kwargs)
+        self.accesstokens = list(accesstokens)
+        self.rate_limiters: dict[str, TokenBucket] = {
+            accesstokens[0]: self.rate_limiter
+        }
+        for accesstoken in self.accesstokens[1:]:
+            self.rate_limiters[accesstoken] = self._create_rate_limiter(accesstoken)
+
+    @property
+    def rate_limit_states(self) -> List[RateLimitState]:
+        """The current state of every token's rate limiter, in the order the tokens were given."""
+        return [self.rate_limiters[token].state() for token in self.accesstokens]
+
+    def _prefetch_budget(self) -> int:
+        """Returns the requests every token can still issue together, so prefetching and batches use the pooled budget."""
+        return sum(state.remaining for state in self.rate_limit_states) - 1
+
+    def _cache_scope(self) -> str:
+        """Returns one scope for all the tokens, since any of them may have fetched a response."""
+        return token_scope(*self.accesstokens)
+
+    def _select_token(self) -> tuple[str, TokenBucket]:
+        """Picks the token that can send a request soonest: the most tokens in its bucket,
+        then the most requests left in the server's window."""
+        best_token = self.accesstokens[0]
+        best_key = None
+        for token in self.accesstokens:
+            state = self.rate_limiters[token].state()
+            key = (state.tokens, state.remaining)
+            if best_key is None or key > best_key:
+                best_token, best_key = token, key
+        return best_token, self.rate_limiters[best_token]
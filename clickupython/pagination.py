@@ -0,0 +1,129 @@
+import asyncio
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import AsyncIterator, Awaitable, Callable, Iterator, Optional
+
+from clickupython import models
+
+# Maximum number of tasks the task endpoints return per page
+TASK_PAGE_SIZE = 100
+
+
+def is_last_page(tasks: models.Tasks) -> bool:
+    """Returns True if a page of tasks is the last one for its query.
+
+    Uses the server's last_page flag, falling back to comparing the page length
+    against TASK_PAGE_SIZE for responses that do not include it.
+    """
+    if tasks.last_page is not None:
+        return tasks.last_page
+    if isinstance(tasks, models.LazyBaseModelList):
+        # Count the raw items rather than building every task
+        return len(tasks) < TASK_PAGE_SIZE
+    return len(tasks.items) < TASK_PAGE_SIZE
+
+
+def iter_pages(
+    fetch_page: Callable[[int], models.Tasks],
+    page: int = 0,
+    prefetch: int = 0,
+    budget: Optional[Callable[[], int]] = None,
+) -> Iterator[models.Tasks]:
+    """Yields pages of tasks in server order until the last page is reached.
+
+    Args:
+        :fetch_page (Callable[[int], models.Tasks]): Fetches a single page by number.
+        :page (int, optional): The page to start from. Defaults to 0.
+        :prefetch (int, optional): Number of upcoming pages to keep in flight while the
+            current one is consumed. 0 fetches pages one after another. Defaults to 0.
+        :budget (Callable[[], int], optional): Returns how many more requests the rate limit
+            currently allows. The prefetch window never exceeds it. Defaults to None.
+
+    Yields:
+        :models.Tasks: Each page, in order.
+    """
+    if prefetch <= 0:
+        while True:
+            tasks = fetch_page(page)
+            yield tasks
+            if is_last_page(tasks):
+                return
+            page += 1
+
+    yield from _prefetch_pages(fetch_page, page, prefetch, budget)
+
+
+def _prefetch_pages(
+    fetch_page: Callable[[int], models.Tasks],
+    page: int,
+    window: int,
+    budget: Optional[Callable[[], int]],
+) -> Iterator[models.Tasks]:
+    in_flight: dict[int, Future[models.Tasks]] = {}
+    next_page = page
+    # The page being consumed plus `window` upcoming ones
+    executor = ThreadPoolExecutor(
+        max_workers=window + 1, thread_name_prefix="clickupython-prefetch"
+    )
+    try:
+        while True:
+            allowed = window if budget is None else max(0, min(window, budget() - 1))
+            while len(in_flight) <= allowed:
+                in_flight[next_page] = executor.submit(fetch_page, next_page)
+                next_page += 1
+
+            tasks = in_flight.pop(page).result()
+            yield tasks
+            if is_last_page(tasks):
+                return
+            page += 1
+    finally:
+        # Pages past the last one (or past an error) are speculative; drop them
+        for future in in_flight.values():
+            future.cancel()
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+async def aiter_pages(
+    fetch_page: Callable[[int], Awaitable[models.Tasks]],
+    page: int = 0,
+    prefetch: int = 0,
+    budget: Optional[Callable[[], int]] = None,
+) -> AsyncIterator[models.Tasks]:
+    """The asyncio counterpart of iter_pages, with the upcoming pages fetched as tasks.
+
+    Args:
+        :fetch_page (Callable[[int], Awaitable[models.Tasks]]): Fetches a single page by number.
+
+        The remaining arguments are the same as for iter_pages.
+
+    Yields:
+        :models.Tasks: Each page, in order.
+    """
+    if prefetch <= 0:
+        while True:
+            tasks = await fetch_page(page)
+            yield tasks
+            if is_last_page(tasks):
+                return
+            page += 1
+
+    in_flight: dict[int, asyncio.Task[models.Tasks]] = {}
+    next_page = page
+    try:
+        while True:
+            allowed = (
+                prefetch if budget is None else max(0, min(prefetch, budget() - 1))
+            )
+            while len(in_flight) <= allowed:
+                in_flight[next_page] = asyncio.ensure_future(fetch_page(next_page))
+                next_page += 1
+
+            tasks = await in_flight.pop(page)
+            yield tasks
+            if is_last_page(tasks):
+                return
+            page += 1
+    finally:
+        # Pages past the last one (or past an error) are speculative; drop them
+        for task in in_flight.values():
+            task.cancel()
@@ -0,0 +1,242 @@
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+from contextlib import contextmanager
+from typing import Callable, Iterator, NamedTuple, Optional
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - not available on Windows
+    fcntl = None  # type: ignore
+
+from clickupython import exceptions
+
+
+class RateLimitState(NamedTuple):
+    """A snapshot of a rate limiter, as returned by TokenBucket.state()."""
+
+    tokens: float
+    refill_rate: float
+    capacity: int
+    remaining: int
+    reset: float
+
+
+class TokenBucket:
+    """Paces requests to stay inside the ClickUp rate limit without stalling.
+
+    The bucket holds at most `burst` tokens and refills continuously. Every request
+    takes a token; when none are left the caller waits only until the next token
+    arrives, so requests are spread evenly across the rate-limit window instead of
+    bursting until the limit is hit and then stalling until it resets.
+
+    The refill rate is corrected from the x-ratelimit-remaining and x-ratelimit-reset
+    headers of every response: the requests the server still allows are spread evenly
+    over the time left until the reset, and the bucket never holds more tokens than the
+    server has left.
+
+    Args:
+        :capacity (int, optional): Requests allowed per window. Defaults to 100.
+        :window (float, optional): Length of the rate-limit window in seconds. Defaults to 60.
+        :burst (int, optional): Maximum number of requests sent back to back. Defaults to 10.
+        :buffer (float, optional): Extra seconds to wait after a reset once the budget is exhausted. Defaults to 0.
+    """
+
+    def __init__(
+        self,
+        capacity: int = 100,
+        window: float = 60.0,
+        burst: int = 10,
+        buffer: float = 0.0,
+        clock: Callable[[], float] = time.time,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        self.capacity = capacity
+        self.window = window
+        self.burst = max(1, burst)
+        self.buffer = buffer
+        self.clock = clock
+        self.sleep = sleep
+
+        self.tokens = float(min(self.burst, capacity))
+        self.refill_rate = self.base_rate
+        self.remaining = capacity
+        self.reset = 0.0
+        self.updated = clock()
+        self.lock = threading.Lock()
+
+    @contextmanager
+    def synchronized(self) -> Iterator[None]:
+        """Holds exclusive access to the bucket state while reading or changing it."""
+        with self.lock:
+            yield
+
+    @property
+    def base_rate(self) -> float:
+        """Tokens per second when the whole window's budget is available."""
+        return self.capacity / self.window
+
+    def state(self) -> RateLimitState:
+        """Returns a snapshot of the limiter after accounting for elapsed time."""
+        with self.synchronized():
+            self._refill(self.clock())
+            return RateLimitState(
+                tokens=self.tokens,
+                refill_rate=self.refill_rate,
+                capacity=self.capacity,
+                remaining=self.remaining,
+                reset=self.reset,
+            )
+
+    def reserve(self) -> float:
+        """Takes a token and returns how many seconds the caller must wait before sending.
+
+        Concurrent callers each get their own place in line, so the returned delays
+        grow with the number of requests already waiting.
+        """
+        with self.synchronized():
+            now = self.clock()
+            self._refill(now)
+            self.tokens -= 1
+            if self.tokens >= 0:
+                return 0.0
+            return self._time_until(-self.tokens, now)
+
+    def acquire(self) -> float:
+        """Blocks until a token is available and returns the time spent waiting."""
+        delay = self.reserve()
+        if delay > 0:
+            self.sleep(delay)
+        return delay
+
+    def update(self, remaining: int, reset: float, limit: Optional[int] = None) -> None:
+        """Corrects the bucket from the rate-limit headers of a response.
+
+        Args:
+            :remaining (int): Requests the server still allows in the current window.
+            :reset (float): Unix timestamp at which the server's window resets.
+            :limit (int, optional): Requests allowed per window, if reported. Defaults to None.
+        """
+        with self.synchronized():
+            now = self.clock()
+            self._refill(now)
+            if limit:
+                self.capacity = limit
+            self.remaining = remaining
+            self.reset = reset
+            self.tokens = min(self.tokens, float(remaining))
+
+            time_left = reset - now
+            if time_left > 0:
+                # Spread what is left over the rest of the window without overshooting it
+                self.refill_rate = max(remaining - max(self.tokens, 0.0), 0) / time_left
+            else:
+                self.refill_rate = self.base_rate
+
+    def _refill(self, now: float) -> None:
+        elapsed_before_reset = max(0.0, min(now, self.reset) - self.updated)
+        elapsed_after_reset = max(0.0, now - max(self.updated, self.reset))
+
+        self.tokens += elapsed_before_reset * self.refill_rate
+        if now >= self.reset:
+            self.refill_rate = self.base_rate
+            self.tokens += elapsed_after_reset * self.refill_rate
+        self.tokens = min(self.tokens, float(self.burst))
+        self.updated = now
+
+    def _time_until(self, deficit: float, now: float) -> float:
+        if now < self.reset:
+            before_reset = self.reset - now
+            gained = self.refill_rate * before_reset
+            if gained >= deficit:
+                return deficit / self.refill_rate
+            return before_reset + self.buffer + (deficit - gained) / self.base_rate
+        return deficit / self.base_rate
+
+
+class SharedTokenBucket(TokenBucket):
+    """A TokenBucket whose state is shared by every process on the host using the same token.
+
+    The bucket state lives in a small file on local disk and every read or update
+    happens under an exclusive file lock, so several worker processes using one
+    access token draw from a single budget and together stay under the server limit.
+    Only a hash of the token is used to name the file. Requires a POSIX system.
+
+    Args:
+        :accesstoken (str): The access token whose rate limit is shared.
+        :directory (str, optional): Directory that holds the state files. Defaults to a
+            clickupython-ratelimit folder in the system temp directory.
+
+        The remaining arguments are the same as for TokenBucket.
+    """
+
+    STATE_FIELDS = (
+        "tokens",
+        "refill_rate",
+        "capacity",
+        "remaining",
+        "reset",
+        "updated",
+    )
+
+    def __init__(
+        self,
+        accesstoken: str,
+        directory: Optional[str] = None,
+        capacity: int = 100,
+        window: float = 60.0,
+        burst: int = 10,
+        buffer: float = 0.0,
+        clock: Callable[[], float] = time.time,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        if fcntl is None:
+            raise exceptions.ClickupClientError(
+                "Shared rate limiting requires a POSIX system.", None
+            )
+        super().__init__(capacity, window, burst, buffer, clock, sleep)
+
+        directory = directory or os.path.join(
+            tempfile.gettempdir(), "clickupython-ratelimit"
+        )
+        os.makedirs(directory, mode=0o700, exist_ok=True)
+        token_hash = hashlib.sha256(accesstoken.encode()).hexdigest()[:32]
+        self.path = os.path.join(directory, f"{token_hash}.json")
+
+    @contextmanager
+    def synchronized(self) -> Iterator[None]:
+        """Holds the thread lock and an exclusive lock on the state file, loading the
+        shared state on entry and writing it back on exit."""
+        with self.lock:
+            fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o600)
+            with os.fdopen(fd, "r+b") as state_file:
+                fcntl.flock(state_file, fcntl.LOCK_EX)
+                try:
+                    self._load(state_file.read())
+                    yield
+                    state_file.seek(0)
+                    state_file.truncate()
+                    state_file.write(self._dump())
+                    state_file.flush()
+                finally:
+                    fcntl.flock(state_file, fcntl.LOCK_UN)
+
+    def _load(self, raw: bytes) -> None:
+        if not raw:
+            # First user of this token seeds the shared state with its own
+            return
+        try:
+            state = json.loads(raw)
+        except ValueError:
+            return
+        for field in self.STATE_FIELDS:
+            if field in state:
+                setattr(self, field, state[field])
+
+    def _dump(self) -> bytes:
+        return json.dumps(
+            {field: getattr(self, field) for field in self.STATE_FIELDS}
+        ).encode()
@@ -0,0 +1,107 @@
+import random
+import time
+from typing import Any, Callable, Iterable, Mapping, Optional
+
+import requests
+
+try:
+    import httpx
+except ImportError:  # pragma: no cover - optional dependency
+    httpx = None  # type: ignore
+
+# Statuses worth trying again: rate limited and transient server errors
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+# Methods that can be repeated without changing the result
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+
+RETRY_EXCEPTIONS: tuple[type[BaseException], ...] = (
+    requests.exceptions.ConnectionError,
+    requests.exceptions.Timeout,
+    requests.exceptions.ChunkedEncodingError,
+)
+if httpx is not None:
+    RETRY_EXCEPTIONS += (httpx.TransportError,)
+
+
+class RetryPolicy:
+    """Decides whether and when a failed request is sent again.
+
+    Retryable failures are the statuses in retry_statuses and the connection
+    errors in retry_exceptions. Waits grow exponentially from backoff_base up to
+    backoff_max with full jitter, and rate-limited responses wait at least until
+    the x-ratelimit-reset (or Retry-After) time the server reported.
+
+    Only idempotent methods are retried unless a request is marked safe to repeat
+    or retry_unsafe_writes is set.
+
+    Args:
+        :max_attempts (int, optional): Total attempts per request, including the first. Defaults to 3.
+        :backoff_base (float, optional): Seconds to wait before the first retry. Defaults to 0.5.
+        :backoff_max (float, optional): Upper bound for the exponential backoff. Defaults to 30.
+        :jitter (bool, optional): Randomise waits between zero and the backoff. Defaults to True.
+        :retry_statuses (Iterable[int], optional): Retryable HTTP statuses. Defaults to RETRY_STATUSES.
+        :retry_exceptions (tuple, optional): Retryable transport exceptions. Defaults to RETRY_EXCEPTIONS.
+        :retry_unsafe_writes (bool, optional): Also retry non-idempotent requests such as POST. Defaults to False.
+    """
+
+    def __init__(
+        self,
+        max_attempts: int = 3,
+        backoff_base: float = 0.5,
+        backoff_max: float = 30.0,
+        jitter: bool = True,
+        retry_statuses: Iterable[int] = RETRY_STATUSES,
+        retry_exceptions: tuple[type[BaseException], ...] = RETRY_EXCEPTIONS,
+        retry_unsafe_writes: bool = False,
+        clock: Callable[[], float] = time.time,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        self.max_attempts = max(1, max_attempts)
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.jitter = jitter
+        self.retry_statuses = frozenset(retry_statuses)
+        self.retry_exceptions = retry_exceptions
+        self.retry_unsafe_writes = retry_unsafe_writes
+        self.clock = clock
+        self.sleep = sleep
+
+    def allows(self, method: str, safe: bool = False) -> bool:
+        """Returns True if requests with this method may be retried at all."""
+        return method.upper() in IDEMPOTENT_METHODS or safe or self.retry_unsafe_writes
+
+    def should_retry_status(self, attempt: int, status_code: int) -> bool:
+        return attempt < self.max_attempts and status_code in self.retry_statuses
+
+    def should_retry_exception(self, attempt: int, error: BaseException) -> bool:
+        return attempt < self.max_attempts and isinstance(error, self.retry_exceptions)
+
+    def delay(
+        self,
+        attempt: int,
+        status_code: Optional[int] = None,
+        headers: Optional[Mapping[str, Any]] = None,
+    ) -> float:
+        """Returns how many seconds to wait before the attempt after `attempt`.
+
+        Args:
+            :attempt (int): The number of the attempt that just failed, starting at 1.
+            :status_code (int, optional): The status of the failed response, if any. Defaults to None.
+            :headers (Mapping, optional): The headers of the failed response, if any. Defaults to None.
+        """
+        backoff = min(self.backoff_max, self.backoff_base * 2 ** (attempt - 1))
+        if self.jitter:
+            backoff = random.uniform(0, backoff)
+
+        if status_code == 429 and headers:
+            retry_after = headers.get("retry-after")
+            reset = headers.get("x-ratelimit-reset")
+            try:
+                if retry_after:
+                    backoff = max(backoff, float(retry_after))
+                elif reset:
+                    backoff = max(backoff, float(reset) - self.clock())
+            except ValueError:
+                pass
+        return max(0.0, backoff)
@@ -0,0 +1,206 @@
+import codecs
+import json
+from typing import Any, AsyncIterable, AsyncIterator, Iterable, Iterator, Optional
+
+from clickupython import exceptions
+from clickupython import models
+from clickupython.interning import Interner
+from clickupython.pagination import TASK_PAGE_SIZE
+
+_WHITESPACE = " \t\n\r"
+
+
+class ArrayStreamParser:
+    """Incrementally parses a JSON object and yields the elements of one of its arrays.
+
+    Chunks of the body are fed as they arrive. Elements of the array under `key` are
+    returned as soon as they are complete, and only the unparsed remainder is kept,
+    so memory stays bounded by the largest element plus one chunk. The other
+    top-level values are collected in `fields`.
+
+    Args:
+        :key (str): The top-level key of the array to stream.
+    """
+
+    def __init__(self, key: str) -> None:
+        self.key = key
+        self.fields: dict[str, Any] = {}
+        self.done = False
+
+        self.__final = False
+        self.__decoder = json.JSONDecoder()
+        self.__text = codecs.getincrementaldecoder("utf-8")()
+        self.__buffer = ""
+        self.__state = "start"
+        self.__current_key: Optional[str] = None
+
+    def feed(self, chunk: bytes) -> list[Any]:
+        """Adds a chunk of the body and returns the array elements it completed."""
+        self.__buffer += self.__text.decode(chunk)
+        return self.__parse()
+
+    def close(self) -> None:
+        """Checks that the whole object was received."""
+        self.__buffer += self.__text.decode(b"", final=True)
+        self.__final = True
+        self.__parse()
+        if not self.done:
+            raise exceptions.ClickupClientError("Truncated JSON response", None)
+
+    def __parse(self) -> list[Any]:
+        items = []
+        buffer = self.__buffer
+        pos = 0
+        while not self.done:
+            while pos < len(buffer) and buffer[pos] in _WHITESPACE:
+                pos += 1
+            if pos == len(buffer):
+                break
+            char = buffer[pos]
+
+            if self.__state == "start":
+                if char != "{":
+                    raise exceptions.ClickupClientError("Expected a JSON object", None)
+                pos += 1
+                self.__state = "key"
+            elif self.__state == "key":
+                if char == ",":
+                    pos += 1
+                    continue
+                if char == "}":
+                    pos += 1
+                    self.done = True
+                    continue
+                parsed = self.__decode(buffer, pos)
+                if parsed is None:
+                    break
+                self.__current_key, pos = parsed
+                self.__state = "colon"
+            elif self.__state == "colon":
+                if char != ":":
+                    raise exceptions.ClickupClientError("Expected ':'", None)
+                pos += 1
+                self.__state = "value"
+            elif self.__state == "value":
+                if self.__current_key == self.key and char == "[":
+                    pos += 1
+                    self.__state = "array"
+                    continue
+                parsed = self.__decode(buffer, pos)
+                if parsed is None:
+                    break
+                self.fields[self.__current_key], pos = parsed  # type: ignore[index]
+                self.__state = "key"
+            elif self.__state == "array":
+                if char == ",":
+                    pos += 1
+                    continue
+                if char == "]":
+                    pos += 1
+                    self.__state = "key"
+                    continue
+                parsed = self.__decode(buffer, pos)
+                if parsed is None:
+                    break
+                item, pos = parsed
+                items.append(item)
+
+        self.__buffer = buffer[pos:]
+        return items
+
+    def __decode(self, buffer: str, pos: int) -> Optional[tuple[Any, int]]:
+        try:
+            value, end = self.__decoder.raw_decode(buffer, pos)
+        except json.JSONDecodeError:
+            # Most likely cut off mid-value; wait for the next chunk
+            return None
+        if type(value) in (int, float) and not self.__final:
+            # A number cut off by the chunk boundary parses as a shorter one ("1" of
+            # "1.5"); only trust it once a delimiter follows
+            if end == len(buffer) or buffer[end] in ".eE":
+                return None
+        return value, end
+
+
+def iter_array(chunks: Iterable[bytes], parser: ArrayStreamParser) -> Iterator[Any]:
+    """Feeds chunks to a parser and yields array elements as they complete."""
+    for chunk in chunks:
+        yield from parser.feed(chunk)
+    parser.close()
+
+
+class TaskStream:
+    """A page of tasks parsed from the response while it downloads.
+
+    Iterating yields each models.Task as soon as its JSON is complete. last_page is
+    known once the page has been consumed. A page can be iterated only once.
+
+    Args:
+        :chunks (Iterable[bytes]): The response body as it arrives.
+        :trusted (bool, optional): Build tasks with models.construct instead of validating them. Defaults to False.
+        :strict (bool, optional): Raise on tasks that fail validation rather than building them
+            with models.validate_or_construct. Defaults to True.
+        :interner (Interner, optional): Interns the nested models of each task. Defaults to None.
+        :model (type, optional): The model of each task, such as a TaskSummary. Defaults to models.Task.
+    """
+
+    def __init__(
+        self,
+        chunks: Iterable[bytes],
+        trusted: bool = False,
+        strict: bool = True,
+        interner: Optional[Interner] = None,
+        model: type = models.Task,
+    ) -> None:
+        self.parser = ArrayStreamParser("tasks")
+        self.chunks = chunks
+        self.trusted = trusted
+        self.strict = strict
+        self.interner = interner
+        self.model = model
+        self.count = 0
+        self.last_page: Optional[bool] = None
+
+    def __iter__(self) -> Iterator[Any]:
+        for item in iter_array(self.chunks, self.parser):
+            yield self._build(item)
+        self._finish()
+
+    def _build(self, item: dict[str, Any]) -> Any:
+        """Builds the model of one task of the page."""
+        self.count += 1
+        if self.trusted:
+            task = models.construct(self.model, item)
+        elif self.strict:
+            task = self.model(**item)
+        else:
+            task = models.validate_or_construct(self.model, item)
+        if self.interner is not None:
+            task = self.interner.intern_nested(task)
+        return task
+
+    def _finish(self) -> None:
+        """Sets last_page once the whole page has been parsed."""
+        last_page = self.parser.fields.get("last_page")
+        self.last_page = (
+            last_page if last_page is not None else self.count < TASK_PAGE_SIZE
+        )
+
+
+class AsyncTaskStream(TaskStream):
+    """The asyncio counterpart of TaskStream, iterated with async for.
+
+    Args:
+        :chunks (AsyncIterable[bytes]): The response body as it arrives.
+
+        The remaining arguments are the same as for TaskStream.
+    """
+
+    chunks: AsyncIterable[bytes]  # type: ignore[assignment]
+
+    async def __aiter__(self) -> AsyncIterator[Any]:
+        async for chunk in self.chunks:
+            for item in self.parser.feed(chunk):
+                yield self._build(item)
+        self.parser.close()
+        self._finish()
@@ -0,0 +1,300 @@
+import json
+import sqlite3
+import threading
+import time
+from typing import Any, Callable, Iterator, NamedTuple, Optional
+
+from clickupython import exceptions
+from clickupython import models
+
+
+class SyncResult(NamedTuple):
+    """What a TaskMirror sync changed and what it cost."""
+
+    upserted: int
+    deleted: int
+    requests: int
+    high_water: Optional[int]
+    reconciled: bool
+
+
+class TaskMirror:
+    """Keeps a local SQLite replica of the tasks of lists or teams current.
+
+    The first sync of a list or team pulls every task. Later syncs only request
+    tasks whose date_updated is past the stored high-water mark and upsert them, so
+    an unchanged list costs a single request. Tasks deleted or archived upstream do
+    not show up as updates; they are found by a reconciliation that lists only the
+    ids of the scope's tasks, paged in creation order, and compares them with the
+    mirror. It runs at most once per reconcile_interval. A task is removed once it
+    is missing from two reconciliations in a row, so one that a page shift hid from
+    a single listing is kept.
+
+    Args:
+        :client (ClickUpClient): The client used to fetch tasks.
+        :path (str): The SQLite file holding the mirror.
+        :reconcile_interval (float, optional): Seconds between deletion checks. Defaults to 86400.
+    """
+
+    def __init__(
+        self,
+        client: Any,
+        path: str,
+        reconcile_interval: float = 86400.0,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self.client = client
+        self.path = path
+        self.reconcile_interval = reconcile_interval
+        self.clock = clock
+
+        self.lock = threading.Lock()
+        self.connection = sqlite3.connect(path, timeout=30, check_same_thread=False)
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        with self.connection:
+            self.connection.execute(
+                "CREATE TABLE IF NOT EXISTS tasks ("
+                "scope TEXT NOT NULL, id TEXT NOT NULL, date_updated INTEGER, "
+                "body TEXT NOT NULL, PRIMARY KEY (scope, id))"
+            )
+            self.connection.execute(
+                "CREATE TABLE IF NOT EXISTS sync_state ("
+                "scope TEXT PRIMARY KEY, high_water INTEGER, last_reconciled REAL)"
+            )
+            # Mirrored tasks absent from the latest reconciliation
+            self.connection.execute(
+                "CREATE TABLE IF NOT EXISTS missing ("
+                "scope TEXT NOT NULL, id TEXT NOT NULL, PRIMARY KEY (scope, id))"
+            )
+
+    def close(self) -> None:
+        self.connection.close()
+
+    def sync_list(self, list_id: str, reconcile: Optional[bool] = None) -> SyncResult:
+        """Brings the mirror of a list up to date, including closed tasks and subtasks.
+
+        Args:
+            :list_id (str): The id of the list to mirror.
+            :reconcile (bool, optional): Force (True) or skip (False) the deletion check
+                instead of running it when reconcile_interval has passed. Defaults to None.
+
+        Returns:
+            :SyncResult: The number of tasks written and removed and the requests used.
+        """
+
+        def fetch(date_updated_gt: Optional[str]) -> Iterator[models.Task]:
+            return self.client.iter_tasks(
+                list_id,
+                order_by="updated",
+                subtasks=True,
+                include_closed=True,
+                date_updated_gt=date_updated_gt,
+            )
+
+        def fetch_ids() -> Iterator[Optional[str]]:
+            tasks = self.client.iter_tasks(
+                list_id,
+                order_by="created",
+                subtasks=True,
+                include_closed=True,
+                fields=("id",),
+            )
+            return (task.id for task in tasks)
+
+        return self.__sync(f"list:{list_id}", fetch, fetch_ids, reconcile)
+
+    def sync_team(self, team_id: str, reconcile: Optional[bool] = None) -> SyncResult:
+        """Brings the mirror of every task in a team up to date. See sync_list."""
+
+        def fetch(date_updated_gt: Optional[str]) -> Iterator[models.Task]:
+            return self.client.iter_team_tasks(
+                team_id,
+                order_by="updated",
+                subtasks=True,
+                include_closed=True,
+                date_updated_gt=date_updated_gt,
+            )
+
+        def fetch_ids() -> Iterator[Optional[str]]:
+            tasks = self.client.iter_team_tasks(
+                team_id,
+                order_by="created",
+                subtasks=True,
+                include_closed=True,
+                fields=("id",),
+            )
+            return (task.id for task in tasks)
+
+        return self.__sync(f"team:{team_id}", fetch, fetch_ids, reconcile)
+
+    def tasks(
+        self, list_id: Optional[str] = None, team_id: Optional[str] = None
+    ) -> models.Tasks:
+        """Returns the mirrored tasks of a list or team, most recently updated first."""
+        scope = self.__scope(list_id, team_id)
+        with self.lock:
+            rows = self.connection.execute(
+                "SELECT body FROM tasks WHERE scope = ? ORDER BY date_updated DESC",
+                (scope,),
+            ).fetchall()
+        return models.Tasks(tasks=[json.loads(body) for (body,) in rows])
+
+    def get_task(
+        self,
+        task_id: str,
+        list_id: Optional[str] = None,
+        team_id: Optional[str] = None,
+    ) -> Optional[models.Task]:
+        """Returns a mirrored task, or None if the list or team mirror does not hold it."""
+        scope = self.__scope(list_id, team_id)
+        with self.lock:
+            row = self.connection.execute(
+                "SELECT body FROM tasks WHERE scope = ? AND id = ?", (scope, task_id)
+            ).fetchone()
+        return models.Task(**json.loads(row[0])) if row else None
+
+    def patch_task(self, task_id: str, fields: dict[str, Any]) -> int:
+        """Overwrites fields of a mirrored task in every list or team mirror holding it.
+
+        Used to apply webhook events without a request. The high-water mark is left
+        alone, so the next sync still fetches the full task.
+
+        Args:
+            :task_id (str): The id of the task.
+            :fields (dict[str, Any]): Task fields by their API names, such as "name" or "status".
+
+        Returns:
+            :int: The number of mirrored copies patched.
+        """
+        with self.lock, self.connection:
+            rows = self.connection.execute(
+                "SELECT scope, body FROM tasks WHERE id = ?", (task_id,)
+            ).fetchall()
+            for scope, body in rows:
+                task = {**json.loads(body), **fields}
+                date_updated = task.get("date_updated")
+                self.connection.execute(
+                    "UPDATE tasks SET body = ?, date_updated = ? "
+                    "WHERE scope = ? AND id = ?",
+                    (
+                        models.Task(**task).model_dump_json(by_alias=True),
+                        int(date_updated) if date_updated else None,
+                        scope,
+                        task_id,
+                    ),
+                )
+        return len(rows)
+
+    def delete_task(self, task_id: str) -> int:
+        """Removes a task from every list or team mirror and returns how many copies were removed."""
+        with self.lock, self.connection:
+            return self.connection.execute(
+                "DELETE FROM tasks WHERE id = ?", (task_id,)
+            ).rowcount
+
+    def high_water(
+        self, list_id: Optional[str] = None, team_id: Optional[str] = None
+    ) -> Optional[int]:
+        """Returns the latest date_updated (in ms) seen for a list or team."""
+        return self.__state(self.__scope(list_id, team_id))[0]
+
+    @staticmethod
+    def __scope(list_id: Optional[str], team_id: Optional[str]) -> str:
+        if list_id is not None:
+            return f"list:{list_id}"
+        if team_id is not None:
+            return f"team:{team_id}"
+        raise exceptions.ClickupClientError("A list_id or team_id is required.", None)
+
+    def __state(self, scope: str) -> tuple[Optional[int], Optional[float]]:
+        with self.lock:
+            row = self.connection.execute(
+                "SELECT high_water, last_reconciled FROM sync_state WHERE scope = ?",
+                (scope,),
+            ).fetchone()
+        return (row[0], row[1]) if row else (None, None)
+
+    def __sync(
+        self,
+        scope: str,
+        fetch: Callable[[Optional[str]], Iterator[models.Task]],
+        fetch_ids: Callable[[], Iterator[Optional[str]]],
+        reconcile: Optional[bool],
+    ) -> SyncResult:
+        start_requests = self.client.request_count
+        high_water, last_reconciled = self.__state(scope)
+        now = self.clock()
+        if reconcile is None:
+            reconcile = high_water is not None and (
+                last_reconciled is None
+                or now - last_reconciled >= self.reconcile_interval
+            )
+
+        # A first sync sees every task and has nothing to remove
+        first_sync = high_water is None
+        # date_updated_gt is exclusive; step back 1ms so tasks updated in the same
+        # millisecond as the mark are not skipped. Re-upserting them is harmless.
+        since = None if first_sync else str(high_water - 1)
+
+        rows = []
+        for task in fetch(since):
+            date_updated = int(task.date_updated) if task.date_updated else None
+            if date_updated is not None:
+                high_water = max(high_water or 0, date_updated)
+            rows.append(
+                (scope, task.id, date_updated, task.model_dump_json(by_alias=True))
+            )
+
+        seen = None
+        if reconcile and not first_sync:
+            seen = set(fetch_ids())
+            seen.update(task_id for _, task_id, _, _ in rows)
+
+        deleted = 0
+        with self.lock, self.connection:
+            self.connection.executemany(
+                "INSERT OR REPLACE INTO tasks (scope, id, date_updated, body) "
+                "VALUES (?, ?, ?, ?)",
+                rows,
+            )
+            if seen is not None:
+                deleted = self.__remove_missing(scope, seen)
+            if first_sync or seen is not None:
+                last_reconciled = now
+            self.connection.execute(
+                "INSERT OR REPLACE INTO sync_state (scope, high_water, last_reconciled) "
+                "VALUES (?, ?, ?)",
+                (scope, high_water, last_reconciled),
+            )
+
+        return SyncResult(
+            upserted=len(rows),
+            deleted=deleted,
+            requests=self.client.request_count - start_requests,
+            high_water=high_water,
+            reconciled=first_sync or seen is not None,
+        )
+
+    def __remove_missing(self, scope: str, seen: set[Optional[str]]) -> int:
+        """Removes the mirrored tasks missing from this and the previous reconciliation.
+
+        Must be called holding the lock, within a transaction.
+        """
+        mirrored = self.connection.execute(
+            "SELECT id FROM tasks WHERE scope = ?", (scope,)
+        ).fetchall()
+        gone = {task_id for (task_id,) in mirrored if task_id not in seen}
+        missed = self.connection.execute(
+            "SELECT id FROM missing WHERE scope = ?", (scope,)
+        ).fetchall()
+        confirmed = gone & {task_id for (task_id,) in missed}
+        self.connection.executemany(
+            "DELETE FROM tasks WHERE scope = ? AND id = ?",
+            [(scope, task_id) for task_id in confirmed],
+        )
+        self.connection.execute("DELETE FROM missing WHERE scope = ?", (scope,))
+        self.connection.executemany(
+            "INSERT INTO missing (scope, id) VALUES (?, ?)",
+            [(scope, task_id) for task_id in gone - confirmed],
+        )
+        return len(confirmed)
@@ -0,0 +1,169 @@
+import functools
+import mmap
+import ntpath
+import os
+import uuid
+from typing import IO, Any, AsyncIterator, Callable, Iterable, Iterator, Optional
+
+from clickupython import exceptions
+from clickupython.batch import Call, call
+
+# Bytes of the file read from disk at a time
+UPLOAD_CHUNK_SIZE = 64 * 1024
+# Files of at least this many bytes are read through a memory map
+MMAP_THRESHOLD = 16 * 1024 * 1024
+
+# Called with the bytes of the file sent so far and the file size
+Progress = Callable[[int, int], None]
+
+
+class MultipartFile:
+    """A multipart/form-data body that streams one file from disk as it is sent.
+
+    The form fields and the part headers are encoded up front; the file itself is
+    read a chunk at a time while the request is written, so an upload holds one chunk
+    in memory whatever the size of the file. The length is known in advance and sent
+    as Content-Length. Files of at least mmap_threshold bytes are read through a
+    read-only memory map instead of read() calls. The file is opened once, on the
+    first read, and closed as soon as its last byte is sent or the body is closed.
+    rewind() starts the body over, so a retried request sends it again from the top.
+
+    Args:
+        :path (str): The file to upload.
+        :field (str, optional): The form field of the file. Defaults to "attachment".
+        :fields (dict[str, str], optional): Other form fields to send first. Defaults to None.
+        :chunk_size (int, optional): Bytes read from disk at a time. Defaults to UPLOAD_CHUNK_SIZE.
+        :mmap_threshold (int, optional): Size from which the file is memory mapped. Defaults to MMAP_THRESHOLD.
+        :progress (Callable[[int, int], None], optional): Called after every chunk with the
+            bytes of the file sent so far and its size. Defaults to None.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        field: str = "attachment",
+        fields: Optional[dict[str, str]] = None,
+        chunk_size: int = UPLOAD_CHUNK_SIZE,
+        mmap_threshold: int = MMAP_THRESHOLD,
+        progress: Optional[Progress] = None,
+    ) -> None:
+        self.path = path
+        self.filename = ntpath.basename(path)
+        self.size = os.path.getsize(path)
+        self.chunk_size = chunk_size
+        self.mmap_threshold = mmap_threshold
+        self.progress = progress
+        self.sent = 0
+
+        boundary = uuid.uuid4().hex
+        self.content_type = f"multipart/form-data; boundary={boundary}"
+        head = b"".join(
+            f'--{boundary}\r\nContent-Disposition: form-data; name="{name}"\r\n\r\n'.encode()
+            + str(value).encode()
+            + b"\r\n"
+            for name, value in (fields or {}).items()
+        )
+        self.__head = head + (
+            f"--{boundary}\r\n"
+            f'Content-Disposition: form-data; name="{field}"; filename="{self.filename}"\r\n'
+            "Content-Type: application/octet-stream\r\n\r\n"
+        ).encode("utf-8")
+        self.__tail = f"\r\n--{boundary}--\r\n".encode()
+        self.__position = 0
+        self.__file: Optional[IO[bytes]] = None
+        self.__map: Optional[mmap.mmap] = None
+
+    def __len__(self) -> int:
+        return len(self.__head) + self.size + len(self.__tail)
+
+    def __enter__(self) -> "MultipartFile":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Releases the memory map and the file handle, if they are open."""
+        if self.__map is not None:
+            self.__map.close()
+            self.__map = None
+        if self.__file is not None:
+            self.__file.close()
+            self.__file = None
+
+    def rewind(self) -> None:
+        """Closes the file and moves back to the first byte of the body."""
+        self.close()
+        self.__position = 0
+        self.sent = 0
+
+    def read(self, size: int = -1) -> bytes:
+        """Returns up to size bytes of the body, or the rest of it if size is negative."""
+        if size is None or size < 0:
+            size = len(self) - self.__position
+        pieces = []
+        while size > 0 and self.__position < len(self):
+            piece = self.__piece(size)
+            pieces.append(piece)
+            size -= len(piece)
+            self.__position += len(piece)
+        return b"".join(pieces)
+
+    def __iter__(self) -> Iterator[bytes]:
+        while True:
+            chunk = self.read(self.chunk_size)
+            if not chunk:
+                return
+            yield chunk
+
+    async def chunks(self) -> AsyncIterator[bytes]:
+        """Yields the body a chunk at a time, for async HTTP clients."""
+        for chunk in self:
+            yield chunk
+
+    def __piece(self, size: int) -> bytes:
+        head = len(self.__head)
+        if self.__position < head:
+            return self.__head[self.__position : self.__position + size]
+        offset = self.__position - head
+        if offset >= self.size:
+            offset -= self.size
+            return self.__tail[offset : offset + size]
+
+        size = min(size, self.chunk_size, self.size - offset)
+        file = self.__open()
+        if self.__map is not None:
+            data = self.__map[offset : offset + size]
+        else:
+            data = file.read(size)
+        if not data:
+            raise exceptions.ClickupClientError(
+                f"{self.path} was truncated during the upload.", None
+            )
+        self.sent = offset + len(data)
+        if self.sent == self.size:
+            self.close()
+        if self.progress is not None:
+            self.progress(self.sent, self.size)
+        return data
+
+    def __open(self) -> IO[bytes]:
+        if self.__file is None:
+            self.__file = open(self.path, "rb")
+            if self.size >= self.mmap_threshold:
+                self.__map = mmap.mmap(self.__file.fileno(), 0, access=mmap.ACCESS_READ)
+        return self.__file
+
+
+def upload_calls(
+    uploads: Iterable[tuple[str, str]],
+    progress: Optional[Callable[[str, str, int, int], None]] = None,
+) -> Iterator[Call]:
+    """Yields an upload_attachment call per (task_id, file_path), for a batch."""
+    for task_id, file_path in uploads:
+        file_progress = (
+            None
+            if progress is None
+            else functools.partial(progress, task_id, file_path)
+        )
+        yield call("upload_attachment", task_id, file_path, progress=file_progress)
@@ -0,0 +1,289 @@
+import hashlib
+import hmac
+import json
+import logging
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, NamedTuple, Optional
+
+from clickupython.cache import BaseCache
+
+# Task fields whose full new value webhook history items carry in "after"
+PATCHABLE_FIELDS = frozenset(
+    {"name", "status", "due_date", "start_date", "priority", "time_estimate"}
+)
+
+# Event prefixes for resources other than tasks, and the cache path they live under
+RESOURCE_EVENTS = {"list": "list", "folder": "folder", "space": "space"}
+
+logger = logging.getLogger(__name__)
+
+
+class WebhookEvent(NamedTuple):
+    """A ClickUp webhook event, such as taskUpdated or listDeleted."""
+
+    event: str
+    webhook_id: Optional[str]
+    task_id: Optional[str]
+    list_id: Optional[str]
+    folder_id: Optional[str]
+    space_id: Optional[str]
+    history_items: list[dict[str, Any]]
+
+    @classmethod
+    def from_payload(cls, payload: dict[str, Any]) -> "WebhookEvent":
+        return cls(
+            event=payload.get("event", ""),
+            webhook_id=payload.get("webhook_id"),
+            task_id=payload.get("task_id"),
+            list_id=payload.get("list_id"),
+            folder_id=payload.get("folder_id"),
+            space_id=payload.get("space_id"),
+            history_items=payload.get("history_items") or [],
+        )
+
+
+def verify_signature(body: bytes, signature: Optional[str], secret: str) -> bool:
+    """Checks the X-Signature header ClickUp sends with every webhook: the hex HMAC-SHA256 of the body keyed with the webhook secret."""
+    if not signature:
+        return False
+    expected = hmac.new(secret.encode(), body, hashlib.sha256).hexdigest()
+    return hmac.compare_digest(expected, signature)
+
+
+class WebhookProcessor:
+    """Applies batches of webhook events to a response cache, task mirror and hierarchy index.
+
+    Task events drop the task's cached responses. In the mirror, the fields the event
+    reports in full (name, status, dates, priority, estimate) are patched in place
+    and deleted tasks are removed. List, folder and space events drop the affected
+    cached responses and the hierarchy index.
+
+    Events are queued by add() and applied by flush(), either when batch_size events
+    are waiting or when the receiver's timer fires, so a burst of events for the same
+    resource invalidates its cache entries once. An event that fails to apply is
+    logged and counted in `failed`; the rest of its batch is still applied.
+
+    Args:
+        :cache (BaseCache, optional): The client's response cache. Defaults to None.
+        :mirror (TaskMirror, optional): A task mirror to keep current. Defaults to None.
+        :hierarchy (HierarchyIndex, optional): A hierarchy index to refresh. Defaults to None.
+        :batch_size (int, optional): Number of queued events that triggers a flush. Defaults to 100.
+        :on_event (Callable[[WebhookEvent], None], optional): Called for every applied event. Defaults to None.
+    """
+
+    def __init__(
+        self,
+        cache: Optional[BaseCache] = None,
+        mirror: Any = None,
+        hierarchy: Any = None,
+        batch_size: int = 100,
+        on_event: Optional[Callable[[WebhookEvent], None]] = None,
+    ) -> None:
+        self.cache = cache
+        self.mirror = mirror
+        self.hierarchy = hierarchy
+        self.batch_size = batch_size
+        self.on_event = on_event
+
+        self.pending: list[WebhookEvent] = []
+        self.applied = 0
+        self.failed = 0
+        self.lock = threading.Lock()
+
+    def add(self, event: WebhookEvent) -> None:
+        """Queues an event, flushing when the batch is full."""
+        with self.lock:
+            self.pending.append(event)
+            full = len(self.pending) >= self.batch_size
+        if full:
+            self.flush()
+
+    def flush(self) -> int:
+        """Applies every queued event and returns how many were applied without error."""
+        with self.lock:
+            batch, self.pending = self.pending, []
+
+        invalidated: set[str] = set()
+        refresh_hierarchy = False
+        applied = 0
+        for event in batch:
+            path = self.__cache_path(event)
+            if event.task_id is None and path is not None:
+                refresh_hierarchy = True
+            try:
+                self.__apply(event, path, invalidated)
+            except Exception:
+                logger.exception("Failed to apply webhook event %s", event.event)
+                with self.lock:
+                    self.failed += 1
+            else:
+                applied += 1
+
+        if refresh_hierarchy and self.hierarchy is not None:
+            try:
+                self.hierarchy.refresh()
+            except Exception:
+                logger.exception("Failed to refresh the hierarchy index")
+        with self.lock:
+            self.applied += applied
+        return applied
+
+    def __apply(
+        self, event: WebhookEvent, path: Optional[str], invalidated: set[str]
+    ) -> None:
+        if path is not None and path not in invalidated:
+            if self.cache is not None:
+                self.cache.invalidate(path)
+            invalidated.add(path)
+        if self.mirror is not None and event.task_id is not None:
+            self.__apply_to_mirror(event)
+        if self.on_event is not None:
+            self.on_event(event)
+
+    def handle_payload(
+        self, body: bytes, signature: Optional[str], secret: Optional[str]
+    ) -> int:
+        """Verifies and queues one webhook delivery and returns the HTTP status to answer with.
+
+        Args:
+            :body (bytes): The raw request body.
+            :signature (str, optional): The X-Signature header.
+            :secret (str, optional): The webhook secret. Signatures are not checked when None.
+
+        Returns:
+            :int: 200 when queued, 401 for a bad signature and 400 for a malformed body.
+        """
+        if secret is not None and not verify_signature(body, signature, secret):
+            return 401
+        try:
+            payload = json.loads(body)
+        except ValueError:
+            return 400
+        if not isinstance(payload, dict) or not payload.get("event"):
+            return 400
+        self.add(WebhookEvent.from_payload(payload))
+        return 200
+
+    @staticmethod
+    def __cache_path(event: WebhookEvent) -> Optional[str]:
+        if event.task_id is not None:
+            return f"task/{event.task_id}"
+        for prefix, model in RESOURCE_EVENTS.items():
+            resource_id = getattr(event, f"{prefix}_id")
+            if event.event.startswith(prefix) and resource_id is not None:
+                return f"{model}/{resource_id}"
+        return None
+
+    def __apply_to_mirror(self, event: WebhookEvent) -> None:
+        if event.event == "taskDeleted":
+            self.mirror.delete_task(event.task_id)
+            return
+
+        fields: dict[str, Any] = {}
+        dates = []
+        for item in event.history_items:
+            field = item.get("field")
+            if field in PATCHABLE_FIELDS and "after" in item:
+                fields[field] = item["after"]
+            if item.get("date"):
+                dates.append(int(item["date"]))
+        if fields:
+            if dates:
+                fields["date_updated"] = str(max(dates))
+            self.mirror.patch_task(event.task_id, fields)
+
+
+class WebhookReceiver:
+    """A small HTTP server that receives ClickUp webhooks and feeds a WebhookProcessor.
+
+    Deliveries are verified against the webhook secret, queued, and applied in
+    batches every batch_interval seconds by a background thread.
+
+    Args:
+        :processor (WebhookProcessor): Applies the received events.
+        :secret (str, optional): The webhook secret used to verify signatures. Defaults to None (not verified).
+        :host (str, optional): Address to listen on. Defaults to "127.0.0.1".
+        :port (int, optional): Port to listen on; 0 picks a free one. Defaults to 0.
+        :path (str, optional): Request path that accepts deliveries. Defaults to "/clickup/webhook".
+        :batch_interval (float, optional): Seconds between flushes of queued events. Defaults to 1.
+    """
+
+    def __init__(
+        self,
+        processor: WebhookProcessor,
+        secret: Optional[str] = None,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        path: str = "/clickup/webhook",
+        batch_interval: float = 1.0,
+    ) -> None:
+        self.processor = processor
+        self.secret = secret
+        self.path = path
+        self.batch_interval = batch_interval
+
+        self.server = ThreadingHTTPServer((host, port), self.__handler_class())
+        self.__stopped = threading.Event()
+        self.__threads: list[threading.Thread] = []
+
+    @property
+    def url(self) -> str:
+        host, port = self.server.server_address[:2]
+        return f"http://{host}:{port}{self.path}"
+
+    def __enter__(self) -> "WebhookReceiver":
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.stop()
+
+    def start(self) -> None:
+        """Starts serving and flushing in background threads."""
+        self.__stopped.clear()
+        self.__threads = [
+            threading.Thread(target=self.server.serve_forever, daemon=True),
+            threading.Thread(target=self.__flush_periodically, daemon=True),
+        ]
+        for thread in self.__threads:
+            thread.start()
+
+    def stop(self) -> None:
+        """Stops the server and applies any events still queued."""
+        self.__stopped.set()
+        self.server.shutdown()
+        self.server.server_close()
+        for thread in self.__threads:
+            thread.join()
+        self.processor.flush()
+
+    def __flush_periodically(self) -> None:
+        while not self.__stopped.wait(self.batch_interval):
+            try:
+                self.processor.flush()
+            except Exception:
+                # Keep the timer alive; the next flush picks up new events
+                logger.exception("Webhook flush failed")
+
+    def __handler_class(self) -> type[BaseHTTPRequestHandler]:
+        receiver = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_POST(self) -> None:
+                if self.path != receiver.path:
+                    self.send_response(404)
+                    self.end_headers()
+                    return
+                length = int(self.headers.get("Content-Length") or 0)
+                body = self.rfile.read(length)
+                status = receiver.processor.handle_payload(
+                    body, self.headers.get("X-Signature"), receiver.secret
+                )
+                self.send_response(status)
+                self.end_headers()
+
+            def log_message(self, format: str, *args: Any) -> None:
+                pass
+
+        return Handler
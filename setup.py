@@ -31,9 +31,9 @@ setuptools.setup(
         # 'Say Thanks!': '',
     },
     packages=setuptools.find_packages(),
-    python_requires=">=3.6",
+    python_requires=">=3.10",
     install_requires=[
-        "pydantic==1.8.2",
+        "pydantic>=2",
         "typing-extensions==3.10.0.2",
         "word2number==1.1",
         "timefhuman==0.0.5",
@@ -41,7 +41,11 @@ setuptools.setup(
         "typing-extensions==3.10.0.2",
         "setuptools",
     ],
-    # extras_require='requirements.txt',
+    extras_require={
+        "async": ["httpx"],
+        "fast": ["orjson"],
+        "frame": ["numpy"],
+    },
     # entry_points={
     #     'console_scripts': [  # This can provide executable scripts
     #         'run=examplepy:main',
@@ -0,0 +1,118 @@
+import json
+from typing import Any, Callable, Optional, Union
+
+import httpx
+import requests
+from requests.adapters import BaseAdapter
+
+from clickupython.async_client import AsyncClickUpClient
+from clickupython.client import ClickUpClient
+from clickupython.ratelimit import TokenBucket
+
+
+class FakeAdapter(BaseAdapter):
+    """A requests transport adapter that answers from a handler instead of the network."""
+
+    def __init__(
+        self,
+        handler: Callable[[requests.PreparedRequest], Union[tuple, requests.Response]],
+    ) -> None:
+        super().__init__()
+        self.handler = handler
+        self.requests: list[requests.PreparedRequest] = []
+        self.closed = False
+
+    def send(self, request: requests.PreparedRequest, **kwargs: Any) -> requests.Response:  # type: ignore[override]
+        self.requests.append(request)
+        result = self.handler(request)
+        if isinstance(result, requests.Response):
+            return result
+        return make_response(request, *result)
+
+    def close(self) -> None:
+        self.closed = True
+
+
+def make_response(
+    request: Optional[requests.PreparedRequest],
+    status_code: int = 200,
+    body: Any = None,
+    headers: Optional[dict[str, str]] = None,
+) -> requests.Response:
+    response = requests.Response()
+    response.status_code = status_code
+    response.request = request  # type: ignore[assignment]
+    response.url = request.url if request is not None else ""  # type: ignore[assignment]
+    response.headers.update(
+        {"x-ratelimit-remaining": "99", "x-ratelimit-reset": "0", **(headers or {})}
+    )
+    response._content = (
+        body if isinstance(body, bytes) else json.dumps(body or {}).encode()
+    )
+    response._content_consumed = True
+    return response
+
+
+def mount(client: Any, handler: Callable[..., Any]) -> FakeAdapter:
+    adapter = FakeAdapter(handler)
+    client.session.mount("https://", adapter)
+    client.session.mount("http://", adapter)
+    return adapter
+
+
+class UnlimitedBucket(TokenBucket):
+    """A rate limiter that never makes callers wait."""
+
+    def reserve(self) -> float:
+        return 0.0
+
+
+class FakeClock:
+    """A clock, and a sleep, that only move when a test moves them."""
+
+    def __init__(self, now: float = 1000.0) -> None:
+        self.now = now
+        self.slept: list[float] = []
+
+    def __call__(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.slept.append(seconds)
+        self.now += seconds
+
+
+def make_client(
+    handler: Callable[..., Any], accesstoken: str = "API_KEY", **kwargs: Any
+) -> ClickUpClient:
+    """A ClickUpClient answering from handler, never rate limited unless a rate_limiter is passed."""
+    kwargs.setdefault("rate_limiter", UnlimitedBucket())
+    c = ClickUpClient(accesstoken, **kwargs)
+    mount(c, handler)
+    return c
+
+
+def adapter_of(client: Any) -> FakeAdapter:
+    return client.session.get_adapter("https://")
+
+
+def make_async_client(
+    handler: Callable[..., Any], accesstoken: str = "API_KEY", **kwargs: Any
+) -> AsyncClickUpClient:
+    """An AsyncClickUpClient answering from an httpx MockTransport handler."""
+    kwargs.setdefault("rate_limiter", UnlimitedBucket())
+    return AsyncClickUpClient(
+        accesstoken, transport=httpx.MockTransport(handler), **kwargs
+    )
+
+
+def user(user_id: int = 1, username: str = "u") -> dict:
+    return {"id": user_id, "username": username, "color": "", "profilePicture": None}
+
+
+def task(i: int, **fields: Any) -> dict:
+    return {"id": str(i), "name": f"Task {i}", **fields}
+
+
+def tasks(count: int) -> list[dict]:
+    return [task(i) for i in range(count)]
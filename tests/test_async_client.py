@@ -0,0 +1,184 @@
+import asyncio
+import inspect
+import json
+
+import httpx
+import pytest
+
+from clickupython import client
+from clickupython import exceptions
+from clickupython import models
+from clickupython.async_client import AsyncClickUpClient
+
+from tests import fakes
+
+
+def public_methods(cls: type) -> set[str]:
+    return {
+        name
+        for name, member in inspect.getmembers(cls, inspect.isfunction)
+        if not name.startswith("_") and name != "close"
+    }
+
+
+class TestAsyncClient:
+    @pytest.mark.asyncclient
+    def test_method_parity(self) -> None:
+        missing = public_methods(client.ClickUpClient) - public_methods(
+            AsyncClickUpClient
+        )
+
+        assert missing == set()
+        for name in public_methods(AsyncClickUpClient):
+            method = getattr(AsyncClickUpClient, name)
+            assert inspect.iscoroutinefunction(method) or inspect.isasyncgenfunction(
+                method
+            )
+
+    @pytest.mark.asyncclient
+    def test_returns_models(self) -> None:
+        def handler(request: httpx.Request) -> httpx.Response:
+            assert request.headers["Authorization"] == "API_KEY"
+            return httpx.Response(
+                200,
+                json={"tasks": [{"id": "1", "name": "a"}, {"id": "2", "name": "b"}]},
+                headers={"x-ratelimit-remaining": "98", "x-ratelimit-reset": "0"},
+            )
+
+        async def run() -> models.Tasks:
+            async with fakes.make_async_client(handler) as c:
+                tasks = await c.get_tasks("list_id", page=1)
+                assert c.rate_limit_remaining == 98
+                return tasks
+
+        tasks = asyncio.run(run())
+
+        assert isinstance(tasks, models.Tasks)
+        assert [task.id for task in tasks] == ["1", "2"]
+
+    @pytest.mark.asyncclient
+    def test_write_sends_json_body(self) -> None:
+        seen = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            seen.append(json.loads(request.content))
+            return httpx.Response(200, json={"id": "9", "name": "New Task"})
+
+        async def run() -> models.Task:
+            async with fakes.make_async_client(handler) as c:
+                return await c.create_task("list_id", "New Task", priority=2)
+
+        task = asyncio.run(run())
+
+        assert task.id == "9"
+        assert seen == [{"name": "New Task", "priority": 2, "notify_all": True}]
+
+    @pytest.mark.asyncclient
+    def test_errors_raise_client_error(self) -> None:
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(404, json={"err": "Not found"})
+
+        async def run() -> None:
+            async with fakes.make_async_client(handler) as c:
+                await c.get_task("missing")
+
+        with pytest.raises(exceptions.ClickupClientError):
+            asyncio.run(run())
+
+    @pytest.mark.asyncclient
+    def test_concurrency_is_bounded(self) -> None:
+        in_flight = 0
+        peak = 0
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return httpx.Response(200, json={"id": "1"})
+
+        async def run() -> None:
+            async with fakes.make_async_client(
+                handler, max_concurrency=3, rate_limit_burst=100
+            ) as c:
+                await asyncio.gather(*(c.get_task(str(i)) for i in range(12)))
+                assert c.request_count == 12
+
+        asyncio.run(run())
+
+        assert peak == 3
+
+    @pytest.mark.asyncclient
+    def test_iter_tasks(self) -> None:
+        pages = {
+            "0": {"tasks": [{"id": "1"}, {"id": "2"}], "last_page": False},
+            "1": {"tasks": [{"id": "3"}], "last_page": True},
+        }
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(200, json=pages[request.url.params["page"]])
+
+        async def run() -> list[str]:
+            async with fakes.make_async_client(handler) as c:
+                ids = [task.id async for task in c.iter_tasks("list_id")]
+                assert c.request_count == 2
+                return ids
+
+        assert asyncio.run(run()) == ["1", "2", "3"]
+
+    @pytest.mark.asyncclient
+    def test_iter_tasks_stream(self) -> None:
+        pages = {
+            "0": {"tasks": [{"id": "1"}, {"id": "2"}], "last_page": False},
+            "1": {"tasks": [{"id": "3"}], "last_page": True},
+        }
+        queries = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            queries.append(str(request.url.params))
+            return httpx.Response(200, json=pages[request.url.params["page"]])
+
+        async def run(stream: bool) -> list[str]:
+            async with fakes.make_async_client(handler) as c:
+                return [
+                    task.id
+                    async for task in c.iter_tasks(
+                        "list_id", stream=stream, statuses=["open"]
+                    )
+                ]
+
+        assert asyncio.run(run(stream=True)) == ["1", "2", "3"]
+        assert asyncio.run(run(stream=False)) == ["1", "2", "3"]
+        assert queries[:2] == queries[2:]
+
+    @pytest.mark.asyncclient
+    def test_stream_errors(self) -> None:
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(404, json={"err": "Team not found"})
+
+        async def run(**kwargs) -> None:  # type: ignore[no-untyped-def]
+            async with fakes.make_async_client(handler) as c:
+                async for _ in c.iter_team_tasks("team_id", stream=True, **kwargs):
+                    pass
+
+        with pytest.raises(exceptions.ClickupClientError, match="Team not found"):
+            asyncio.run(run())
+        with pytest.raises(exceptions.ClickupClientError, match="prefetched"):
+            asyncio.run(run(prefetch=2))
+
+    @pytest.mark.asyncclient
+    def test_iter_team_tasks_with_prefetch(self) -> None:
+        def handler(request: httpx.Request) -> httpx.Response:
+            page = int(request.url.params["page"])
+            return httpx.Response(
+                200, json={"tasks": [{"id": str(page)}], "last_page": page == 4}
+            )
+
+        async def run() -> list[str]:
+            async with fakes.make_async_client(handler) as c:
+                return [
+                    task.id async for task in c.iter_team_tasks("team_id", prefetch=3)
+                ]
+
+        assert asyncio.run(run()) == ["0", "1", "2", "3", "4"]
@@ -0,0 +1,126 @@
+import asyncio
+import threading
+import time
+
+import httpx
+import pytest
+
+from clickupython import exceptions
+from clickupython.batch import BatchExecutor, Call, call
+from clickupython.multitoken import MultiTokenClickUpClient
+
+from tests import fakes
+
+
+class FakeTasks:
+    """Answers task deletes, failing the ids in `missing` and rate limiting the ids in `limited`."""
+
+    def __init__(self, missing: tuple[str, ...] = (), limited: tuple[str, ...] = ()):
+        self.missing = missing
+        self.limited = limited
+        self.deleted: list[str] = []
+        self.lock = threading.Lock()
+
+    def __call__(self, request):  # type: ignore[no-untyped-def]
+        task_id = str(request.url).rstrip("/").rsplit("/", 1)[-1]
+        if task_id in self.limited:
+            return 429, {"err": "Rate limit reached"}
+        if task_id in self.missing:
+            return 404, {"err": "Task not found"}
+        with self.lock:
+            self.deleted.append(task_id)
+        return 200, {}
+
+
+class TestBatch:
+    @pytest.mark.batch
+    def test_collects_results_per_call(self) -> None:
+        fake = FakeTasks(missing=("3",))
+        c = fakes.make_client(fake)
+        seen = []
+
+        results = c.batch(
+            (call("delete_task", str(i)) for i in range(10)),
+            concurrency=4,
+            on_progress=lambda progress: seen.append(progress.completed),
+        )
+
+        assert [result.index for result in results] == list(range(10))
+        assert [result.ok for result in results] == [i != 3 for i in range(10)]
+        assert results[0].value is True
+        assert isinstance(results[3].error, exceptions.ClickupClientError)
+        assert results[3].error.status_code == 404
+        assert sorted(fake.deleted, key=int) == [str(i) for i in range(10) if i != 3]
+        assert len(seen) == 10
+        assert seen[-1] == 10
+
+    @pytest.mark.batch
+    def test_counts_progress(self) -> None:
+        executor = BatchExecutor(
+            fakes.make_client(FakeTasks(missing=("1",))), concurrency=2
+        )
+
+        executor.run([call("delete_task", "1"), call("delete_task", "2")])
+
+        progress = executor.progress
+        assert (progress.submitted, progress.completed, progress.failed) == (2, 2, 1)
+        assert progress.in_flight == 0
+        assert progress.throughput == 2 / progress.elapsed
+
+    @pytest.mark.batch
+    def test_rejects_unknown_methods(self) -> None:
+        c = fakes.make_client(FakeTasks())
+
+        results = c.batch([call("explode"), call("_ClickUpClient__headers")])
+
+        assert all("Unknown client method" in str(r.error) for r in results)
+
+    @pytest.mark.batch
+    def test_backs_off_when_rate_limited(self) -> None:
+        executor = BatchExecutor(
+            fakes.make_client(
+                FakeTasks(limited=("0", "1", "2")), retry_rate_limited_requests=False
+            ),
+            concurrency=8,
+        )
+
+        results = executor.run([call("delete_task", str(i)) for i in range(3)])
+
+        assert all(result.error.status_code == 429 for result in results)
+        assert executor.progress.concurrency == 1
+
+    @pytest.mark.batch
+    def test_calls_do_not_share_kwargs(self) -> None:
+        first, second = Call("delete_task"), Call("delete_task")
+
+        first.kwargs["task_id"] = "1"
+
+        assert second.kwargs == {}
+        assert call("get_task", "1", subtasks=True).kwargs == {"subtasks": True}
+
+    @pytest.mark.batch
+    def test_concurrency_is_bounded_by_every_token(self) -> None:
+        c = MultiTokenClickUpClient(["A", "B"])
+        for rate_limiter in c.rate_limiters.values():
+            rate_limiter.update(remaining=3, reset=time.time() + 60)
+
+        executor = BatchExecutor(c, concurrency=8)
+
+        assert executor.throttle.allowed() == 5
+
+    @pytest.mark.batch
+    def test_async_batch(self) -> None:
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(200, json={"id": request.url.path.split("/")[-1]})
+
+        async def run():  # type: ignore[no-untyped-def]
+            async with fakes.make_async_client(handler) as c:
+                return await c.batch(
+                    [call("get_task", str(i)) for i in range(5)] + [call("nope")],
+                    concurrency=3,
+                )
+
+        results = asyncio.run(run())
+
+        assert [result.value.id for result in results[:5]] == ["0", "1", "2", "3", "4"]
+        assert not results[5].ok
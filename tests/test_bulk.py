@@ -0,0 +1,187 @@
+import io
+import json
+import threading
+from unittest import mock
+
+import pytest
+
+from clickupython import bulk
+from clickupython import exceptions
+
+from tests import fakes
+
+
+class FakeCreate:
+    """Answers task creation requests, failing the tasks named in `failing`."""
+
+    def __init__(self, failing: tuple[str, ...] = ()) -> None:
+        self.failing = failing
+        self.bodies: list[dict] = []
+        self.lock = threading.Lock()
+
+    def __call__(self, request):  # type: ignore[no-untyped-def]
+        body = json.loads(request.body)
+        with self.lock:
+            self.bodies.append(body)
+        if body["name"] in self.failing:
+            return 400, {"err": f"Cannot create {body['name']}"}
+        return 200, {"id": f"t-{body['name']}", "name": body["name"]}
+
+
+def specs(count: int) -> list[dict]:
+    return [{"name": str(i)} for i in range(count)]
+
+
+class TestTaskImporter:
+    @pytest.mark.bulk
+    def test_results_keep_input_order(self) -> None:
+        fake = FakeCreate(failing=("3",))
+        importer = bulk.TaskImporter(fakes.make_client(fake), concurrency=4)
+
+        results = list(importer.run(specs(20), list_id="list"))
+
+        assert [result.row for result in results] == list(range(20))
+        assert [result.task.id for result in results if result.ok] == [
+            f"t-{i}" for i in range(20) if i != 3
+        ]
+        assert "Cannot create 3" in str(results[3].error)
+        assert (importer.created, importer.failed) == (19, 1)
+        assert len(fake.bodies) == 20
+
+    @pytest.mark.bulk
+    def test_invalid_specs_fail_their_row_only(self) -> None:
+        importer = bulk.TaskImporter(fakes.make_client(FakeCreate()))
+
+        results = list(
+            importer.run([{"name": "a", "colour": "red"}, {"list_id": "l"}, {}], "l")
+        )
+
+        assert "colour" in str(results[0].error)
+        assert "name" in str(results[1].error)
+        assert not any(result.ok for result in results)
+
+    @pytest.mark.bulk
+    def test_resumes_from_checkpoint(self, tmp_path) -> None:
+        checkpoint = str(tmp_path / "import.json")
+        fake = FakeCreate()
+        c = fakes.make_client(fake)
+
+        first = bulk.TaskImporter(c, concurrency=2, checkpoint=checkpoint)
+        for result in first.run(specs(10), list_id="list"):
+            if result.row == 4:
+                break
+        done = {body["name"] for body in fake.bodies}
+
+        second = bulk.TaskImporter(c, concurrency=2, checkpoint=checkpoint)
+        rows = [result.row for result in second.run(specs(10), list_id="list")]
+
+        assert rows == [i for i in range(10) if str(i) not in done]
+        assert second.skipped == len(done)
+        assert sorted(int(body["name"]) for body in fake.bodies) == list(range(10))
+
+    @pytest.mark.bulk
+    def test_unexpected_errors_fail_their_row_only(self) -> None:
+        c = fakes.make_client(FakeCreate())
+        create_task = c.create_task
+
+        def flaky_create(**kwargs):  # type: ignore[no-untyped-def]
+            if kwargs["name"] == "1":
+                raise ValueError("bad response")
+            return create_task(**kwargs)
+
+        importer = bulk.TaskImporter(c)
+        with mock.patch.object(c, "create_task", side_effect=flaky_create):
+            results = list(importer.run(specs(3), list_id="list"))
+
+        assert [result.ok for result in results] == [True, False, True]
+        assert isinstance(results[1].error, ValueError)
+        assert (importer.created, importer.failed) == (2, 1)
+
+    @pytest.mark.bulk
+    def test_retries_failed_rows_on_resume(self, tmp_path) -> None:
+        checkpoint = str(tmp_path / "import.json")
+        fake = FakeCreate(failing=("2", "7"))
+        c = fakes.make_client(fake)
+
+        first = bulk.TaskImporter(c, concurrency=3, checkpoint=checkpoint)
+        assert [r.row for r in first.run(specs(10), "list") if not r.ok] == [2, 7]
+
+        fake.failing = ("7",)
+        fake.bodies.clear()
+        second = bulk.TaskImporter(c, concurrency=3, checkpoint=checkpoint)
+        assert [(r.row, r.ok) for r in second.run(specs(10), "list")] == [
+            (2, True),
+            (7, False),
+        ]
+        assert second.skipped == 8
+
+        fake.failing = ()
+        fake.bodies.clear()
+        third = bulk.TaskImporter(c, concurrency=3, checkpoint=checkpoint)
+        assert [r.row for r in third.run(specs(10), "list")] == [7]
+        assert list(third.run(specs(10), "list")) == []
+        assert [body["name"] for body in fake.bodies] == ["7"]
+
+    @pytest.mark.bulk
+    def test_bad_csv_value_fails_its_row_only(self, tmp_path) -> None:
+        path = tmp_path / "tasks.csv"
+        path.write_text("name,priority\nFirst,2\nSecond,high\nThird,\n")
+        importer = bulk.TaskImporter(fakes.make_client(FakeCreate()))
+
+        results = list(importer.run(bulk.read_task_specs(str(path)), "list"))
+
+        assert [result.ok for result in results] == [True, False, True]
+        assert "'high'" in str(results[1].error)
+
+    @pytest.mark.bulk
+    def test_converts_each_fuzzy_date_once(self) -> None:
+        fake = FakeCreate()
+        importer = bulk.TaskImporter(fakes.make_client(fake))
+        rows = [
+            {"name": str(i), "due_date": "next friday" if i % 2 else "1700000000000"}
+            for i in range(6)
+        ]
+
+        with mock.patch.object(
+            bulk, "fuzzy_time_to_unix", return_value="1800000000000"
+        ) as convert:
+            assert all(result.ok for result in importer.run(rows, "list"))
+
+        convert.assert_called_once_with("next friday")
+        assert {body["due_date"] for body in fake.bodies} == {
+            "1700000000000",
+            "1800000000000",
+        }
+
+
+class TestReadTaskSpecs:
+    @pytest.mark.bulk
+    def test_reads_csv(self, tmp_path) -> None:
+        path = tmp_path / "tasks.csv"
+        path.write_text(
+            "list_id,name,priority,assignees,tags,due_date\n"
+            "l1,First,2,12;34,a;b,\n"
+            "l2,Second,,,,1700000000000\n"
+        )
+
+        assert list(bulk.read_task_specs(str(path))) == [
+            {
+                "list_id": "l1",
+                "name": "First",
+                "priority": 2,
+                "assignees": [12, 34],
+                "tags": ["a", "b"],
+            },
+            {"list_id": "l2", "name": "Second", "due_date": "1700000000000"},
+        ]
+
+    @pytest.mark.bulk
+    def test_reads_jsonl(self) -> None:
+        source = io.StringIO('{"name": "a", "tags": ["x"]}\n\n{"name": "b"}\n')
+
+        assert list(bulk.read_task_specs(source)) == [
+            {"name": "a", "tags": ["x"]},
+            {"name": "b"},
+        ]
+        with pytest.raises(exceptions.ClickupClientError):
+            list(bulk.read_task_specs(source, format="xml"))
@@ -0,0 +1,231 @@
+import multiprocessing
+
+import pytest
+import requests
+
+from clickupython import client
+from clickupython.multitoken import MultiTokenClickUpClient
+from clickupython.retry import RetryPolicy
+from clickupython.cache import (
+    DiskCache,
+    ResponseCache,
+    TieredCache,
+    endpoint,
+    is_affected,
+)
+
+from tests import fakes
+
+
+def make_client(cache: ResponseCache) -> tuple[client.ClickUpClient, fakes.FakeAdapter]:
+    c = fakes.make_client(
+        lambda request: (200, {"id": "abc", "name": "Task"}), "token", cache=cache
+    )
+    return c, fakes.adapter_of(c)
+
+
+class TestResponseCache:
+    @pytest.mark.cache
+    def test_ttl_per_endpoint(self) -> None:
+        clock = fakes.FakeClock()
+        cache = ResponseCache(ttls={"task": 30, "space": 300}, clock=clock)
+
+        cache.set("task/abc", b"task")
+        cache.set("space/1", b"space")
+        cache.set("list/1/task?page=0", b"tasks")
+        clock.now += 60
+
+        assert cache.get("task/abc") is None
+        assert cache.get("space/1") == b"space"
+        assert cache.get("list/1/task?page=0") is None
+
+    @pytest.mark.cache
+    def test_lru_eviction_and_stats(self) -> None:
+        cache = ResponseCache(maxsize=2, ttls={"task": 30})
+
+        cache.set("task/a", b"a")
+        cache.set("task/b", b"b")
+        cache.get("task/a")
+        cache.set("task/c", b"c")
+
+        assert cache.get("task/b") is None
+        assert cache.get("task/a") == b"a"
+        assert cache.stats.hits == 2
+        assert cache.stats.misses == 1
+        assert cache.stats.evictions == 1
+        assert cache.stats.size == 2
+
+    @pytest.mark.cache
+    def test_write_invalidation_rules(self) -> None:
+        assert endpoint("space/123/tag") == "space/tag"
+
+        assert is_affected("task/abc", "task/abc/tag/urgent")
+        assert is_affected("task/abc/comment", "task/abc")
+        assert is_affected("team/1/task?page=0", "task/abc")
+        assert is_affected("folder/9", "list/5")
+        assert is_affected("task/abc", "list/5/task/abc")
+        assert is_affected("task/abc#scope", "list/5/task/abc")
+        assert not is_affected("task/other", "list/5/task/abc")
+        assert not is_affected("task/other", "task/abc")
+        assert not is_affected("space/1", "task/abc")
+
+    @pytest.mark.cache
+    def test_client_serves_repeated_reads_from_cache(self) -> None:
+        cache = ResponseCache()
+        c, adapter = make_client(cache)
+
+        first = c.get_task("abc")
+        second = c.get_task("abc")
+
+        assert len(adapter.requests) == 1
+        assert first == second
+        assert cache.stats.hits == 1
+
+    @pytest.mark.cache
+    def test_client_writes_invalidate_cache(self) -> None:
+        cache = ResponseCache()
+        c, adapter = make_client(cache)
+
+        c.get_task("abc")
+        c.update_task("abc", name="Renamed")
+        c.get_task("abc")
+        c.tag_task("abc", "urgent")
+        c.get_task("abc")
+
+        methods = [request.method for request in adapter.requests]
+        assert methods == ["GET", "PUT", "GET", "POST", "GET"]
+
+    @pytest.mark.cache
+    def test_keys_are_scoped_by_token(self) -> None:
+        cache = ResponseCache()
+        first, first_adapter = make_client(cache)
+        second = fakes.make_client(
+            lambda request: (200, {"id": "abc", "name": "Private"}),
+            "other",
+            cache=cache,
+        )
+        second_adapter = fakes.adapter_of(second)
+        pooled = MultiTokenClickUpClient(["token", "other"], cache=cache)
+
+        assert first.get_task("abc").name == "Task"
+        assert second.get_task("abc").name == "Private"
+        assert second.get_task("abc").name == "Private"
+        assert len(first_adapter.requests) == len(second_adapter.requests) == 1
+        assert (
+            pooled._cache_scope()
+            == MultiTokenClickUpClient(["other", "token"])._cache_scope()
+        )
+        assert pooled._cache_scope() not in (
+            first._cache_scope(),
+            second._cache_scope(),
+        )
+
+        # A write by one client makes the path stale for every token
+        first.update_task("abc", name="Renamed")
+        assert cache.stats.size == 0
+
+    @pytest.mark.cache
+    def test_failed_writes_invalidate_cache(self) -> None:
+        cache = ResponseCache()
+
+        def handler(request):  # type: ignore[no-untyped-def]
+            if request.method == "PUT":
+                raise requests.ConnectionError("connection reset")
+            return 200, {"id": "abc", "name": "Task"}
+
+        c = fakes.make_client(
+            handler, "token", retry_policy=RetryPolicy(max_attempts=1), cache=cache
+        )
+        adapter = fakes.adapter_of(c)
+        c.get_task("abc")
+
+        with pytest.raises(requests.ConnectionError):
+            c.update_task("abc", name="Renamed")
+        c.get_task("abc")
+
+        assert [request.method for request in adapter.requests] == [
+            "GET",
+            "PUT",
+            "GET",
+        ]
+
+
+class TestDiskCache:
+    @pytest.mark.cache
+    def test_survives_restart(self, tmp_path) -> None:
+        path = str(tmp_path / "responses.sqlite3")
+        c, adapter = make_client(DiskCache(path))
+        c.get_task("abc")
+
+        restarted, restarted_adapter = make_client(DiskCache(path))
+        task = restarted.get_task("abc")
+
+        assert task.id == "abc"
+        assert len(adapter.requests) == 1
+        assert restarted_adapter.requests == []
+
+    @pytest.mark.cache
+    def test_compressed_ttl_and_invalidation(self, tmp_path) -> None:
+        clock = fakes.FakeClock()
+        cache = DiskCache(str(tmp_path / "c.sqlite3"), clock=clock)
+        body = b'{"name": "' + b"x" * 10000 + b'"}'
+
+        cache.set("space/1", body)
+        cache.set("task/abc", b"{}")
+
+        assert cache.get("space/1") == body
+        assert cache.stats.bytes < len(body) // 10
+        assert cache.invalidate("task/abc") == 1
+        clock.now += 600
+        assert cache.get("space/1") is None
+
+    @pytest.mark.cache
+    def test_size_limit_evicts_soonest_expiring(self, tmp_path) -> None:
+        clock = fakes.FakeClock()
+        cache = DiskCache(
+            str(tmp_path / "c.sqlite3"),
+            max_bytes=2500,
+            compression_level=0,
+            clock=clock,
+        )
+
+        for i in range(3):
+            cache.set(f"space/{i}", b"x" * 1000)
+            clock.now += 1
+
+        assert cache.get("space/0") is None
+        assert cache.get("space/2") is not None
+        assert cache.stats.evictions == 1
+
+    @pytest.mark.cache
+    def test_concurrent_processes(self, tmp_path) -> None:
+        path = str(tmp_path / "c.sqlite3")
+        DiskCache(path)
+        context = multiprocessing.get_context("spawn")
+        with context.Pool(4) as pool:
+            pool.starmap(fill_disk_cache, [(path, worker) for worker in range(4)])
+
+        cache = DiskCache(path)
+        assert cache.stats.size == 4 * 25
+        assert cache.get("space/3-24") == b"3-24"
+
+
+def fill_disk_cache(path: str, worker: int) -> None:
+    cache = DiskCache(path)
+    for i in range(25):
+        cache.set(f"space/{worker}-{i}", f"{worker}-{i}".encode())
+        cache.get(f"space/{worker}-{i}")
+
+
+class TestTieredCache:
+    @pytest.mark.cache
+    def test_promotes_disk_hits_to_memory(self, tmp_path) -> None:
+        memory = ResponseCache()
+        disk = DiskCache(str(tmp_path / "c.sqlite3"))
+        disk.set("folder/1", b"{}")
+        cache = TieredCache(memory, disk)
+
+        assert cache.get("folder/1") == b"{}"
+        assert memory.get("folder/1") == b"{}"
+        cache.invalidate("folder/1")
+        assert cache.get("folder/1") is None
@@ -0,0 +1,82 @@
+from urllib.parse import parse_qs, urlparse
+
+import pytest
+
+from clickupython.changes import CLOSED, CREATED, UPDATED
+
+from tests import fakes
+
+
+class FakeTeam:
+    """Serves team tasks newest first, honouring date_updated_gt and paging."""
+
+    def __init__(self) -> None:
+        self.tasks: dict[str, dict] = {}
+        self.requests = 0
+
+    def put(self, task_id: str, updated: int, created: int = 1, **fields) -> None:  # type: ignore[no-untyped-def]
+        self.tasks[task_id] = {
+            "id": task_id,
+            "date_created": str(created),
+            "date_updated": str(updated),
+            **fields,
+        }
+
+    def __call__(self, request):  # type: ignore[no-untyped-def]
+        self.requests += 1
+        query = parse_qs(urlparse(request.url).query)
+        since = int(query.get("date_updated_gt", ["0"])[0])
+        matching = sorted(
+            (t for t in self.tasks.values() if int(t["date_updated"]) > since),
+            key=lambda t: -int(t["date_updated"]),
+        )
+        page = int(query["page"][0])
+        items = matching[page * 100 : (page + 1) * 100]
+        return (200, {"tasks": items, "last_page": (page + 1) * 100 >= len(matching)})
+
+
+class TestWatchTeamTasks:
+    @pytest.mark.changes
+    def test_typed_events(self) -> None:
+        team = FakeTeam()
+        team.put("old", updated=500, name="Old")
+        c = fakes.make_client(team)
+        watch = c.watch_team_tasks("1", interval=0, since=1000)
+
+        team.put("new", updated=1100, created=1100, name="New")
+        team.put("old", updated=1200, name="Renamed")
+        first = [next(watch), next(watch)]
+
+        assert [(change.kind, change.task.id) for change in first] == [
+            (CREATED, "new"),
+            (UPDATED, "old"),
+        ]
+        assert first[1].changed_fields is None
+
+        team.put("new", updated=1300, created=1100, name="New", date_closed="1300")
+        closed = next(watch)
+        assert closed.kind == CLOSED
+        assert closed.changed_fields == ["date_closed"]
+        assert closed.previous.name == "New"  # type: ignore[union-attr]
+
+    @pytest.mark.changes
+    def test_quiet_poll_costs_one_request(self) -> None:
+        team = FakeTeam()
+        for i in range(250):
+            team.put(str(i), updated=500)
+        c = fakes.make_client(team)
+
+        changes = list(c.watch_team_tasks("1", interval=0, since=1000, max_polls=3))
+
+        assert changes == []
+        assert team.requests == 3
+
+    @pytest.mark.changes
+    def test_unchanged_tasks_are_not_repeated(self) -> None:
+        team = FakeTeam()
+        team.put("a", updated=1000, created=1000)
+        c = fakes.make_client(team)
+
+        changes = list(c.watch_team_tasks("1", interval=0, since=1000, max_polls=3))
+
+        assert [change.kind for change in changes] == [CREATED]
@@ -17,6 +17,8 @@ import sys
 from clickupython import exceptions
 from typing import Any
 
+from tests import fakes
+
 API_KEY = "pk_6341704_8OV9MRRLXIK2VO3XV3FNKKLY9IMQAXB3"
 MOCK_API_URL = "https://private-anon-3a942619a6-clickup20.apiary-mock.com/api/v2/"
 
@@ -668,3 +670,81 @@ class TesttimeTracking:
         assert result.user is not None
         assert result.user.id == 1
         assert result.billable is False
+
+
+class TestClientSession:
+    @pytest.mark.http
+    def test_requests_share_pooled_session(self) -> None:
+        c = client.ClickUpClient("API_KEY", connect_timeout=1.5, read_timeout=7)
+        adapter = fakes.mount(
+            c, lambda request: (200, {"id": "457", "name": "F", "hidden": False})
+        )
+
+        c.get_folder("457")
+        c.update_folder("457", "F")
+        c.delete_folder("457")
+
+        assert [r.method for r in adapter.requests] == ["GET", "PUT", "DELETE"]
+        assert c.request_count == 3
+
+    @pytest.mark.http
+    def test_pool_configuration(self) -> None:
+        c = client.ClickUpClient(
+            "API_KEY",
+            pool_connections=3,
+            pool_maxsize=20,
+            pool_block=True,
+            keep_alive=False,
+        )
+        adapter = c.session.get_adapter(client.API_URL)
+
+        assert adapter._pool_connections == 3
+        assert adapter._pool_maxsize == 20
+        assert adapter._pool_block
+        assert c.session.headers["Connection"] == "close"
+
+    @pytest.mark.http
+    def test_context_manager_closes_session(self) -> None:
+        with client.ClickUpClient("API_KEY") as c:
+            adapter = fakes.mount(c, lambda request: (200, {}))
+
+        assert adapter.closed
+
+
+class TestClientPagination:
+    @pytest.mark.tasks
+    def test_iter_tasks_stops_on_last_page(self) -> None:
+        pages = {
+            "0": {"tasks": [{"id": str(i)} for i in range(100)], "last_page": False},
+            "1": {"tasks": [{"id": "100"}], "last_page": True},
+        }
+        c = client.ClickUpClient("API_KEY")
+        adapter = fakes.mount(
+            c, lambda request: (200, pages[request.url.split("page=")[1][0]])
+        )
+
+        ids = [task.id for task in c.iter_tasks("list_id")]
+
+        assert ids == [str(i) for i in range(101)]
+        assert len(adapter.requests) == 2
+
+    @pytest.mark.tasks
+    def test_iter_team_tasks_is_lazy(self) -> None:
+        c = client.ClickUpClient("API_KEY")
+        adapter = fakes.mount(
+            c, lambda request: (200, {"tasks": [{"id": "1"}], "last_page": False})
+        )
+
+        tasks = c.iter_team_tasks("team_id")
+        assert len(adapter.requests) == 0
+
+        next(tasks)
+        assert len(adapter.requests) == 1
+
+    @pytest.mark.tasks
+    def test_iter_tasks_without_last_page_flag(self) -> None:
+        c = client.ClickUpClient("API_KEY")
+        adapter = fakes.mount(c, lambda request: (200, {"tasks": [{"id": "1"}]}))
+
+        assert [task.id for task in c.iter_tasks("list_id")] == ["1"]
+        assert len(adapter.requests) == 1
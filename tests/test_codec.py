@@ -0,0 +1,66 @@
+import json
+
+import pytest
+
+from clickupython import client
+from clickupython import codec
+
+from tests import fakes
+
+
+class TestCodec:
+    @pytest.mark.codec
+    def test_codecs_agree(self) -> None:
+        page = {"tasks": [{"id": "1", "name": "Café", "priority": None}], "n": 1.5}
+        body = json.dumps(page).encode()
+        codecs = [codec.JSONCodec()]
+        if codec.orjson is not None:
+            codecs.append(codec.OrjsonCodec())
+
+        for candidate in codecs:
+            assert candidate.loads(body) == page
+            assert json.loads(candidate.dumps(page)) == page
+
+    @pytest.mark.codec
+    def test_orjson_falls_back_for_unsupported_values(self) -> None:
+        if codec.orjson is None:
+            pytest.skip("orjson not installed")
+
+        assert (
+            codec.OrjsonCodec().dumps({"id": 2**70})
+            == b'{"id": 1180591620717411303424}'
+        )
+
+    @pytest.mark.codec
+    def test_default_codec(self) -> None:
+        expected = "orjson" if codec.orjson is not None else "json"
+
+        assert codec.default_codec().name == expected
+        assert client.ClickUpClient("token").json_codec.name == expected
+
+    @pytest.mark.codec
+    def test_client_uses_codec_for_bodies(self) -> None:
+        class RecordingCodec(codec.JSONCodec):
+            def __init__(self) -> None:
+                self.calls: list[str] = []
+
+            def loads(self, data: bytes):  # type: ignore[no-untyped-def]
+                self.calls.append("loads")
+                return super().loads(data)
+
+            def dumps(self, obj):  # type: ignore[no-untyped-def]
+                self.calls.append("dumps")
+                return super().dumps(obj)
+
+        recording = RecordingCodec()
+        c = fakes.make_client(
+            lambda request: (200, {"id": "1", "name": "New", "hidden": False}),
+            "token",
+            json_codec=recording,
+        )
+        adapter = fakes.adapter_of(c)
+
+        c.update_folder("1", "New")
+
+        assert json.loads(adapter.requests[0].body) == {"name": "New"}
+        assert recording.calls == ["dumps", "loads"]
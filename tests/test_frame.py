@@ -0,0 +1,115 @@
+import math
+
+import pytest
+
+from clickupython import exceptions
+from clickupython import frame
+from clickupython import models
+
+from tests import fakes
+
+
+def raw_task(i: int) -> dict:
+    return fakes.task(
+        i,
+        status={"status": ["open", "review", "closed"][i % 3]},
+        priority={"id": "1", "priority": "urgent"} if i % 2 else None,
+        assignees=[fakes.user(1), fakes.user(2)] if i % 2 else [fakes.user(1)],
+        tags=[{"name": "bug"}] if i % 3 == 0 else [],
+        date_created=str(1000 + i),
+        date_updated=str(2000 + i),
+        due_date=str(3000 + i) if i % 2 else None,
+        time_estimate=str(60000 * i),
+    )
+
+
+def build_frame(count: int = 6) -> frame.TaskFrame:
+    if frame.np is None:
+        pytest.skip("numpy not installed")
+    pages = [
+        models.Tasks(tasks=[raw_task(i) for i in range(start, min(start + 4, count))])
+        for start in range(0, count, 4)
+    ]
+    return frame.TaskFrame.from_tasks(pages)
+
+
+class TestTaskFrame:
+    @pytest.mark.frame
+    def test_builds_columns_from_pages(self) -> None:
+        tasks = build_frame()
+
+        assert len(tasks) == 6
+        assert list(tasks.ids) == ["0", "1", "2", "3", "4", "5"]
+        assert tasks.categories["status"] == ["open", "review", "closed"]
+        assert list(tasks.codes["priority"]) == [-1, 0, -1, 0, -1, 0]
+        assert list(tasks.rows["assignee"]) == [0, 1, 1, 2, 3, 3, 4, 5, 5]
+        assert math.isnan(tasks.timestamps["due_date"][0])
+        assert tasks.timestamps["date_updated"][5] == 2005
+
+    @pytest.mark.frame
+    def test_counts_by_label(self) -> None:
+        tasks = build_frame()
+
+        assert tasks.count_by("status") == {"open": 2, "review": 2, "closed": 2}
+        assert tasks.count_by("priority") == {"urgent": 3, None: 3}
+        assert tasks.count_by("assignee") == {1: 6, 2: 3}
+        assert tasks.count_by("tag") == {"bug": 2}
+
+    @pytest.mark.frame
+    def test_aggregates_timestamps(self) -> None:
+        tasks = build_frame()
+
+        assert tasks.aggregate("status", "sum", "time_estimate") == {
+            "open": 60000 * 3,
+            "review": 60000 * 5,
+            "closed": 60000 * 7,
+            None: 0,
+        }
+        assert tasks.aggregate("assignee", "max", "due_date") == {1: 3005, 2: 3005}
+        means = tasks.aggregate("priority", "mean", "due_date")
+        assert means["urgent"] == 3003
+        assert math.isnan(means[None])
+
+    @pytest.mark.frame
+    def test_filters_keep_rows_aligned(self) -> None:
+        tasks = build_frame()
+
+        subset = tasks.filter(
+            tasks.isin("assignee", [2]) & (tasks.timestamps["due_date"] > 3001)
+        )
+
+        assert list(subset.ids) == ["3", "5"]
+        assert list(subset.rows["assignee"]) == [0, 0, 1, 1]
+        assert subset.count_by("assignee") == {1: 2, 2: 2}
+        assert subset.count_by("tag") == {"bug": 1}
+
+    @pytest.mark.frame
+    def test_skips_missing_labels_of_multi_valued_columns(self) -> None:
+        if frame.np is None:
+            pytest.skip("numpy not installed")
+        task = {**raw_task(0), "tags": [{"name": None}, {"name": "bug"}]}
+        # Only a trusted, unvalidated response can hold a user without an id
+        task["assignees"] = [{**fakes.user(1), "id": None}]
+        page = models.construct(models.Tasks, {"tasks": [task]})
+
+        tasks = frame.TaskFrame.from_tasks([page])
+
+        assert tasks.count_by("tag") == {"bug": 1}
+        assert tasks.count_by("assignee") == {}
+
+    @pytest.mark.frame
+    def test_rejects_unknown_columns(self) -> None:
+        tasks = build_frame()
+
+        with pytest.raises(exceptions.ClickupClientError):
+            tasks.count_by("name")
+        with pytest.raises(exceptions.ClickupClientError):
+            tasks.aggregate("status", "median", "due_date")
+        with pytest.raises(exceptions.ClickupClientError):
+            tasks.filter([True])
+
+    @pytest.mark.frame
+    def test_stores_tasks_compactly(self) -> None:
+        tasks = build_frame(1000)
+
+        assert tasks.nbytes / len(tasks) < 100
@@ -0,0 +1,102 @@
+from collections import Counter
+
+import pytest
+
+from clickupython.hierarchy import FOLDER, LIST, SPACE, TEAM, HierarchyIndex
+
+from tests import fakes
+
+WORKSPACE = {
+    "team": {"teams": [{"id": "1", "name": "Acme"}]},
+    "team/1/space": {
+        "spaces": [{"id": "10", "name": "Engineering"}, {"id": "20", "name": "Sales"}]
+    },
+    "space/10/folder": {
+        "folders": [
+            {
+                "id": "100",
+                "name": "Backend",
+                "hidden": False,
+                "lists": [{"id": "1000", "name": "API"}, {"id": "1001", "name": "DB"}],
+            }
+        ]
+    },
+    "space/10/list": {"lists": [{"id": "1002", "name": "Inbox"}]},
+    "space/20/folder": {"folders": []},
+    "space/20/list": {"lists": [{"id": "2000", "name": "Leads"}]},
+}
+
+
+def make_index(ttl: float = 300.0) -> tuple[HierarchyIndex, Counter, fakes.FakeClock]:
+    calls: Counter = Counter()
+
+    def handler(request):  # type: ignore[no-untyped-def]
+        path = request.path_url.split("?")[0].replace("/api/v2/", "").rstrip("/")
+        calls[path] += 1
+        return (200, WORKSPACE[path])
+
+    clock = fakes.FakeClock()
+    return (
+        HierarchyIndex(fakes.make_client(handler), ttl=ttl, clock=clock),
+        calls,
+        clock,
+    )
+
+
+class TestHierarchyIndex:
+    @pytest.mark.hierarchy
+    def test_space_loads_with_two_requests(self) -> None:
+        index, calls, _ = make_index()
+
+        lists = index.lists("10")
+
+        assert [node.name for node in lists] == ["API", "DB", "Inbox"]
+        assert calls == {"space/10/folder": 1, "space/10/list": 1}
+
+    @pytest.mark.hierarchy
+    def test_lookups_by_id_and_name_are_cached(self) -> None:
+        index, calls, _ = make_index()
+
+        node = index.get(LIST, "1001")
+        assert node is not None and node.name == "DB"
+        assert index.find(FOLDER, "Backend").id == "100"  # type: ignore[union-attr]
+        assert index.find(LIST, "Leads", parent=(SPACE, "20")).id == "2000"  # type: ignore[union-attr]
+        assert index.find(LIST, "Missing", parent=(SPACE, "20")) is None
+
+        assert index.get(LIST, "1001") is node
+        assert max(calls.values()) == 1
+
+    @pytest.mark.hierarchy
+    def test_parent_lookups(self) -> None:
+        index, _, _ = make_index()
+
+        assert index.parent(LIST, "1000").key == (FOLDER, "100")  # type: ignore[union-attr]
+        assert index.parent(LIST, "1002").key == (SPACE, "10")  # type: ignore[union-attr]
+        assert index.parent(TEAM, "1") is None
+        assert [node.id for node in index.ancestors(LIST, "1000")] == [
+            "100",
+            "10",
+            "1",
+        ]
+
+    @pytest.mark.hierarchy
+    def test_ttl_and_refresh_reload_branches(self) -> None:
+        index, calls, clock = make_index(ttl=60)
+
+        index.lists("10")
+        clock.now += 30
+        index.lists("10")
+        assert calls["space/10/folder"] == 1
+
+        clock.now += 30
+        index.lists("10")
+        assert calls["space/10/folder"] == 2
+
+        index.refresh(SPACE, "10")
+        index.lists("10")
+        assert calls["space/10/folder"] == 3
+
+        index.teams()
+        index.refresh()
+        index.teams()
+        assert calls["team"] == 2
@@ -0,0 +1,91 @@
+import pickle
+
+import pytest
+from pydantic import ValidationError
+
+from clickupython import client
+from clickupython import exceptions
+from clickupython import models
+from clickupython.interning import Interner
+
+from tests import fakes
+
+
+def raw_task(i: int) -> dict:
+    creator = fakes.user(1, "a")
+    return fakes.task(
+        i,
+        status={"status": "open", "orderindex": 0, "type": "open"},
+        creator=creator,
+        assignees=[creator, fakes.user(2, "a")],
+        space={"id": "s", "members": [creator]},
+        folder={"id": "f", "name": "Folder", "hidden": False},
+        custom_fields=[{"id": "c"}],
+    )
+
+
+class TestInterning:
+    @pytest.mark.interning
+    def test_shares_equal_nested_models(self) -> None:
+        tasks = Interner().intern_nested(
+            models.Tasks(tasks=[raw_task(i) for i in range(3)])
+        )
+
+        first, last = tasks[0], tasks[2]
+        assert first.creator is last.creator
+        assert first.creator is first.assignees[0]
+        assert first.creator is first.space.members[0]
+        assert first.assignees[1] is not first.creator
+        assert first.status is last.status
+        assert first.space is last.space
+        assert first.folder is last.folder
+        assert first.custom_fields[0] is not last.custom_fields[0]
+
+    @pytest.mark.interning
+    def test_interned_models_behave_like_the_originals(self) -> None:
+        task = Interner().intern_nested(models.Task(**raw_task(0)))
+        plain = models.Task(**raw_task(0))
+
+        assert isinstance(task.creator, models.User)
+        assert task.creator == plain.creator
+        assert plain.creator == task.creator
+        assert task == plain
+        assert task.model_dump_json() == plain.model_dump_json()
+        assert pickle.loads(pickle.dumps(task)) == plain
+        with pytest.raises(ValidationError):
+            task.creator.username = "b"
+
+    @pytest.mark.interning
+    def test_keeps_different_content_apart(self) -> None:
+        interner = Interner()
+        renamed = raw_task(1)
+        renamed["creator"] = {**renamed["creator"], "username": "renamed"}
+
+        old = interner.intern_nested(models.Task(**raw_task(0)))
+        new = interner.intern_nested(models.Task(**renamed))
+
+        assert old.creator is not new.creator
+        assert new.creator.username == "renamed"
+        assert old.assignees[1] is new.assignees[1]
+
+    @pytest.mark.interning
+    def test_client_interning_modes(self) -> None:
+        def handler(request):  # type: ignore[no-untyped-def]
+            return 200, {"tasks": [raw_task(0), raw_task(1)], "last_page": True}
+
+        session = fakes.make_client(handler, interning="session")
+        page = fakes.make_client(handler, interning="page")
+
+        first, second = session.get_tasks("list_id"), session.get_tasks("list_id")
+        assert first[0].creator is second[1].creator
+        assert len(session.interner) == 5
+
+        first, second = page.get_tasks("list_id"), page.get_tasks("list_id")
+        assert first[0].creator is first[1].creator
+        assert first[0].creator is not second[0].creator
+
+        streamed = list(page.iter_tasks("list_id", stream=True))
+        assert streamed[0].status is streamed[1].status
+
+        with pytest.raises(exceptions.ClickupClientError):
+            client.ClickUpClient("API_KEY", interning="always")
@@ -0,0 +1,264 @@
+from unittest import mock
+
+import pytest
+from pydantic import ValidationError
+
+from clickupython import exceptions
+from clickupython import models
+from clickupython.pagination import is_last_page
+
+from tests import fakes
+
+
+class TestLazyModels:
+    @pytest.mark.models
+    def test_builds_tasks_only_when_accessed(self) -> None:
+        with mock.patch.object(
+            models.Task, "__init__", autospec=True, side_effect=models.Task.__init__
+        ) as task_init:
+            tasks = models.LazyTasks(tasks=fakes.tasks(5), last_page=True)
+
+            assert len(tasks) == 5
+            assert tasks.values("id") == ["0", "1", "2", "3", "4"]
+            assert task_init.call_count == 0
+
+            assert tasks[3].name == "Task 3"
+            assert tasks[3] is tasks[3]
+            assert tasks[-1].id == "4"
+            assert task_init.call_count == 2
+
+            assert [task.id for task in tasks] == ["0", "1", "2", "3", "4"]
+            assert task_init.call_count == 5
+
+    @pytest.mark.models
+    def test_matches_eager_tasks(self) -> None:
+        eager = models.Tasks(tasks=fakes.tasks(3), last_page=False)
+        lazy = models.LazyTasks(tasks=fakes.tasks(3), last_page=False)
+
+        assert isinstance(lazy, models.Tasks)
+        assert lazy.items == eager.items
+        assert lazy.last_page is False
+        assert bool(models.LazyTasks(tasks=[]))
+
+    @pytest.mark.models
+    def test_slices_build_only_their_items(self) -> None:
+        tasks = models.LazyTasks(tasks=fakes.tasks(5))
+
+        assert [task.id for task in tasks[0:2]] == ["0", "1"]
+        assert [task.id for task in tasks[::-2]] == ["4", "2", "0"]
+        assert tasks[1:3] == models.Tasks(tasks=fakes.tasks(5))[1:3]
+        assert tasks[3:1] == []
+        assert tasks[0] is tasks[:1][0]
+
+    @pytest.mark.models
+    def test_last_page_check_does_not_build_tasks(self) -> None:
+        tasks = models.LazyTasks(tasks=fakes.tasks(100))
+
+        with mock.patch.object(models.LazyTasks, "create_item") as create_item:
+            assert not is_last_page(tasks)
+            create_item.assert_not_called()
+
+    @pytest.mark.models
+    def test_client_returns_lazy_lists(self) -> None:
+        def handler(request):  # type: ignore[no-untyped-def]
+            if "/comment" in request.url:
+                return 200, {"comments": [{"id": "c1", "comment_text": "Hi"}]}
+            return 200, {"tasks": fakes.tasks(2), "last_page": True}
+
+        c = fakes.make_client(handler, lazy_models=True)
+
+        tasks = c.get_tasks("list_id")
+        comments = c.get_task_comments("task_id")
+
+        assert isinstance(tasks, models.LazyTasks)
+        assert tasks.values("id") == ["0", "1"]
+        assert isinstance(comments, models.LazyComments)
+        assert comments[0].comment_text == "Hi"
+        assert [task.id for task in c.iter_tasks("list_id")] == ["0", "1"]
+
+
+TRUSTED_TASK = {
+    "id": "1",
+    "name": "Task",
+    "status": {"status": "open", "orderindex": 1, "type": "open"},
+    "creator": fakes.user(1, "a"),
+    "assignees": [fakes.user(2, "b")],
+    "tags": [{"name": "tag"}],
+    "folder": {"id": "f", "name": "Folder", "hidden": False},
+    "space": {"id": "s"},
+    "not_a_field": True,
+}
+
+
+class TestTrustedConstruction:
+    @pytest.mark.models
+    def test_matches_validated_models(self) -> None:
+        trusted = models.construct(models.Task, TRUSTED_TASK)
+        validated = models.Task(**TRUSTED_TASK)
+
+        assert trusted == validated
+        assert isinstance(trusted.status, models.Status)
+        assert isinstance(trusted.assignees[0], models.User)
+        assert isinstance(trusted.folder, models.Folder)
+        assert trusted.task_tags == [{"name": "tag"}]
+        assert trusted.model_fields_set == validated.model_fields_set
+        assert trusted.model_dump_json() == validated.model_dump_json()
+
+    @pytest.mark.models
+    def test_builds_lists_without_validating(self) -> None:
+        # A required field is missing, which validation would reject
+        data = {"tasks": [{**TRUSTED_TASK, "folder": {"id": "f"}}], "last_page": True}
+
+        tasks = models.construct(models.Tasks, data)
+        lazy = models.construct(models.LazyTasks, data)
+
+        assert type(tasks) is models.Tasks
+        assert tasks.last_page is True
+        assert tasks[0].folder.id == "f"
+        assert type(lazy) is models.LazyTasks
+        assert lazy[0] == tasks[0]
+        assert models.Members.item_model() is models.User
+
+    @pytest.mark.models
+    def test_construct_never_validates(self) -> None:
+        creator = {**TRUSTED_TASK["creator"], "id": "7"}
+
+        with mock.patch.object(
+            models.Task, "model_validate", side_effect=AssertionError
+        ), mock.patch.object(models.Tasks, "items_adapter", side_effect=AssertionError):
+            tasks = models.construct(
+                models.Tasks, {"tasks": [{**TRUSTED_TASK, "creator": creator}]}
+            )
+
+        # Values are kept as sent, not coerced
+        assert tasks[0].creator.id == "7"
+
+    @pytest.mark.models
+    def test_only_failing_models_are_constructed(self) -> None:
+        creator = {**TRUSTED_TASK["creator"], "id": "7"}
+        data = {
+            "tasks": [
+                {**TRUSTED_TASK, "creator": creator},
+                {**TRUSTED_TASK, "creator": creator, "folder": {"id": "f"}},
+            ]
+        }
+
+        tasks = models.validate_or_construct(models.Tasks, data)
+
+        # Validated, so the id is coerced, even next to a folder that fails
+        assert tasks[0].creator.id == 7
+        assert tasks[1].creator.id == 7
+        assert tasks[1].folder.hidden is None
+        assert "hidden" not in tasks[1].folder.model_fields_set
+        assert tasks[0] == models.Task(**data["tasks"][0])
+
+    @pytest.mark.models
+    def test_defaults_are_not_shared(self) -> None:
+        first = models.construct(models.TimeTrackingDataList, {})
+        first.items.append(models.TimeTrackingData())
+
+        assert models.construct(models.TimeTrackingDataList, {}).items == []
+
+    @pytest.mark.models
+    def test_client_samples_validation(self) -> None:
+        # Missing the required "hidden" field
+        c = fakes.make_client(
+            lambda request: (200, {"id": "f", "name": "Folder"}),
+            validate=False,
+            validation_sampling=3,
+        )
+
+        with pytest.raises(ValidationError):
+            c.get_folder("f")
+        assert c.get_folder("f").id == "f"
+        assert c.get_folder("f").name == "Folder"
+        with pytest.raises(ValidationError):
+            c.get_folder("f")
+
+    @pytest.mark.models
+    def test_lenient_client_returns_drifted_responses(self) -> None:
+        task = {**TRUSTED_TASK, "folder": {"id": "f"}}
+        c = fakes.make_client(
+            lambda request: (200, {"tasks": [task], "last_page": True}), strict=False
+        )
+
+        assert c.get_tasks("list_id")[0].folder.hidden is None
+        assert [t.folder.id for t in c.iter_tasks("list_id", stream=True)] == ["f"]
+
+    @pytest.mark.models
+    def test_client_streams_trusted_tasks(self) -> None:
+        task = {**TRUSTED_TASK, "folder": {"id": "f"}}
+        c = fakes.make_client(
+            lambda request: (200, {"tasks": [task], "last_page": True}), validate=False
+        )
+
+        assert [t.folder.id for t in c.iter_tasks("list_id", stream=True)] == ["f"]
+
+
+class TestBatchValidation:
+    @pytest.mark.models
+    def test_validates_the_array_in_one_call(self) -> None:
+        with mock.patch.object(
+            models.Tasks, "create_item", side_effect=AssertionError
+        ) as create_item:
+            tasks = models.Tasks(tasks=fakes.tasks(3), last_page=True)
+
+        create_item.assert_not_called()
+        assert tasks.items == [models.Task(**task) for task in fakes.tasks(3)]
+        assert models.Tasks.items_adapter() is models.Tasks.items_adapter()
+        assert models.Members.items_adapter() is not models.Tasks.items_adapter()
+
+    @pytest.mark.models
+    def test_reports_the_failing_item(self) -> None:
+        with pytest.raises(ValidationError, match=r"1\.hidden"):
+            models.Folders(folders=[{"id": "1", "name": "a", "hidden": False}, {}])
+
+
+class TestProjection:
+    @pytest.mark.models
+    def test_summary_drops_other_fields(self) -> None:
+        with mock.patch.object(models.CustomField, "__init__") as custom_field:
+            tasks = models.TaskSummaries(
+                tasks=[{**TRUSTED_TASK, "custom_fields": [{"id": "cf"}]}],
+                last_page=True,
+            )
+
+        custom_field.assert_not_called()
+        assert tasks.last_page is True
+        assert isinstance(tasks[0], models.TaskSummary)
+        assert tasks[0].status.status == "open"
+        assert tasks[0].assignees[0].id == 2
+        assert not hasattr(tasks[0], "folder")
+
+    @pytest.mark.models
+    def test_custom_projections(self) -> None:
+        summaries = models.task_summaries(["tags", "due_date"])
+
+        assert models.task_summaries(models.SUMMARY_FIELDS) is models.TaskSummaries
+        assert models.task_summaries(["due_date", "task_tags"]) is summaries
+        assert list(summaries.item_model().model_fields) == [
+            "id",
+            "task_tags",
+            "due_date",
+        ]
+        task = summaries(tasks=[TRUSTED_TASK])[0]
+        assert task.id == "1"
+        assert task.task_tags == [{"name": "tag"}]
+        with pytest.raises(exceptions.ClickupClientError, match="nope"):
+            models.task_summaries(["name", "nope"])
+
+    @pytest.mark.models
+    def test_client_returns_summaries(self) -> None:
+        c = fakes.make_client(
+            lambda request: (200, {"tasks": [TRUSTED_TASK], "last_page": True})
+        )
+
+        tasks = c.get_tasks("list_id", fields=models.SUMMARY_FIELDS)
+        streamed = list(c.iter_tasks("list_id", stream=True, fields=["name"]))
+
+        assert isinstance(tasks, models.TaskSummaries)
+        assert tasks[0].name == "Task"
+        assert [
+            task.name for task in c.iter_team_tasks("team_id", fields=["name"])
+        ] == ["Task"]
+        assert list(type(streamed[0]).model_fields) == ["id", "name"]
@@ -0,0 +1,83 @@
+import time
+from collections import Counter
+
+import pytest
+
+from clickupython import exceptions
+from clickupython.multitoken import MultiTokenClickUpClient
+from clickupython.ratelimit import SharedTokenBucket
+
+from tests import fakes
+
+
+class TestMultiTokenClient:
+    @pytest.mark.multitoken
+    def test_requests_spread_over_tokens(self) -> None:
+        c = MultiTokenClickUpClient(["A", "B", "C"], rate_limit_burst=4)
+        adapter = fakes.mount(c, lambda request: (200, {"id": "1"}))
+
+        for _ in range(12):
+            c.get_task("1")
+
+        used = Counter(request.headers["Authorization"] for request in adapter.requests)
+        assert used == {"A": 4, "B": 4, "C": 4}
+
+    @pytest.mark.multitoken
+    def test_routes_to_token_with_most_budget(self) -> None:
+        reset = str(time.time() + 60)
+
+        def handler(request):  # type: ignore[no-untyped-def]
+            remaining = "0" if request.headers["Authorization"] == "A" else "80"
+            return (
+                200,
+                {"id": "1"},
+                {"x-ratelimit-remaining": remaining, "x-ratelimit-reset": reset},
+            )
+
+        c = MultiTokenClickUpClient(["A", "B"], rate_limit_burst=10)
+        adapter = fakes.mount(c, handler)
+
+        for _ in range(6):
+            c.get_task("1")
+
+        tokens = [request.headers["Authorization"] for request in adapter.requests]
+        assert tokens[0] == "A"
+        assert set(tokens[1:]) == {"B"}
+        assert [state.remaining for state in c.rate_limit_states] == [0, 80]
+
+    @pytest.mark.multitoken
+    def test_prefetch_budget_pools_every_token(self) -> None:
+        reset = str(time.time() + 60)
+
+        def handler(request):  # type: ignore[no-untyped-def]
+            remaining = "30" if request.headers["Authorization"] == "A" else "40"
+            return (
+                200,
+                {"id": "1"},
+                {"x-ratelimit-remaining": remaining, "x-ratelimit-reset": reset},
+            )
+
+        c = MultiTokenClickUpClient(["A", "B"], rate_limit_burst=10)
+        fakes.mount(c, handler)
+
+        c.get_task("1")
+        c.get_task("1")
+
+        assert [state.remaining for state in c.rate_limit_states] == [30, 40]
+        assert c._prefetch_budget() == 69
+
+    @pytest.mark.multitoken
+    def test_shared_rate_limit_per_token(self, tmp_path, monkeypatch) -> None:
+        import tempfile
+
+        monkeypatch.setattr(tempfile, "tempdir", str(tmp_path))
+        c = MultiTokenClickUpClient(["A", "B"], shared_rate_limit=True)
+
+        limiters = list(c.rate_limiters.values())
+        assert all(isinstance(limiter, SharedTokenBucket) for limiter in limiters)
+        assert limiters[0].path != limiters[1].path
+
+    @pytest.mark.multitoken
+    def test_requires_tokens(self) -> None:
+        with pytest.raises(exceptions.ClickupClientError):
+            MultiTokenClickUpClient([])
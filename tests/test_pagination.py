@@ -0,0 +1,173 @@
+import asyncio
+import threading
+import time
+
+import pytest
+
+from clickupython import models
+from clickupython.pagination import aiter_pages, iter_pages
+from clickupython import client
+
+from tests import fakes
+
+
+def page_of(page: int, last: int) -> models.Tasks:
+    return models.Tasks(
+        tasks=[{"id": f"{page}-{i}"} for i in range(2)], last_page=page == last
+    )
+
+
+class TestPagination:
+    @pytest.mark.pagination
+    def test_prefetch_keeps_server_order(self) -> None:
+        def fetch_page(page: int) -> models.Tasks:
+            # Later pages finish first to make sure ordering is not completion order
+            time.sleep(0.02 / (page + 1))
+            return page_of(page, last=5)
+
+        pages = list(iter_pages(fetch_page, prefetch=4))
+
+        assert [tasks[0].id for tasks in pages] == [f"{i}-0" for i in range(6)]
+
+    @pytest.mark.pagination
+    def test_prefetch_window_is_bounded(self) -> None:
+        lock = threading.Lock()
+        in_flight = 0
+        peak = 0
+
+        def fetch_page(page: int) -> models.Tasks:
+            nonlocal in_flight, peak
+            with lock:
+                in_flight += 1
+                peak = max(peak, in_flight)
+            time.sleep(0.01)
+            with lock:
+                in_flight -= 1
+            return page_of(page, last=11)
+
+        assert len(list(iter_pages(fetch_page, prefetch=3))) == 12
+        # The page being consumed plus three upcoming ones
+        assert peak <= 4
+
+    @pytest.mark.pagination
+    def test_prefetch_of_one_requests_the_next_page_early(self) -> None:
+        requested: list[int] = []
+        release = threading.Event()
+
+        def fetch_page(page: int) -> models.Tasks:
+            requested.append(page)
+            if page > 0:
+                release.wait(1)
+            return page_of(page, last=3)
+
+        pages = iter_pages(fetch_page, prefetch=1)
+        next(pages)
+        deadline = time.monotonic() + 1
+        while 1 not in requested and time.monotonic() < deadline:
+            time.sleep(0.001)
+
+        # Page 1 is in flight while page 0 is consumed, and nothing past it
+        assert requested == [0, 1]
+        release.set()
+        assert len(list(pages)) == 3
+
+    @pytest.mark.pagination
+    def test_async_prefetch_of_one_requests_the_next_page_early(self) -> None:
+        requested: list[int] = []
+
+        async def fetch_page(page: int) -> models.Tasks:
+            requested.append(page)
+            return page_of(page, last=3)
+
+        async def run() -> None:
+            pages = aiter_pages(fetch_page, prefetch=1)
+            await pages.__anext__()
+            await asyncio.sleep(0)
+            assert requested == [0, 1]
+            await pages.aclose()
+
+        asyncio.run(run())
+
+    @pytest.mark.pagination
+    def test_prefetch_respects_rate_limit_budget(self) -> None:
+        requested: list[int] = []
+
+        def fetch_page(page: int) -> models.Tasks:
+            requested.append(page)
+            return page_of(page, last=3)
+
+        pages = iter_pages(fetch_page, prefetch=8, budget=lambda: 1)
+        next(pages)
+
+        assert requested == [0]
+
+    @pytest.mark.pagination
+    def test_stops_speculative_fetches_after_last_page(self) -> None:
+        requested: list[int] = []
+
+        def fetch_page(page: int) -> models.Tasks:
+            requested.append(page)
+            time.sleep(0.01)
+            return page_of(page, last=1)
+
+        pages = list(iter_pages(fetch_page, prefetch=2))
+        time.sleep(0.05)
+
+        assert len(pages) == 2
+        assert max(requested) <= 3
+
+    @pytest.mark.pagination
+    def test_async_prefetch_is_ordered_and_bounded(self) -> None:
+        requested: list[int] = []
+        in_flight = 0
+        peak = 0
+
+        async def fetch_page(page: int) -> models.Tasks:
+            nonlocal in_flight, peak
+            requested.append(page)
+            in_flight += 1
+            peak = max(peak, in_flight)
+            # Later pages finish first to make sure ordering is not completion order
+            await asyncio.sleep(0.02 / (page + 1))
+            in_flight -= 1
+            return page_of(page, last=7)
+
+        async def run() -> list[str]:
+            pages = [tasks[0].id async for tasks in aiter_pages(fetch_page, prefetch=3)]
+            await asyncio.sleep(0.05)
+            return pages
+
+        assert asyncio.run(run()) == [f"{i}-0" for i in range(8)]
+        assert peak == 4
+        assert max(requested) <= 10
+
+    @pytest.mark.pagination
+    def test_async_prefetch_respects_rate_limit_budget(self) -> None:
+        requested: list[int] = []
+
+        async def fetch_page(page: int) -> models.Tasks:
+            requested.append(page)
+            return page_of(page, last=3)
+
+        async def run() -> None:
+            pages = aiter_pages(fetch_page, prefetch=8, budget=lambda: 1)
+            await pages.__anext__()
+            await pages.aclose()
+
+        asyncio.run(run())
+
+        assert requested == [0]
+
+    @pytest.mark.pagination
+    def test_iter_team_tasks_with_prefetch(self) -> None:
+        c = client.ClickUpClient("API_KEY")
+
+        def handler(request):  # type: ignore[no-untyped-def]
+            page = int(request.url.split("page=")[1].split("&")[0])
+            return 200, {"tasks": [{"id": str(page)}], "last_page": page == 4}
+
+        fakes.mount(c, handler)
+
+        ids = [task.id for task in c.iter_team_tasks("team_id", prefetch=3)]
+
+        assert ids == ["0", "1", "2", "3", "4"]
@@ -0,0 +1,156 @@
+import multiprocessing
+import tempfile
+
+import pytest
+
+from clickupython import client
+from clickupython.ratelimit import SharedTokenBucket, TokenBucket
+
+from tests import fakes
+
+
+def make_bucket(clock: fakes.FakeClock, **kwargs) -> TokenBucket:
+    return TokenBucket(clock=clock, sleep=clock.sleep, **kwargs)
+
+
+class TestTokenBucket:
+    @pytest.mark.ratelimit
+    def test_burst_then_paced(self) -> None:
+        clock = fakes.FakeClock()
+        bucket = make_bucket(clock, capacity=60, window=60, burst=3)
+
+        delays = [bucket.acquire() for _ in range(6)]
+
+        assert delays[:3] == [0, 0, 0]
+        assert delays[3:] == pytest.approx([1.0, 1.0, 1.0])
+
+    @pytest.mark.ratelimit
+    def test_reserve_queues_concurrent_callers(self) -> None:
+        clock = fakes.FakeClock()
+        bucket = make_bucket(clock, capacity=60, window=60, burst=1)
+
+        delays = [bucket.reserve() for _ in range(4)]
+
+        assert delays == pytest.approx([0, 1.0, 2.0, 3.0])
+
+    @pytest.mark.ratelimit
+    def test_headers_spread_remaining_budget(self) -> None:
+        clock = fakes.FakeClock()
+        bucket = make_bucket(clock, burst=1)
+        bucket.acquire()
+
+        bucket.update(remaining=10, reset=clock.now + 20)
+
+        assert bucket.state().refill_rate == pytest.approx(0.5)
+        assert bucket.acquire() == pytest.approx(2.0)
+
+    @pytest.mark.ratelimit
+    def test_exhausted_budget_waits_for_reset(self) -> None:
+        clock = fakes.FakeClock()
+        bucket = make_bucket(clock, capacity=60, window=60, burst=5, buffer=2)
+
+        bucket.update(remaining=0, reset=clock.now + 30)
+        state = bucket.state()
+
+        assert state.tokens == 0
+        assert state.remaining == 0
+        assert bucket.acquire() == pytest.approx(30 + 2 + 1.0)
+
+    @pytest.mark.ratelimit
+    def test_base_rate_restored_after_reset(self) -> None:
+        clock = fakes.FakeClock()
+        bucket = make_bucket(clock, capacity=120, window=60, burst=5)
+        bucket.update(remaining=0, reset=clock.now + 10)
+
+        clock.now += 11
+
+        assert bucket.state().refill_rate == pytest.approx(2.0)
+
+
+class TestClientRateLimit:
+    @pytest.mark.ratelimit
+    def test_all_verbs_use_limiter_and_headers(self) -> None:
+        c = client.ClickUpClient("API_KEY")
+        reserved: list[None] = []
+        c.rate_limiter.reserve = lambda: reserved.append(None) or 0.0  # type: ignore[method-assign]
+        fakes.mount(
+            c,
+            lambda request: (
+                200,
+                {"id": "1", "name": "F", "hidden": False},
+                {
+                    "x-ratelimit-remaining": "42",
+                    "x-ratelimit-reset": "4102444800",
+                    "x-ratelimit-limit": "1000",
+                },
+            ),
+        )
+
+        c.get_folder("1")
+        c.create_folder("space", "F")
+        c.update_folder("1", "F")
+        c.delete_folder("1")
+
+        assert len(reserved) == 4
+        assert c.rate_limit_remaining == 42
+        state = c.rate_limit_state
+        assert state.remaining == 42
+        assert state.capacity == 1000
+        assert state.reset == 4102444800
+
+
+def drain_shared_bucket(directory: str, count: int) -> None:
+    bucket = SharedTokenBucket(
+        "API_KEY", directory=directory, capacity=60, window=60, burst=5
+    )
+    for _ in range(count):
+        bucket.reserve()
+
+
+class TestSharedTokenBucket:
+    @pytest.mark.ratelimit
+    def test_state_is_shared_between_instances(self, tmp_path) -> None:
+        clock = fakes.FakeClock()
+        first = SharedTokenBucket(
+            "API_KEY", directory=str(tmp_path), burst=5, clock=clock
+        )
+        second = SharedTokenBucket(
+            "API_KEY", directory=str(tmp_path), burst=5, clock=clock
+        )
+        other_token = SharedTokenBucket(
+            "OTHER_KEY", directory=str(tmp_path), burst=5, clock=clock
+        )
+
+        for _ in range(3):
+            first.reserve()
+        first.update(remaining=40, reset=clock.now + 30)
+
+        state = second.state()
+        assert state.tokens == pytest.approx(2)
+        assert state.remaining == 40
+        assert other_token.state().tokens == pytest.approx(5)
+
+    @pytest.mark.ratelimit
+    def test_state_is_shared_between_processes(self, tmp_path) -> None:
+        workers = [
+            multiprocessing.Process(target=drain_shared_bucket, args=(str(tmp_path), 4))
+            for _ in range(3)
+        ]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join()
+
+        bucket = SharedTokenBucket(
+            "API_KEY", directory=str(tmp_path), capacity=60, window=60, burst=5
+        )
+        # 12 tokens were taken from a bucket of 5, so the next caller has to queue
+        assert bucket.reserve() > 5
+
+    @pytest.mark.ratelimit
+    def test_client_shared_rate_limit(self, tmp_path, monkeypatch) -> None:
+        monkeypatch.setattr(tempfile, "tempdir", str(tmp_path))
+        c = client.ClickUpClient("API_KEY", shared_rate_limit=True)
+
+        assert isinstance(c.rate_limiter, SharedTokenBucket)
+        assert c.rate_limiter.path.startswith(str(tmp_path))
@@ -0,0 +1,152 @@
+import asyncio
+
+import httpx
+import pytest
+import requests
+
+from clickupython import client
+from clickupython import exceptions
+from clickupython.retry import RetryPolicy
+
+from tests import fakes
+
+
+def make_policy(slept: list[float], **kwargs) -> RetryPolicy:
+    return RetryPolicy(jitter=False, sleep=slept.append, clock=lambda: 1000.0, **kwargs)
+
+
+def scripted(*results):  # type: ignore[no-untyped-def]
+    """Returns a handler that answers with each result in turn, raising exceptions."""
+    remaining = list(results)
+
+    def handler(request: requests.PreparedRequest):  # type: ignore[no-untyped-def]
+        result = remaining.pop(0)
+        if isinstance(result, BaseException):
+            raise result
+        return result
+
+    return handler
+
+
+class TestRetryPolicy:
+    @pytest.mark.retry
+    def test_exponential_backoff_is_capped(self) -> None:
+        policy = RetryPolicy(backoff_base=1, backoff_max=5, jitter=False)
+
+        assert [policy.delay(attempt) for attempt in range(1, 6)] == [1, 2, 4, 5, 5]
+
+    @pytest.mark.retry
+    def test_jitter_stays_within_backoff(self) -> None:
+        policy = RetryPolicy(backoff_base=1, backoff_max=5)
+
+        assert all(0 <= policy.delay(3) <= 4 for _ in range(50))
+
+    @pytest.mark.retry
+    def test_rate_limited_delay_honours_reset(self) -> None:
+        policy = make_policy([])
+
+        assert policy.delay(1, 429, {"x-ratelimit-reset": "1012"}) == 12
+        assert policy.delay(1, 429, {"retry-after": "3"}) == 3
+
+    @pytest.mark.retry
+    def test_only_idempotent_methods_by_default(self) -> None:
+        policy = RetryPolicy()
+
+        assert policy.allows("GET") and policy.allows("PUT") and policy.allows("DELETE")
+        assert not policy.allows("POST")
+        assert policy.allows("POST", safe=True)
+        assert RetryPolicy(retry_unsafe_writes=True).allows("POST")
+
+
+class TestClientRetry:
+    @pytest.mark.retry
+    def test_get_retries_transient_errors(self) -> None:
+        slept: list[float] = []
+        c = client.ClickUpClient("API_KEY", retry_policy=make_policy(slept))
+        fakes.mount(
+            c,
+            scripted(
+                requests.exceptions.ConnectionError("connection reset"),
+                (503, {"err": "unavailable"}),
+                (200, {"id": "1"}),
+            ),
+        )
+
+        assert c.get_task("1").id == "1"
+        assert c.last_request_attempts == 3
+        assert c.retry_count == 2
+        assert slept == [0.5, 1.0]
+
+    @pytest.mark.retry
+    def test_attempts_are_bounded(self) -> None:
+        c = client.ClickUpClient(
+            "API_KEY", retry_policy=make_policy([], max_attempts=2)
+        )
+        adapter = fakes.mount(c, lambda request: (502, {"err": "bad gateway"}))
+
+        with pytest.raises(exceptions.ClickupClientError):
+            c.get_task("1")
+        assert len(adapter.requests) == 2
+        assert c.last_request_attempts == 2
+
+    @pytest.mark.retry
+    def test_rate_limited_get_waits_for_reset(self) -> None:
+        slept: list[float] = []
+        c = fakes.make_client(
+            scripted(
+                (429, {"err": "Rate limit"}, {"x-ratelimit-reset": "1030"}),
+                (200, {"id": "1"}),
+            ),
+            retry_policy=make_policy(slept),
+        )
+
+        assert c.get_task("1").id == "1"
+        assert slept == [30]
+
+    @pytest.mark.retry
+    def test_rate_limited_not_retried_unless_enabled(self) -> None:
+        c = client.ClickUpClient("API_KEY")
+        adapter = fakes.mount(c, lambda request: (429, {"err": "Rate limit"}))
+
+        with pytest.raises(exceptions.ClickupClientError):
+            c.get_task("1")
+        assert len(adapter.requests) == 1
+
+    @pytest.mark.retry
+    def test_unsafe_post_is_not_retried(self) -> None:
+        c = client.ClickUpClient("API_KEY", retry_policy=make_policy([]))
+        adapter = fakes.mount(c, lambda request: (500, {"err": "Server error"}))
+
+        with pytest.raises(exceptions.ClickupClientError):
+            c.create_task("list", "name")
+        assert len(adapter.requests) == 1
+
+    @pytest.mark.retry
+    def test_safe_post_is_retried(self) -> None:
+        c = client.ClickUpClient("API_KEY", retry_policy=make_policy([]))
+        fakes.mount(c, scripted((503, {"err": "unavailable"}), (200, {})))
+
+        assert c.tag_task("1", "tag")
+        assert c.last_request_attempts == 2
+
+
+class TestAsyncClientRetry:
+    @pytest.mark.retry
+    def test_async_retries_transport_errors(self) -> None:
+        calls = 0
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            nonlocal calls
+            calls += 1
+            if calls == 1:
+                raise httpx.ConnectError("connection reset")
+            return httpx.Response(200, json={"id": "1"})
+
+        async def run() -> int:
+            async with fakes.make_async_client(
+                handler, retry_policy=RetryPolicy(backoff_base=0, jitter=False)
+            ) as c:
+                await c.get_task("1")
+                return c.last_request_attempts
+
+        assert asyncio.run(run()) == 2
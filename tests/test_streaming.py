@@ -0,0 +1,85 @@
+import json
+import tracemalloc
+
+import pytest
+
+from clickupython import client
+from clickupython import exceptions
+from clickupython.streaming import ArrayStreamParser, TaskStream, iter_array
+
+from tests import fakes
+
+
+def chunked(body: bytes, size: int) -> list[bytes]:
+    return [body[i : i + size] for i in range(0, len(body), size)]
+
+
+def page_body(count: int, last_page: bool, first: int = 0) -> bytes:
+    tasks = [
+        {"id": str(first + i), "name": f"Tâsk {i}", "description": "x" * 200}
+        for i in range(count)
+    ]
+    return json.dumps({"tasks": tasks, "last_page": last_page}).encode()
+
+
+class TestArrayStreamParser:
+    @pytest.mark.streaming
+    def test_any_chunking_gives_same_result(self) -> None:
+        body = json.dumps(
+            {"count": 12345, "tasks": [{"id": "1", "n": [1, 2]}, {"id": "2"}], "x": 1.5}
+        ).encode()
+
+        for size in (1, 2, 3, 7, 11, len(body)):
+            parser = ArrayStreamParser("tasks")
+            items = list(iter_array(chunked(body, size), parser))
+
+            assert items == [{"id": "1", "n": [1, 2]}, {"id": "2"}]
+            assert parser.fields == {"count": 12345, "x": 1.5}
+
+    @pytest.mark.streaming
+    def test_items_yielded_before_body_ends(self) -> None:
+        parser = ArrayStreamParser("tasks")
+
+        assert parser.feed(b'{"tasks": [{"id": "1"}, {"id": "2"') == [{"id": "1"}]
+        assert parser.feed(b"}]}") == [{"id": "2"}]
+
+    @pytest.mark.streaming
+    def test_truncated_body(self) -> None:
+        with pytest.raises(exceptions.ClickupClientError):
+            list(iter_array([b'{"tasks": [{"id": "1"}'], ArrayStreamParser("tasks")))
+
+    @pytest.mark.streaming
+    def test_memory_bounded_by_chunk_and_task(self) -> None:
+        body = page_body(2000, last_page=True)
+        chunks = chunked(body, 16 * 1024)
+        tracemalloc.start()
+        count = sum(1 for _ in TaskStream(iter(chunks)))
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        assert count == 2000
+        assert peak < len(body) / 4
+
+
+class TestClientStreaming:
+    @pytest.mark.streaming
+    def test_iter_tasks_stream(self) -> None:
+        def handler(request):  # type: ignore[no-untyped-def]
+            page = int(request.url.split("page=")[1].split("&")[0])
+            return (200, page_body(100 if page == 0 else 3, page == 1, page * 100))
+
+        c = fakes.make_client(handler, "token")
+        adapter = fakes.adapter_of(c)
+
+        tasks = list(c.iter_tasks("1", stream=True))
+
+        assert len(tasks) == 103
+        assert tasks[-1].id == "102"
+        assert len(adapter.requests) == 2
+
+    @pytest.mark.streaming
+    def test_stream_rejects_prefetch(self) -> None:
+        c = client.ClickUpClient("token")
+
+        with pytest.raises(exceptions.ClickupClientError):
+            next(c.iter_team_tasks("1", stream=True, prefetch=2))
@@ -0,0 +1,118 @@
+from urllib.parse import parse_qs, urlparse
+
+import pytest
+
+from clickupython.sync import TaskMirror
+
+from tests import fakes
+
+
+class FakeList:
+    """Serves list tasks honouring date_updated_gt and paging, like the task endpoint."""
+
+    def __init__(self, count: int) -> None:
+        self.tasks = {
+            str(i): fakes.task(i, date_updated=str(1000 + i)) for i in range(count)
+        }
+        self.queries: list[dict[str, list[str]]] = []
+
+    def __call__(self, request):  # type: ignore[no-untyped-def]
+        query = parse_qs(urlparse(request.url).query)
+        self.queries.append(query)
+        since = int(query.get("date_updated_gt", ["0"])[0])
+        matching = [
+            task for task in self.tasks.values() if int(task["date_updated"]) > since
+        ]
+        page = int(query["page"][0])
+        items = matching[page * 100 : (page + 1) * 100]
+        return (200, {"tasks": items, "last_page": (page + 1) * 100 >= len(matching)})
+
+
+def make_mirror(tmp_path, fake: FakeList) -> tuple[TaskMirror, fakes.FakeClock]:  # type: ignore[no-untyped-def]
+    clock = fakes.FakeClock()
+    mirror = TaskMirror(
+        fakes.make_client(fake),
+        str(tmp_path / "mirror.sqlite3"),
+        reconcile_interval=3600,
+        clock=clock,
+    )
+    return mirror, clock
+
+
+class TestTaskMirror:
+    @pytest.mark.sync
+    def test_incremental_sync_fetches_only_updates(self, tmp_path) -> None:
+        fake = FakeList(250)
+        mirror, _ = make_mirror(tmp_path, fake)
+
+        first = mirror.sync_list("1")
+        assert first.upserted == 250
+        assert first.requests == 3
+        assert mirror.high_water(list_id="1") == 1249
+
+        fake.tasks["7"].update(name="Renamed", date_updated="2000")
+        second = mirror.sync_list("1")
+
+        # The renamed task plus the task at the old mark, which is re-read on purpose
+        assert second.requests == 1
+        assert second.upserted == 2
+        assert fake.queries[-1]["date_updated_gt"] == ["1248"]
+        assert fake.queries[-1]["include_closed"] == ["true"]
+        assert mirror.get_task("7", list_id="1").name == "Renamed"  # type: ignore[union-attr]
+        assert mirror.tasks(list_id="1")[0].id == "7"
+
+    @pytest.mark.sync
+    def test_reconciliation_removes_deleted_tasks(self, tmp_path) -> None:
+        fake = FakeList(5)
+        mirror, clock = make_mirror(tmp_path, fake)
+        mirror.sync_list("1")
+
+        del fake.tasks["2"]
+        assert mirror.sync_list("1").deleted == 0
+
+        clock.now += 3600
+        first = mirror.sync_list("1")
+
+        # Only ids are listed, in a stable order, and one miss is not enough
+        assert first.reconciled
+        assert first.deleted == 0
+        assert fake.queries[-1]["order_by"] == ["created"]
+        assert "date_updated_gt" not in fake.queries[-1]
+        assert mirror.get_task("2", list_id="1") is not None
+
+        clock.now += 3600
+        second = mirror.sync_list("1")
+
+        assert second.reconciled
+        assert second.deleted == 1
+        assert mirror.get_task("2", list_id="1") is None
+        assert len(mirror.tasks(list_id="1").items) == 4
+
+    @pytest.mark.sync
+    def test_reconciliation_keeps_tasks_missed_once(self, tmp_path) -> None:
+        fake = FakeList(5)
+        mirror, _ = make_mirror(tmp_path, fake)
+        mirror.sync_list("1")
+
+        hidden = fake.tasks.pop("3")
+        assert mirror.sync_list("1", reconcile=True).deleted == 0
+        fake.tasks["3"] = hidden
+        mirror.sync_list("1", reconcile=True)
+        del fake.tasks["3"]
+
+        assert mirror.sync_list("1", reconcile=True).deleted == 0
+        assert mirror.get_task("3", list_id="1") is not None
+
+    @pytest.mark.sync
+    def test_mirror_persists_across_instances(self, tmp_path) -> None:
+        fake = FakeList(3)
+        mirror, _ = make_mirror(tmp_path, fake)
+        mirror.sync_list("1")
+        mirror.close()
+
+        reopened, _ = make_mirror(tmp_path, fake)
+        result = reopened.sync_list("1", reconcile=False)
+
+        assert result.requests == 1
+        assert not result.reconciled
+        assert len(reopened.tasks(list_id="1").items) == 3
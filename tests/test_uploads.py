@@ -0,0 +1,217 @@
+import asyncio
+import email.parser
+import io
+import threading
+from unittest import mock
+
+import httpx
+import pytest
+
+from clickupython import models
+from clickupython.retry import RetryPolicy
+from clickupython.uploads import MultipartFile
+
+from tests import fakes
+
+ATTACHMENT = {
+    "id": "a1",
+    "version": "0",
+    "date": "1569988578766",
+    "title": "data.bin",
+    "extension": "bin",
+    "thumbnail_small": "https://attachments-public.clickup.com/a1/small.png",
+    "thumbnail_large": "https://attachments-public.clickup.com/a1/large.png",
+    "url": "https://attachments-public.clickup.com/a1/data.bin",
+}
+
+
+def parse_form(body: bytes, content_type: str) -> dict[str, bytes]:
+    message = email.parser.BytesParser().parsebytes(
+        f"Content-Type: {content_type}\r\n\r\n".encode() + body
+    )
+    return {
+        part.get_param("name", header="content-disposition"): part.get_payload(
+            decode=True
+        )
+        for part in message.get_payload()
+    }
+
+
+@pytest.fixture
+def data_file(tmp_path):  # type: ignore[no-untyped-def]
+    path = tmp_path / "data.bin"
+    path.write_bytes(bytes(range(256)) * 1000)
+    return str(path)
+
+
+class TestMultipartFile:
+    @pytest.mark.uploads
+    @pytest.mark.parametrize("mmap_threshold", [0, 1 << 30])
+    def test_streams_a_valid_form(self, data_file, mmap_threshold) -> None:
+        progress = []
+        body = MultipartFile(
+            data_file,
+            fields={"filename": "data.bin"},
+            chunk_size=10_000,
+            mmap_threshold=mmap_threshold,
+            progress=lambda sent, total: progress.append((sent, total)),
+        )
+
+        chunks = list(body)
+
+        assert max(len(chunk) for chunk in chunks) <= 10_000
+        assert sum(len(chunk) for chunk in chunks) == len(body)
+        form = parse_form(b"".join(chunks), body.content_type)
+        assert form["filename"] == b"data.bin"
+        assert form["attachment"] == bytes(range(256)) * 1000
+        assert progress[-1] == (256_000, 256_000)
+        assert [sent for sent, _ in progress] == sorted(sent for sent, _ in progress)
+
+    @pytest.mark.uploads
+    def test_opens_the_file_once_and_closes_it(self, data_file) -> None:
+        handles = []
+
+        def tracked_open(*args, **kwargs):  # type: ignore[no-untyped-def]
+            handles.append(io.open(*args, **kwargs))
+            return handles[-1]
+
+        with mock.patch("builtins.open", side_effect=tracked_open):
+            body = MultipartFile(data_file)
+            assert handles == []
+            read = body.read(100) + body.read()
+
+        assert len(handles) == 1
+        assert handles[0].closed
+        assert len(read) == len(body)
+
+
+class TestUploadAttachment:
+    @pytest.mark.uploads
+    def test_sends_a_streamed_body(self, data_file) -> None:
+        received = {}
+
+        def handler(request):  # type: ignore[no-untyped-def]
+            assert isinstance(request.body, MultipartFile)
+            received["length"] = int(request.headers["Content-Length"])
+            received["form"] = parse_form(
+                request.body.read(), request.headers["Content-Type"]
+            )
+            return 200, ATTACHMENT
+
+        c = fakes.make_client(handler)
+        progress = []
+
+        attachment = c.upload_attachment(
+            "task", data_file, progress=lambda sent, total: progress.append(sent)
+        )
+
+        assert isinstance(attachment, models.Attachment)
+        assert received["length"] == len(
+            MultipartFile(data_file, fields={"filename": "data.bin"})
+        )
+        assert received["form"]["attachment"] == bytes(range(256)) * 1000
+        assert progress[-1] == 256_000
+
+    @pytest.mark.uploads
+    def test_retries_with_the_whole_body(self, data_file) -> None:
+        forms = []
+
+        def handler(request):  # type: ignore[no-untyped-def]
+            forms.append(
+                parse_form(request.body.read(), request.headers["Content-Type"])
+            )
+            return (
+                (503, {"err": "unavailable"}) if len(forms) == 1 else (200, ATTACHMENT)
+            )
+
+        c = fakes.make_client(
+            handler,
+            retry_policy=RetryPolicy(backoff_base=0, retry_unsafe_writes=True),
+        )
+
+        assert c.upload_attachment("task", data_file).id == "a1"
+        assert c.last_request_attempts == 2
+        assert [form["attachment"] for form in forms] == [bytes(range(256)) * 1000] * 2
+
+    @pytest.mark.uploads
+    def test_uploads_many_files_concurrently(self, tmp_path) -> None:
+        uploaded = []
+        lock = threading.Lock()
+
+        def handler(request):  # type: ignore[no-untyped-def]
+            task_id = request.url.split("/task/")[1].split("/")[0]
+            if task_id == "missing":
+                return 404, {"err": "Task not found"}
+            form = parse_form(request.body.read(), request.headers["Content-Type"])
+            with lock:
+                uploaded.append((task_id, form["filename"]))
+            return 200, ATTACHMENT
+
+        c = fakes.make_client(handler)
+        paths = []
+        for i in range(4):
+            path = tmp_path / f"{i}.txt"
+            path.write_text("x" * (i + 1))
+            paths.append(str(path))
+        sizes = {}
+
+        results = c.upload_attachments(
+            [
+                ("t1", paths[0]),
+                ("t2", paths[1]),
+                ("missing", paths[2]),
+                ("t1", paths[3]),
+            ],
+            concurrency=3,
+            progress=lambda task_id, path, sent, total: sizes.update({path: total}),
+        )
+
+        assert [result.ok for result in results] == [True, True, False, True]
+        assert results[2].error.status_code == 404
+        assert sorted(uploaded) == [
+            ("t1", b"0.txt"),
+            ("t1", b"3.txt"),
+            ("t2", b"1.txt"),
+        ]
+        assert sizes[paths[3]] == 4
+
+    @pytest.mark.uploads
+    def test_async_upload(self, data_file) -> None:
+        received = {}
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            received["form"] = parse_form(
+                request.content, request.headers["Content-Type"]
+            )
+            received["length"] = request.headers["Content-Length"]
+            return httpx.Response(200, json=ATTACHMENT)
+
+        async def run():  # type: ignore[no-untyped-def]
+            async with fakes.make_async_client(handler) as c:
+                return await c.upload_attachments([("task", data_file)])
+
+        results = asyncio.run(run())
+
+        assert results[0].value.id == "a1"
+        assert received["form"]["attachment"] == bytes(range(256)) * 1000
+        assert int(received["length"]) == len(
+            MultipartFile(data_file, fields={"filename": "data.bin"})
+        )
+
+    @pytest.mark.uploads
+    def test_async_upload_retries_with_the_whole_body(self, data_file) -> None:
+        forms = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            forms.append(parse_form(request.content, request.headers["Content-Type"]))
+            return httpx.Response(503 if len(forms) == 1 else 200, json=ATTACHMENT)
+
+        async def run():  # type: ignore[no-untyped-def]
+            async with fakes.make_async_client(
+                handler,
+                retry_policy=RetryPolicy(backoff_base=0, retry_unsafe_writes=True),
+            ) as c:
+                return await c.upload_attachment("task", data_file)
+
+        assert asyncio.run(run()).id == "a1"
+        assert [form["attachment"] for form in forms] == [bytes(range(256)) * 1000] * 2
@@ -0,0 +1,182 @@
+import hashlib
+import hmac
+import json
+import time
+import urllib.error
+import urllib.request
+
+import pytest
+
+from clickupython.cache import ResponseCache
+from clickupython.sync import TaskMirror
+from clickupython.webhooks import (
+    WebhookProcessor,
+    WebhookReceiver,
+    verify_signature,
+)
+
+SECRET = "webhook-secret"
+
+
+def sign(body: bytes) -> str:
+    return hmac.new(SECRET.encode(), body, hashlib.sha256).hexdigest()
+
+
+def task_updated(task_id: str, name: str, date: str = "2000") -> bytes:
+    return json.dumps(
+        {
+            "event": "taskUpdated",
+            "task_id": task_id,
+            "webhook_id": "w1",
+            "history_items": [{"field": "name", "after": name, "date": date}],
+        }
+    ).encode()
+
+
+class FakeHierarchy:
+    def __init__(self) -> None:
+        self.refreshes = 0
+
+    def refresh(self) -> None:
+        self.refreshes += 1
+
+
+def make_mirror(tmp_path) -> TaskMirror:  # type: ignore[no-untyped-def]
+    mirror = TaskMirror(None, str(tmp_path / "mirror.sqlite3"))
+    with mirror.connection:
+        mirror.connection.execute(
+            "INSERT INTO tasks VALUES ('list:1', 'abc', 1000, ?)",
+            (json.dumps({"id": "abc", "name": "Before", "date_updated": "1000"}),),
+        )
+    return mirror
+
+
+class TestWebhookProcessor:
+    @pytest.mark.webhooks
+    def test_signature(self) -> None:
+        body = task_updated("abc", "x")
+
+        assert verify_signature(body, sign(body), SECRET)
+        assert not verify_signature(body, sign(b"other"), SECRET)
+        assert not verify_signature(body, None, SECRET)
+        assert WebhookProcessor().handle_payload(body, "bad", SECRET) == 401
+        assert WebhookProcessor().handle_payload(b"{", None, None) == 400
+
+    @pytest.mark.webhooks
+    def test_events_patch_mirror_and_invalidate_cache(self, tmp_path) -> None:
+        cache = ResponseCache()
+        cache.set("task/abc", b"{}")
+        cache.set("list/1", b"{}")
+        mirror = make_mirror(tmp_path)
+        hierarchy = FakeHierarchy()
+        processor = WebhookProcessor(cache=cache, mirror=mirror, hierarchy=hierarchy)
+
+        for body in (
+            task_updated("abc", "After"),
+            b'{"event": "listUpdated", "list_id": "1"}',
+        ):
+            assert processor.handle_payload(body, sign(body), SECRET) == 200
+        assert cache.get("task/abc") == b"{}"
+
+        assert processor.flush() == 2
+        assert cache.get("task/abc") is None
+        assert cache.get("list/1") is None
+        assert hierarchy.refreshes == 1
+        task = mirror.get_task("abc", list_id="1")
+        assert task.name == "After"  # type: ignore[union-attr]
+        assert task.date_updated == "2000"  # type: ignore[union-attr]
+
+        processor.handle_payload(
+            b'{"event": "taskDeleted", "task_id": "abc"}', None, None
+        )
+        processor.flush()
+        assert mirror.get_task("abc", list_id="1") is None
+
+    @pytest.mark.webhooks
+    def test_batch_size_triggers_flush(self) -> None:
+        seen = []
+        processor = WebhookProcessor(batch_size=2, on_event=seen.append)
+
+        processor.handle_payload(task_updated("a", "x"), None, None)
+        assert seen == []
+        processor.handle_payload(task_updated("b", "y"), None, None)
+        assert [event.task_id for event in seen] == ["a", "b"]
+
+    @pytest.mark.webhooks
+    def test_failing_event_does_not_drop_the_batch(self, tmp_path) -> None:
+        mirror = make_mirror(tmp_path)
+        patch_task = mirror.patch_task
+        calls = []
+
+        def flaky_patch(task_id, fields):  # type: ignore[no-untyped-def]
+            calls.append(task_id)
+            if len(calls) == 1:
+                raise RuntimeError("database is locked")
+            patch_task(task_id, fields)
+
+        mirror.patch_task = flaky_patch  # type: ignore[method-assign]
+        seen = []
+        processor = WebhookProcessor(mirror=mirror, on_event=seen.append)
+
+        processor.handle_payload(task_updated("abc", "First"), None, None)
+        processor.handle_payload(task_updated("abc", "Second", "3000"), None, None)
+        assert processor.flush() == 1
+        assert (processor.applied, processor.failed) == (1, 1)
+        assert mirror.get_task("abc", list_id="1").name == "Second"  # type: ignore[union-attr]
+
+        processor.handle_payload(task_updated("abc", "Third", "4000"), None, None)
+        assert processor.flush() == 1
+        assert mirror.get_task("abc", list_id="1").name == "Third"  # type: ignore[union-attr]
+        assert [event.task_id for event in seen] == ["abc", "abc"]
+
+
+class FlakyProcessor(WebhookProcessor):
+    """Raises from the first flush, like an unexpected error inside the processor."""
+
+    def __init__(self, **kwargs) -> None:  # type: ignore[no-untyped-def]
+        super().__init__(**kwargs)
+        self.flushes = 0
+
+    def flush(self) -> int:
+        self.flushes += 1
+        if self.flushes == 1:
+            raise RuntimeError("boom")
+        return super().flush()
+
+
+class TestWebhookReceiver:
+    @pytest.mark.webhooks
+    def test_receives_signed_deliveries(self) -> None:
+        seen = []
+        processor = WebhookProcessor(on_event=seen.append)
+
+        with WebhookReceiver(processor, secret=SECRET, batch_interval=60) as receiver:
+            body = task_updated("abc", "After")
+            request = urllib.request.Request(
+                receiver.url, data=body, headers={"X-Signature": sign(body)}
+            )
+            assert urllib.request.urlopen(request).status == 200
+
+            forged = urllib.request.Request(
+                receiver.url, data=body, headers={"X-Signature": sign(b"x")}
+            )
+            with pytest.raises(urllib.error.HTTPError) as error:
+                urllib.request.urlopen(forged)
+            assert error.value.code == 401
+
+        assert [event.task_id for event in seen] == ["abc"]
+
+    @pytest.mark.webhooks
+    def test_flush_thread_survives_errors(self) -> None:
+        seen = []
+        processor = FlakyProcessor(on_event=seen.append)
+
+        with WebhookReceiver(processor, batch_interval=0.01) as receiver:
+            body = task_updated("abc", "After")
+            urllib.request.urlopen(urllib.request.Request(receiver.url, data=body))
+            deadline = time.monotonic() + 5
+            while not seen and time.monotonic() < deadline:
+                time.sleep(0.01)
+
+            assert processor.flushes > 1
+            assert [event.task_id for event in seen] == ["abc"]